@@ -4,11 +4,12 @@ AI Bot opponent for single player mode.
 
 import math
 import random
-from typing import List, Optional, Tuple, TYPE_CHECKING
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Set, Tuple, TYPE_CHECKING
 
 from .constants import (
     UnitType, BuildingType, Team,
-    UNIT_COSTS, BUILDING_COSTS, MAP_WIDTH, MAP_HEIGHT,
+    UNIT_COST_AMOUNTS, BUILDING_COST_AMOUNTS, UNIT_TYPE_KEYS, BUILDING_TYPE_KEYS, MAP_WIDTH, MAP_HEIGHT,
     Difficulty, DIFFICULTY_SETTINGS
 )
 from .entities import Unit, Building, Resources
@@ -17,6 +18,72 @@ if TYPE_CHECKING:
     from .game import Game
 
 
+# Precomputed unit-circle directions for spawn/placement scatter around the castle
+_UNIT_CIRCLE_STEPS = 256
+_UNIT_CIRCLE = [
+    (math.cos(2 * math.pi * i / _UNIT_CIRCLE_STEPS), math.sin(2 * math.pi * i / _UNIT_CIRCLE_STEPS))
+    for i in range(_UNIT_CIRCLE_STEPS)
+]
+
+# Unit spawn points on an 80px ring around the castle, handed out round-robin
+_SPAWN_RADIUS = 80
+_SPAWN_OFFSETS = [
+    (_SPAWN_RADIUS * math.cos(2 * math.pi * i / 16), _SPAWN_RADIUS * math.sin(2 * math.pi * i / 16))
+    for i in range(16)
+]
+
+# random() is the cheapest draw in the random module (randrange/uniform wrap
+# it in extra Python calls), so decisions use it directly through a local binding
+_random = random.random
+
+
+def _random_direction() -> Tuple[float, float]:
+    """Pick a random (cos, sin) direction from the precomputed unit circle."""
+    return _UNIT_CIRCLE[int(_random() * _UNIT_CIRCLE_STEPS)]
+
+# Spatial hash of player units for AI range queries. Below the entity
+# threshold a brute-force scan is cheaper than building the grid.
+_GRID_CELL_SIZE = 250
+_GRID_MIN_ENTITIES = 32
+
+
+def _d2(ax: float, ay: float, bx: float, by: float) -> float:
+    """Squared distance between two points (compare against squared thresholds)."""
+    dx = ax - bx
+    dy = ay - by
+    return dx * dx + dy * dy
+
+
+def _nearest_indices(xs: List[float], ys: List[float],
+                     target_xs: List[float], target_ys: List[float]) -> List[int]:
+    """
+    Find the nearest target for each query point in one batched scan.
+
+    Args:
+        xs: Query X coordinates
+        ys: Query Y coordinates (parallel to xs)
+        target_xs: Target X coordinates (must not be empty)
+        target_ys: Target Y coordinates (parallel to target_xs)
+
+    Returns:
+        Index into the target lists of the nearest target for each query point
+    """
+    targets = list(zip(target_xs, target_ys))
+    result = []
+    for ux, uy in zip(xs, ys):
+        best_index = 0
+        best_d2 = float('inf')
+        for i, (tx, ty) in enumerate(targets):
+            dx = tx - ux
+            dy = ty - uy
+            d2 = dx * dx + dy * dy
+            if d2 < best_d2:
+                best_d2 = d2
+                best_index = i
+        result.append(best_index)
+    return result
+
+
 class AIBot:
     """AI opponent for single player mode."""
 
@@ -35,21 +102,32 @@ class AIBot:
         # Timing
         self.think_timer = 0
         self.think_interval = 2.0  # Base think interval in seconds
+        self._last_unit_count = 0  # len(game.units) when threats were last assessed
 
         # AI state
         self.state = 'building'  # building, attacking, defending
         self.aggression = self.settings['aggression']
         self.attack_target: Optional[Tuple[float, float]] = None
 
+        # Build/train limits only depend on difficulty, so derive them once
+        self.max_farms = 3 + int(self.aggression * 2)
+        self.max_houses = 2 + int(self.aggression * 2)
+        self.max_peasants = 6 + int(self.aggression * 4)
+        self.max_cannons = 1 + int(self.aggression * 3)
+        self.cannon_chance = self.aggression * 0.3
+        self.hard_plus = self.difficulty in (Difficulty.HARD, Difficulty.BRUTAL)
+
         # Resource bonus timer
         self.resource_bonus_timer = 0
 
         # Queues
         self.build_queue: List[BuildingType] = []
         self.unit_queue: List[UnitType] = []
+        self._spawn_index = 0  # Next entry of _SPAWN_OFFSETS to use
 
         # Defense line positions for military units (calculated once castle is known)
         self.defense_positions: List[Tuple[float, float]] = []
+        self._defense_origin: Optional[Tuple[float, float]] = None  # Castle pos they were built for
 
         # Flanking strategy (Hard+ only)
         self.flanking_active = False
@@ -82,6 +160,147 @@ class AIBot:
         self.overwhelming_attack_attempted = False
         self.overwhelming_attack_threshold = 0  # Military count when attack was triggered
 
+        # Roster cache - game entities partitioned by team, rebuilt when dirty
+        # (once per frame, or after the AI spawns something itself)
+        self._rosters_dirty = True
+        self._my_units: List[Unit] = []
+        self._my_buildings: List[Building] = []
+        self._enemy_units: List[Unit] = []
+        self._enemy_buildings: List[Building] = []
+        self._military_units: List[Unit] = []
+        self._my_peasants: List[Unit] = []
+        self._enemy_military_units: List[Unit] = []
+        self._unit_uids: Set[int] = set()  # UIDs of every unit currently in the game
+        self._buildings_by_priority: List[Building] = []  # Farms first, then the rest
+        self._my_building_counts: Counter = Counter()  # BuildingType -> count
+        self._enemy_non_castle_buildings: List[Building] = []
+        self._my_castle: Optional[Building] = None
+        self._enemy_castle: Optional[Building] = None
+        # Player unit coordinates, parallel to _enemy_units, for batched distance scans
+        self._enemy_xs: List[float] = []
+        self._enemy_ys: List[float] = []
+        # Grid cell -> indices into _enemy_units, built lazily on first range query
+        self._enemy_grid: Optional[Dict[Tuple[int, int], List[int]]] = None
+        # Target position -> enemy building found there, valid until the next refresh
+        self._building_at_cache: Dict[Tuple[float, float], Optional[Building]] = {}
+
+    def _refresh_rosters(self):
+        """Partition units and buildings by team and role in a single pass."""
+        my_units = []
+        military = []
+        peasants = []
+        enemy_units = []
+        enemy_military = []
+        unit_uids = set()
+        for unit in self.game.units:
+            unit_uids.add(unit.uid)
+            is_peasant = unit.unit_type == UnitType.PEASANT
+            if unit.team == Team.ENEMY:
+                my_units.append(unit)
+                if is_peasant:
+                    peasants.append(unit)
+                else:
+                    military.append(unit)
+            else:
+                enemy_units.append(unit)
+                if not is_peasant:
+                    enemy_military.append(unit)
+
+        my_buildings = []
+        farms = []
+        others = []
+        enemy_buildings = []
+        non_castles = []
+        my_castle = None
+        enemy_castle = None
+        for building in self.game.buildings:
+            building_type = building.building_type
+            if building.team == Team.ENEMY:
+                my_buildings.append(building)
+                if building_type == BuildingType.FARM:
+                    farms.append(building)
+                else:
+                    others.append(building)
+                    if building_type == BuildingType.CASTLE and my_castle is None:
+                        my_castle = building
+            else:
+                enemy_buildings.append(building)
+                if building_type != BuildingType.CASTLE:
+                    non_castles.append(building)
+                elif enemy_castle is None:
+                    enemy_castle = building
+
+        self._my_units = my_units
+        self._military_units = military
+        self._my_peasants = peasants
+        self._enemy_units = enemy_units
+        self._enemy_military_units = enemy_military
+        self._unit_uids = unit_uids
+        self._enemy_xs = [u.x for u in enemy_units]
+        self._enemy_ys = [u.y for u in enemy_units]
+        self._my_buildings = my_buildings
+        self._enemy_buildings = enemy_buildings
+        # Stable partition keeps the same order the old FARM-first sort produced
+        self._buildings_by_priority = farms + others
+        self._my_building_counts = Counter(b.building_type for b in my_buildings)
+        self._enemy_non_castle_buildings = non_castles
+        self._my_castle = my_castle
+        self._enemy_castle = enemy_castle
+        self._enemy_grid = None
+        self._building_at_cache = {}
+        self._rosters_dirty = False
+
+    def _ensure_rosters(self):
+        """Rebuild the roster cache if it has been invalidated."""
+        if self._rosters_dirty:
+            self._refresh_rosters()
+
+    def _enemy_indices_near(self, x: float, y: float, radius: float) -> Sequence[int]:
+        """
+        Get candidate player unit indices for a range query.
+
+        Candidates come from the grid cells overlapping the query circle, so
+        callers still need to check the exact distance.
+
+        Args:
+            x: Query center X
+            y: Query center Y
+            radius: Query radius
+
+        Returns:
+            Indices into enemy_units (and the coordinate snapshot), in roster order
+        """
+        self._ensure_rosters()
+        count = len(self._enemy_xs)
+        if count < _GRID_MIN_ENTITIES:
+            return range(count)
+
+        grid = self._enemy_grid
+        if grid is None:
+            grid = {}
+            for i, (ex, ey) in enumerate(zip(self._enemy_xs, self._enemy_ys)):
+                cell = (int(ex // _GRID_CELL_SIZE), int(ey // _GRID_CELL_SIZE))
+                bucket = grid.get(cell)
+                if bucket is None:
+                    grid[cell] = [i]
+                else:
+                    bucket.append(i)
+            self._enemy_grid = grid
+
+        candidates = []
+        min_cx = int((x - radius) // _GRID_CELL_SIZE)
+        max_cx = int((x + radius) // _GRID_CELL_SIZE)
+        min_cy = int((y - radius) // _GRID_CELL_SIZE)
+        max_cy = int((y + radius) // _GRID_CELL_SIZE)
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = grid.get((cx, cy))
+                if bucket:
+                    candidates.extend(bucket)
+        # Keep roster order so ties resolve exactly like a full scan
+        candidates.sort()
+        return candidates
+
     @property
     def resources(self) -> Resources:
         """Get AI resources."""
@@ -90,58 +309,93 @@ class AIBot:
     @property
     def my_units(self) -> List[Unit]:
         """Get all AI-controlled units."""
-        return [u for u in self.game.units if u.team == Team.ENEMY]
+        self._ensure_rosters()
+        return self._my_units
 
     @property
     def my_buildings(self) -> List[Building]:
         """Get all AI-controlled buildings."""
-        return [b for b in self.game.buildings if b.team == Team.ENEMY]
+        self._ensure_rosters()
+        return self._my_buildings
 
     @property
     def enemy_units(self) -> List[Unit]:
         """Get all player units."""
-        return [u for u in self.game.units if u.team == Team.PLAYER]
+        self._ensure_rosters()
+        return self._enemy_units
 
     @property
     def enemy_buildings(self) -> List[Building]:
         """Get all player buildings."""
-        return [b for b in self.game.buildings if b.team == Team.PLAYER]
+        self._ensure_rosters()
+        return self._enemy_buildings
 
     @property
     def my_castle(self) -> Optional[Building]:
         """Get AI's castle."""
-        return next(
-            (b for b in self.my_buildings if b.building_type == BuildingType.CASTLE),
-            None
-        )
+        self._ensure_rosters()
+        return self._my_castle
+
+    @property
+    def enemy_castle(self) -> Optional[Building]:
+        """Get the player's castle."""
+        self._ensure_rosters()
+        return self._enemy_castle
 
     @property
     def military_units(self) -> List[Unit]:
         """Get AI's military (non-peasant) units."""
-        return [u for u in self.my_units if u.unit_type != UnitType.PEASANT]
+        self._ensure_rosters()
+        return self._military_units
 
     @property
     def enemy_military_units(self) -> List[Unit]:
         """Get player's military (non-peasant) units."""
-        return [u for u in self.enemy_units if u.unit_type != UnitType.PEASANT]
+        self._ensure_rosters()
+        return self._enemy_military_units
+
+    @property
+    def military_count(self) -> int:
+        """Count AI's military units."""
+        return len(self.military_units)
+
+    @property
+    def enemy_military_count(self) -> int:
+        """Count player's military units."""
+        return len(self.enemy_military_units)
 
     @property
     def my_peasants(self) -> List[Unit]:
         """Get AI's peasant units."""
-        return [u for u in self.my_units if u.unit_type == UnitType.PEASANT]
+        self._ensure_rosters()
+        return self._my_peasants
 
     @property
     def idle_peasants(self) -> List[Unit]:
         """Get peasants not assigned to buildings."""
         return [u for u in self.my_peasants if not u.assigned_building]
 
+    def _worker_counts(self) -> Counter:
+        """
+        Count working peasants per AI building in one pass over the peasant roster.
+
+        Same rule as Building.count_workers, without a scan of every unit per building.
+
+        Returns:
+            Counter keyed by id() of the building
+        """
+        return Counter(
+            id(p.assigned_building) for p in self.my_peasants
+            if p.is_working and p.assigned_building is not None
+        )
+
     def _are_all_buildings_staffed(self) -> bool:
         """Check if all buildings have their maximum workers assigned."""
+        worker_counts = self._worker_counts()
         for building in self.my_buildings:
             max_workers = building.get_max_workers()
             if max_workers > 0:  # Only check buildings that can have workers
-                current_workers = building.count_workers(self.game.units)
-                if current_workers < max_workers:
+                if worker_counts[id(building)] < max_workers:
                     return False
         return True
 
@@ -188,7 +442,7 @@ class AIBot:
         # Calculate the main attack vector (from AI castle to target)
         dx = target[0] - castle.x
         dy = target[1] - castle.y
-        dist = math.sqrt(dx * dx + dy * dy)
+        dist = math.hypot(dx, dy)
 
         if dist < 1:
             return target, target
@@ -222,16 +476,16 @@ class AIBot:
     def _should_use_flanking(self) -> bool:
         """Determine if flanking strategy should be used."""
         # Only Hard and Brutal use flanking
-        if self.difficulty not in [Difficulty.HARD, Difficulty.BRUTAL]:
+        if not self.hard_plus:
             return False
 
         # Need at least 6 military units to flank effectively
-        military_count = len(self.military_units)
+        military_count = self.military_count
         if military_count < 6:
             return False
 
         # Late game check - need significant army advantage or large army
-        enemy_military = len(self.enemy_military_units)
+        enemy_military = self.enemy_military_count
 
         # Brutal always tries to flank with enough units
         if self.difficulty == Difficulty.BRUTAL and military_count >= 6:
@@ -300,6 +554,9 @@ class AIBot:
 
     def update(self, dt: float):
         """Update AI logic."""
+        # Units and buildings may have been added or removed since last frame
+        self._rosters_dirty = True
+
         self.think_timer += dt
 
         # Update state change cooldown
@@ -312,6 +569,10 @@ class AIBot:
         if self.think_timer >= effective_interval:
             self.think_timer = 0
             self.think()
+        elif self._has_wake_event():
+            # React to the event now; economy and production stay on the think schedule
+            self._assess_threats()
+        self._last_unit_count = len(self.game.units)
 
         # Apply resource bonus for harder difficulties
         self._apply_resource_bonus(dt)
@@ -322,6 +583,23 @@ class AIBot:
         # Always execute current orders
         self.execute_orders(dt)
 
+    def _has_wake_event(self) -> bool:
+        """Check for events that warrant a threat assessment before the next think."""
+        # A unit died (or was removed) since the last check
+        if len(self.game.units) < self._last_unit_count:
+            return True
+
+        # Player units have come within threat range of the castle while we are building
+        if self.state == 'building':
+            castle = self.my_castle
+            if castle:
+                cx, cy = castle.x, castle.y
+                exs, eys = self._enemy_xs, self._enemy_ys
+                for i in self._enemy_indices_near(cx, cy, 300):
+                    if _d2(exs[i], eys[i], cx, cy) < 300 * 300:
+                        return True
+        return False
+
     def _update_battle_status(self):
         """Update battle commitment and track casualties."""
         if self.state != 'attacking':
@@ -334,10 +612,10 @@ class AIBot:
         # Committed when units are engaged in combat near the target
         if not self.battle_committed and self.attack_target:
             engaged_near_target = 0
+            tx, ty = self.attack_target
             for unit in military:
                 # Check if unit is fighting near the attack target
-                dist_to_target = unit.distance_to(self.attack_target[0], self.attack_target[1])
-                if dist_to_target < 400 and unit.target_unit and unit.target_unit.is_alive():
+                if _d2(unit.x, unit.y, tx, ty) < 400 * 400 and unit.target_unit and unit.target_unit.is_alive():
                     engaged_near_target += 1
 
             # Commit to battle if at least 3 units are engaged near target
@@ -384,22 +662,25 @@ class AIBot:
         if not castle:
             return
 
-        # Check for nearby enemies threatening the base
-        nearby_enemies = [
-            u for u in self.enemy_units
-            if u.distance_to(castle.x, castle.y) < 300
-        ]
-
-        # Check if castle is under DIRECT attack (enemies very close or targeting castle)
-        self.castle_attackers = [
-            u for u in self.enemy_units
-            if (u.distance_to(castle.x, castle.y) < 150 or
-                (u.target_building and u.target_building == castle))
-        ]
-        self.castle_under_attack = len(self.castle_attackers) >= 1
+        # Single pass: count nearby enemies threatening the base (only need 2)
+        # and collect enemies under DIRECT attack range or targeting the castle
+        cx, cy = castle.x, castle.y
+        nearby_count = 0
+        castle_attackers = []
+        enemies = self.enemy_units
+        for u, ex, ey in zip(enemies, self._enemy_xs, self._enemy_ys):
+            dx = ex - cx
+            dy = ey - cy
+            d2 = dx * dx + dy * dy
+            if d2 < 300 * 300:
+                nearby_count += 1
+            if d2 < 150 * 150 or u.target_building is castle:
+                castle_attackers.append(u)
+        self.castle_attackers = castle_attackers
+        self.castle_under_attack = len(castle_attackers) >= 1
 
         # Determine if we should switch to defending
-        should_defend = len(nearby_enemies) >= 2 or self.castle_under_attack
+        should_defend = nearby_count >= 2 or self.castle_under_attack
 
         # If currently attacking, check if we should retreat
         if self.state == 'attacking' and should_defend:
@@ -476,7 +757,7 @@ class AIBot:
 
         dx = self.attack_target[0] - castle.x
         dy = self.attack_target[1] - castle.y
-        dist = math.sqrt(dx * dx + dy * dy)
+        dist = math.hypot(dx, dy)
 
         if dist < 1:
             return (castle.x, castle.y)
@@ -503,11 +784,12 @@ class AIBot:
 
         # Count units near rally point
         gather_radius = 150  # Units within this distance are considered gathered
+        gather_radius_sq = gather_radius * gather_radius
         gathered_count = 0
+        rx, ry = self.rally_point
 
         for unit in military:
-            dist = unit.distance_to(self.rally_point[0], self.rally_point[1])
-            if dist < gather_radius:
+            if _d2(unit.x, unit.y, rx, ry) < gather_radius_sq:
                 gathered_count += 1
 
         # Need at least 70% of army gathered, or have been waiting too long
@@ -522,55 +804,57 @@ class AIBot:
 
         if not idle:
             return
+        # Reversed so the next peasant in roster order comes off the end with pop()
+        idle.reverse()
 
         # Prioritize farms first (for food), then other buildings
-        buildings_by_priority = sorted(
-            self.my_buildings,
-            key=lambda b: 0 if b.building_type == BuildingType.FARM else 1
-        )
+        self._ensure_rosters()
+        worker_counts = self._worker_counts()
 
         # Find buildings that need workers
-        for building in buildings_by_priority:
+        for building in self._buildings_by_priority:
             if not idle:
                 break
 
             max_workers = building.get_max_workers()
-            current_workers = building.count_workers(self.game.units)
+            current_workers = worker_counts[id(building)]
 
             while current_workers < max_workers and idle:
                 # Assign an idle peasant
-                peasant = idle.pop(0)
+                peasant = idle.pop()
                 peasant.assign_to_building(building)
                 current_workers += 1
 
     def _economic_decisions(self):
         """Make economic decisions."""
         # Count buildings by type
-        farms = len([b for b in self.my_buildings if b.building_type == BuildingType.FARM])
-        houses = len([b for b in self.my_buildings if b.building_type == BuildingType.HOUSE])
+        self._ensure_rosters()
+        farms = self._my_building_counts[BuildingType.FARM]
+        houses = self._my_building_counts[BuildingType.HOUSE]
         peasants = len(self.my_peasants)
 
         # Calculate total worker slots needed
         total_slots = sum(b.get_max_workers() for b in self.my_buildings)
 
         # Max buildings based on difficulty
-        max_farms = 3 + int(self.aggression * 2)
-        max_houses = 2 + int(self.aggression * 2)
+        max_farms = self.max_farms
+        max_houses = self.max_houses
 
         # For Normal+ difficulties, only build new buildings if all current ones are fully staffed
         # Easy mode (aggression ~0.3) can build freely
         can_build_new = self.difficulty == Difficulty.EASY or self._are_all_buildings_staffed()
 
         # Build farms first if low on food (priority)
-        if self.resources.food < 150 and farms < max_farms and can_build_new:
+        resources = self.resources
+        if resources.food < 150 and farms < max_farms and can_build_new:
             self._try_build_building(BuildingType.FARM)
 
-        # Build houses for gold generation
-        if houses < max_houses and self.resources.gold >= 100 and can_build_new:
+        # Build houses for gold generation (re-read gold - a farm may have just been bought)
+        if houses < max_houses and resources.gold >= 100 and can_build_new:
             self._try_build_building(BuildingType.HOUSE)
 
         # Train peasants if we have building slots to fill
-        max_peasants = 6 + int(self.aggression * 4)
+        max_peasants = self.max_peasants
         if peasants < total_slots + 1 and peasants < max_peasants:
             self._try_train_unit(UnitType.PEASANT)
         # Always have at least some peasants
@@ -579,8 +863,28 @@ class AIBot:
 
     def _military_decisions(self):
         """Make military decisions."""
-        military_count = len(self.military_units)
-        enemy_military_count = len(self.enemy_military_units)
+        # Count unit types for both sides in one pass over each roster
+        military_count = knight_count = my_cavalry = cannons = 0
+        for u in self.my_units:
+            unit_type = u.unit_type
+            if unit_type == UnitType.PEASANT:
+                continue
+            military_count += 1
+            if unit_type == UnitType.KNIGHT:
+                knight_count += 1
+            elif unit_type == UnitType.CAVALRY:
+                my_cavalry += 1
+            elif unit_type == UnitType.CANNON:
+                cannons += 1
+
+        enemy_military_count = enemy_cavalry = 0
+        for u in self.enemy_units:
+            unit_type = u.unit_type
+            if unit_type != UnitType.PEASANT:
+                enemy_military_count += 1
+                if unit_type == UnitType.CAVALRY:
+                    enemy_cavalry += 1
+
         military_cap = self.settings['military_cap']
 
         # EMERGENCY: Castle under direct attack - spend all resources on military NOW
@@ -589,25 +893,22 @@ class AIBot:
             return  # Skip normal military logic, focus on emergency
 
         # Build military based on resources and current army size
+        resources = self.resources
         if military_count < military_cap:
             if self.difficulty == Difficulty.EASY:
                 # Easy mode: old random behavior - cavalry based on aggression chance
-                if self.resources.gold >= 200 and random.random() < self.aggression:
+                if resources.gold >= 200 and _random() < self.aggression:
                     self._try_train_unit(UnitType.CAVALRY)
-                elif self.resources.gold >= 150:
+                elif resources.gold >= 150:
                     self._try_train_unit(UnitType.KNIGHT)
             else:
                 # Normal+: Prefer cavalry, only train knights under specific conditions
-                knight_count = len([u for u in self.military_units if u.unit_type == UnitType.KNIGHT])
-                house_count = len([b for b in self.my_buildings if b.building_type == BuildingType.HOUSE])
-
-                # Count cavalry for both sides
-                my_cavalry = len([u for u in self.military_units if u.unit_type == UnitType.CAVALRY])
-                enemy_cavalry = len([u for u in self.enemy_military_units if u.unit_type == UnitType.CAVALRY])
+                self._ensure_rosters()
+                house_count = self._my_building_counts[BuildingType.HOUSE]
 
                 # Hard+: If player has 1.2x cavalry advantage, prioritize cavalry until equal
                 cavalry_emergency = False
-                if self.difficulty in [Difficulty.HARD, Difficulty.BRUTAL]:
+                if self.hard_plus:
                     if enemy_cavalry > 0 and enemy_cavalry >= my_cavalry * 1.2:
                         cavalry_emergency = True
 
@@ -616,22 +917,20 @@ class AIBot:
                 should_train_knights = under_attack or knight_count < 5 or house_count < 2
 
                 # Cavalry emergency: keep buying cavalry until we match the player
-                if cavalry_emergency and self.resources.gold >= 200:
+                if cavalry_emergency and resources.gold >= 200:
                     self._try_train_unit(UnitType.CAVALRY)
                 # Prefer cavalry in most situations (faster, more versatile)
-                elif self.resources.gold >= 200:
+                elif resources.gold >= 200:
                     self._try_train_unit(UnitType.CAVALRY)
-                elif self.resources.gold >= 150 and should_train_knights:
+                elif resources.gold >= 150 and should_train_knights:
                     self._try_train_unit(UnitType.KNIGHT)
 
         # Add cannons occasionally (more on harder difficulties)
-        cannons = len([u for u in self.my_units if u.unit_type == UnitType.CANNON])
-        max_cannons = 1 + int(self.aggression * 3)
-        if military_count >= 4 and cannons < max_cannons and random.random() < self.aggression * 0.3:
+        if military_count >= 4 and cannons < self.max_cannons and _random() < self.cannon_chance:
             self._try_train_unit(UnitType.CANNON)
 
         # Hard+: If we have overwhelming force (2x enemy military), attack the castle directly
-        if self.difficulty in [Difficulty.HARD, Difficulty.BRUTAL]:
+        if self.hard_plus:
             # Reset the overwhelming attack flag if we've rebuilt a significantly larger army
             # (at least 50% more than when we last attempted)
             if self.overwhelming_attack_attempted:
@@ -645,12 +944,7 @@ class AIBot:
                 # Only trigger if not already attacking
                 if self.state != 'attacking' and self.state_change_cooldown <= 0:
                     # Find and target the enemy castle directly
-                    enemy_castle = None
-                    for building in self.enemy_buildings:
-                        if building.building_type == BuildingType.CASTLE:
-                            enemy_castle = building
-                            break
-
+                    enemy_castle = self.enemy_castle
                     if enemy_castle:
                         self.attack_target = (enemy_castle.x, enemy_castle.y)
                         self._change_state('attacking')
@@ -665,20 +959,21 @@ class AIBot:
         # Prioritize fast units (cavalry) to intercept attackers quickly
         units_spawned = 0
         max_emergency_spawns = 5  # Limit per think cycle to avoid lag
+        resources = self.resources
 
         while units_spawned < max_emergency_spawns:
             spawned = False
 
             # Try cavalry first (fastest to intercept)
-            if self.resources.gold >= 200 and self.resources.food >= 75:
+            if resources.gold >= 200 and resources.food >= 75:
                 self._try_train_unit(UnitType.CAVALRY)
                 spawned = True
             # Then knights
-            elif self.resources.gold >= 150 and self.resources.food >= 50:
+            elif resources.gold >= 150 and resources.food >= 50:
                 self._try_train_unit(UnitType.KNIGHT)
                 spawned = True
             # Even peasants can help in emergencies
-            elif self.resources.gold >= 50 and self.resources.food >= 25:
+            elif resources.gold >= 50 and resources.food >= 25:
                 self._try_train_unit(UnitType.PEASANT)
                 spawned = True
 
@@ -692,19 +987,15 @@ class AIBot:
         # Prioritize buildings
         if self.enemy_buildings:
             # More aggressive AIs go for castle earlier
-            if self.aggression > 0.7 and random.random() < 0.3:
-                castles = [b for b in self.enemy_buildings if b.building_type == BuildingType.CASTLE]
-                if castles:
-                    target = castles[0]
+            if self.aggression > 0.7 and _random() < 0.3:
+                target = self.enemy_castle
+                if target:
                     self.attack_target = (target.x, target.y)
                     self._setup_attack()
                     return
 
             # Prefer non-castle buildings first
-            non_castles = [
-                b for b in self.enemy_buildings
-                if b.building_type != BuildingType.CASTLE
-            ]
+            non_castles = self._enemy_non_castle_buildings
             target = random.choice(non_castles if non_castles else self.enemy_buildings)
             self.attack_target = (target.x, target.y)
         elif self.enemy_units:
@@ -732,10 +1023,10 @@ class AIBot:
 
     def _try_build_building(self, building_type: BuildingType):
         """Attempt to build a building."""
-        cost_key = building_type.name.lower()
-        cost = BUILDING_COSTS.get(cost_key, {'gold': 100, 'wood': 50})
+        cost_key = BUILDING_TYPE_KEYS[building_type]
+        cost = BUILDING_COST_AMOUNTS.get(cost_key, (100, 0, 50))
 
-        if not self.resources.can_afford(cost):
+        if not self.resources.can_afford_amounts(*cost):
             return
 
         castle = self.my_castle
@@ -743,43 +1034,46 @@ class AIBot:
             return
 
         # Find a spot near castle
-        angle = random.uniform(0, 2 * math.pi)
-        dist = random.uniform(150, 300)
-        x = castle.x + math.cos(angle) * dist
-        y = castle.y + math.sin(angle) * dist
+        cos_a, sin_a = _random_direction()
+        dist = 150 + 150 * _random()
+        x = castle.x + cos_a * dist
+        y = castle.y + sin_a * dist
 
         # Clamp to map bounds
         x = max(100, min(MAP_WIDTH - 100, x))
         y = max(100, min(MAP_HEIGHT - 100, y))
 
         # Spend resources and create building
-        self.resources.spend(cost)
+        self.resources.spend_amounts(*cost)
         building = Building(x, y, building_type, Team.ENEMY)
         building.uid = self.game.next_uid()
         self.game.buildings.append(building)
+        self._rosters_dirty = True
 
     def _try_train_unit(self, unit_type: UnitType):
         """Attempt to train a unit."""
-        cost_key = unit_type.name.lower()
-        cost = UNIT_COSTS.get(cost_key, {'gold': 50, 'food': 25})
+        cost_key = UNIT_TYPE_KEYS[unit_type]
+        cost = UNIT_COST_AMOUNTS.get(cost_key, (50, 25, 0))
 
-        if not self.resources.can_afford(cost):
+        if not self.resources.can_afford_amounts(*cost):
             return
 
         castle = self.my_castle
         if not castle:
             return
 
-        # Spawn near castle
-        angle = random.uniform(0, 2 * math.pi)
-        x = castle.x + math.cos(angle) * 80
-        y = castle.y + math.sin(angle) * 80
+        # Spawn near castle, cycling around the ring so bursts don't stack up
+        offset_x, offset_y = _SPAWN_OFFSETS[self._spawn_index % len(_SPAWN_OFFSETS)]
+        self._spawn_index += 1
+        x = castle.x + offset_x
+        y = castle.y + offset_y
 
         # Spend resources and create unit
-        self.resources.spend(cost)
+        self.resources.spend_amounts(*cost)
         unit = Unit(x, y, unit_type, Team.ENEMY)
         unit.uid = self.game.next_uid()
         self.game.units.append(unit)
+        self._rosters_dirty = True
 
     def _healing_decisions(self):
         """Decide whether to enable or disable healing (Normal+ only)."""
@@ -830,8 +1124,8 @@ class AIBot:
 
     def _execute_attack_orders(self):
         """Execute attack orders for military units."""
-        military_count = len(self.military_units)
-        enemy_military_count = len(self.enemy_military_units)
+        military_count = self.military_count
+        enemy_military_count = self.enemy_military_count
 
         # Safety check: If we have less than half the enemy's military,
         # abort the attack and retreat (unless our base is under attack)
@@ -852,34 +1146,37 @@ class AIBot:
             return
 
         # Phase 3: Standard coordinated attack
-        for unit in self.military_units:
-            self._execute_unit_attack(unit, self.attack_target)
+        military = self.military_units
+        for unit, nearest_enemy in zip(military, self._nearest_enemies(military)):
+            self._execute_unit_attack(unit, self.attack_target, nearest_enemy)
 
     def _execute_gather_phase(self):
         """Execute the gathering phase - move units to rally point before attacking."""
         military = self.military_units
+        rx, ry = self.rally_point
 
         # Move all units to rally point
-        for unit in military:
+        for unit, nearest_enemy in zip(military, self._nearest_enemies(military)):
+            ux, uy = unit.x, unit.y
+
             # Skip if already engaged with nearby enemy (allow defensive fighting)
-            if unit.target_unit and unit.target_unit.is_alive():
-                dist_to_enemy = unit.distance_to_unit(unit.target_unit)
-                if dist_to_enemy < unit.attack_range + 100:
+            target = unit.target_unit
+            if target and target.is_alive():
+                engage_range = unit.attack_range + 100
+                if _d2(ux, uy, target.x, target.y) < engage_range * engage_range:
                     continue  # Let them finish the fight
 
             # Check for nearby enemies that are attacking us
-            nearest_enemy = self._find_nearest_enemy(unit)
             if nearest_enemy:
-                dist = unit.distance_to_unit(nearest_enemy)
-                if dist < unit.attack_range + 50:
+                fight_range = unit.attack_range + 50
+                if _d2(ux, uy, nearest_enemy.x, nearest_enemy.y) < fight_range * fight_range:
                     # Enemy in range, fight back
                     unit.set_attack_target(nearest_enemy)
                     continue
 
             # Move to rally point if not there yet
-            dist_to_rally = unit.distance_to(self.rally_point[0], self.rally_point[1])
-            if dist_to_rally > 80:
-                unit.set_move_target(self.rally_point[0], self.rally_point[1])
+            if _d2(ux, uy, rx, ry) > 80 * 80:
+                unit.set_move_target(rx, ry)
             else:
                 # At rally point, clear targets and wait
                 if unit.target_x is not None and not unit.target_unit:
@@ -892,33 +1189,45 @@ class AIBot:
             if self._should_use_flanking():
                 self._setup_flanking_attack()
 
-    def _execute_unit_attack(self, unit: Unit, target_pos: Optional[Tuple[float, float]]):
-        """Execute attack logic for a single unit."""
-        # Dynamic retargeting: check if there's a closer threat even if we have a target
-        nearest_enemy = self._find_nearest_enemy(unit)
+    def _execute_unit_attack(self, unit: Unit, target_pos: Optional[Tuple[float, float]],
+                             nearest_enemy: Optional[Unit]):
+        """
+        Execute attack logic for a single unit.
+
+        Args:
+            unit: The unit to give orders to
+            target_pos: Position to advance on when no closer threat exists
+            nearest_enemy: Nearest enemy unit, from a batched _nearest_enemies scan
+        """
+        # Read the current target once - every branch below needs its liveness
+        target_unit = unit.target_unit
+        has_live_target = target_unit is not None and target_unit.is_alive()
 
+        # Dynamic retargeting: check if there's a closer threat even if we have a target
         # If an enemy is very close (within attack range + buffer), prioritize them
         # This allows units to respond to being attacked instead of ignoring threats
         if nearest_enemy:
-            dist_to_nearest = unit.distance_to_unit(nearest_enemy)
+            ux, uy = unit.x, unit.y
+            d2_nearest = _d2(ux, uy, nearest_enemy.x, nearest_enemy.y)
 
             # Check if we should switch targets
             should_retarget = False
+            engage_range = unit.attack_range + 50
 
-            if dist_to_nearest < unit.attack_range + 50:
+            if d2_nearest < engage_range * engage_range:
                 # Enemy is in attack range - definitely engage
                 should_retarget = True
-            elif unit.target_building and dist_to_nearest < 150:
+            elif unit.target_building and d2_nearest < 150 * 150:
                 # Attacking building but enemy unit is close - switch to unit
                 should_retarget = True
-            elif unit.target_unit and unit.target_unit.is_alive():
+            elif has_live_target:
                 # Already targeting a unit - switch if new one is much closer
-                current_dist = unit.distance_to_unit(unit.target_unit)
-                if dist_to_nearest < current_dist * 0.6:  # New target is 40% closer
+                current_d2 = _d2(ux, uy, target_unit.x, target_unit.y)
+                if d2_nearest < current_d2 * (0.6 * 0.6):  # New target is 40% closer
                     should_retarget = True
-            elif not unit.target_unit or not unit.target_unit.is_alive():
+            else:
                 # No valid unit target - engage if enemy is reasonably close
-                if dist_to_nearest < 200:
+                if d2_nearest < 200 * 200:
                     should_retarget = True
 
             if should_retarget:
@@ -926,9 +1235,10 @@ class AIBot:
                 return
 
         # Skip if already has a valid target
-        if unit.target_unit and unit.target_unit.is_alive():
+        if has_live_target:
             return
-        if unit.target_building and not unit.target_building.is_destroyed():
+        target_building = unit.target_building
+        if target_building and not target_building.is_destroyed():
             return
 
         # No immediate threats - proceed to attack target location
@@ -942,10 +1252,13 @@ class AIBot:
 
     def _execute_flanking_attack(self):
         """Execute a coordinated flanking attack with multiple groups."""
-        # Clean up dead units from groups
-        self.flank_units_left = [u for u in self.flank_units_left if u.is_alive() and u in self.game.units]
-        self.flank_units_right = [u for u in self.flank_units_right if u.is_alive() and u in self.game.units]
-        self.main_force_units = [u for u in self.main_force_units if u.is_alive() and u in self.game.units]
+        # Clean up dead units from groups (set lookup by UID - Unit objects
+        # are not hashable, and list membership compares every field)
+        self._ensure_rosters()
+        live_uids = self._unit_uids
+        self.flank_units_left = [u for u in self.flank_units_left if u.is_alive() and u.uid in live_uids]
+        self.flank_units_right = [u for u in self.flank_units_right if u.is_alive() and u.uid in live_uids]
+        self.main_force_units = [u for u in self.main_force_units if u.is_alive() and u.uid in live_uids]
 
         # Check if flanking is still viable
         total_flankers = len(self.flank_units_left) + len(self.flank_units_right)
@@ -954,47 +1267,68 @@ class AIBot:
             self.flanking_active = False
             return
 
+        # Nearest enemy for every military unit, in one batched scan
+        military = self.military_units
+        nearest_by_uid = {
+            unit.uid: enemy for unit, enemy in zip(military, self._nearest_enemies(military))
+        }
+
         # Execute left flank
+        left_x, left_y = self.flank_target_left
         for unit in self.flank_units_left:
+            nearest_enemy = nearest_by_uid.get(unit.uid)
             # Move to flank position first, then attack
-            dist_to_flank = unit.distance_to(self.flank_target_left[0], self.flank_target_left[1])
-            if dist_to_flank > 100:
+            if _d2(unit.x, unit.y, left_x, left_y) > 100 * 100:
                 # Still approaching flank position
-                self._execute_unit_attack(unit, self.flank_target_left)
+                self._execute_unit_attack(unit, self.flank_target_left, nearest_enemy)
             else:
                 # At flank position, attack main target
-                self._execute_unit_attack(unit, self.attack_target)
+                self._execute_unit_attack(unit, self.attack_target, nearest_enemy)
 
         # Execute right flank
+        right_x, right_y = self.flank_target_right
         for unit in self.flank_units_right:
-            dist_to_flank = unit.distance_to(self.flank_target_right[0], self.flank_target_right[1])
-            if dist_to_flank > 100:
+            nearest_enemy = nearest_by_uid.get(unit.uid)
+            if _d2(unit.x, unit.y, right_x, right_y) > 100 * 100:
                 # Still approaching flank position
-                self._execute_unit_attack(unit, self.flank_target_right)
+                self._execute_unit_attack(unit, self.flank_target_right, nearest_enemy)
             else:
                 # At flank position, attack main target
-                self._execute_unit_attack(unit, self.attack_target)
+                self._execute_unit_attack(unit, self.attack_target, nearest_enemy)
 
         # Main force attacks directly
         for unit in self.main_force_units:
-            self._execute_unit_attack(unit, self.attack_target)
+            self._execute_unit_attack(unit, self.attack_target, nearest_by_uid.get(unit.uid))
 
         # Also handle any units not assigned to a group (newly trained)
         # Use UIDs for comparison since Unit objects are not hashable
         assigned_uids = set(
             u.uid for u in self.flank_units_left + self.flank_units_right + self.main_force_units
         )
-        for unit in self.military_units:
+        for unit in military:
             if unit.uid not in assigned_uids:
                 # Assign new units to main force
                 self.main_force_units.append(unit)
-                self._execute_unit_attack(unit, self.attack_target)
+                self._execute_unit_attack(unit, self.attack_target, nearest_by_uid.get(unit.uid))
 
     def _find_building_at(self, pos: Tuple[float, float]) -> Optional[Building]:
         """Find an enemy building near the given position."""
+        # Every attacking unit asks about the same few target positions each frame
+        self._ensure_rosters()
+        cache = self._building_at_cache
+        if pos in cache:
+            return cache[pos]
+        building = self._scan_building_at(pos)
+        cache[pos] = building
+        return building
+
+    def _scan_building_at(self, pos: Tuple[float, float]) -> Optional[Building]:
+        """Scan enemy buildings for one near the given position."""
+        px, py = pos
         for building in self.enemy_buildings:
-            dist = math.sqrt((building.x - pos[0])**2 + (building.y - pos[1])**2)
-            if dist < 100:
+            dx = building.x - px
+            dy = building.y - py
+            if dx * dx + dy * dy < 100 * 100:
                 return building
         return None
 
@@ -1004,6 +1338,19 @@ class AIBot:
         if not castle:
             return
 
+        # Nearest enemy within 400 of the castle - the same for every defender,
+        # so find it once with a single filter-and-argmin pass
+        nearest_to_castle = None
+        nearest_d2 = 400 * 400
+        cx, cy = castle.x, castle.y
+        enemies = self.enemy_units
+        exs, eys = self._enemy_xs, self._enemy_ys
+        for i in self._enemy_indices_near(cx, cy, 400):
+            d2 = _d2(exs[i], eys[i], cx, cy)
+            if d2 < nearest_d2:
+                nearest_d2 = d2
+                nearest_to_castle = enemies[i]
+
         # Get all units that can fight (military + idle peasants in emergency)
         defenders = list(self.military_units)
 
@@ -1012,35 +1359,29 @@ class AIBot:
             idle_peasants = [p for p in self.my_peasants if not p.assigned_building]
             defenders.extend(idle_peasants)
 
-        for unit in defenders:
-            # PRIORITY 1: If castle is under direct attack, target castle attackers first
-            if self.castle_under_attack and self.castle_attackers:
-                # Find the closest attacker that's threatening the castle
-                alive_attackers = [a for a in self.castle_attackers if a.is_alive()]
-                if alive_attackers:
-                    # Prioritize enemies actually attacking the castle building
-                    castle_targeters = [a for a in alive_attackers
-                                       if a.target_building and a.target_building == castle]
-                    if castle_targeters:
-                        nearest = min(castle_targeters, key=lambda e: unit.distance_to_unit(e))
-                    else:
-                        nearest = min(alive_attackers, key=lambda e: unit.distance_to_unit(e))
-                    unit.set_attack_target(nearest)
-                    continue
+        # PRIORITY 1 candidates: living castle attackers, preferring those
+        # actually attacking the castle building (same for every defender)
+        priority_attackers = []
+        if self.castle_under_attack and self.castle_attackers:
+            alive_attackers = [a for a in self.castle_attackers if a.is_alive()]
+            castle_targeters = [a for a in alive_attackers if a.target_building is castle]
+            priority_attackers = castle_targeters or alive_attackers
+
+        # PRIORITY 1: If castle is under direct attack, each defender targets
+        # its closest castle attacker (one batched squared-distance scan)
+        if priority_attackers:
+            indices = _nearest_indices(
+                [u.x for u in defenders], [u.y for u in defenders],
+                [a.x for a in priority_attackers], [a.y for a in priority_attackers]
+            )
+            for unit, index in zip(defenders, indices):
+                unit.set_attack_target(priority_attackers[index])
+            return
 
-            # PRIORITY 2: Find any enemies near castle
-            enemies_near_castle = [
-                e for e in self.enemy_units
-                if e.distance_to(castle.x, castle.y) < 400
-            ]
-
-            if enemies_near_castle:
-                # Attack nearest enemy to castle
-                nearest = min(
-                    enemies_near_castle,
-                    key=lambda e: e.distance_to(castle.x, castle.y)
-                )
-                unit.set_attack_target(nearest)
+        for unit in defenders:
+            # PRIORITY 2: Attack the nearest enemy near castle
+            if nearest_to_castle:
+                unit.set_attack_target(nearest_to_castle)
             else:
                 # Return to defensive position
                 self.state = 'building'
@@ -1049,50 +1390,80 @@ class AIBot:
         """Position military units in a defensive line in front of castle (Normal+ only)."""
         castle = self.my_castle
         if not castle:
+            # Castle lost - positions are stale
+            self.defense_positions = []
+            self._defense_origin = None
             return
 
-        # Calculate defense positions if not already done
-        if not self.defense_positions:
+        # Calculate defense positions once, and again only if the castle changes
+        castle_pos = (castle.x, castle.y)
+        if castle_pos != self._defense_origin:
             self.defense_positions = self._calculate_defense_positions()
+            self._defense_origin = castle_pos
 
         military = self.military_units
         if not military:
             return
 
+        enemies = self.enemy_units
+        exs, eys = self._enemy_xs, self._enemy_ys
+        defense_positions = self.defense_positions
+        num_positions = len(defense_positions)
+
         # Check for nearby enemies first - if enemies approach, engage them
-        for unit in military:
+        for index, unit in enumerate(military):
             # Skip if already engaged with a target
             if unit.target_unit and unit.target_unit.is_alive():
                 continue
 
-            # Look for enemies within engagement range of the defense line
-            enemies_nearby = [
-                e for e in self.enemy_units
-                if unit.distance_to_unit(e) < 250  # Engage enemies that get close
-            ]
-
-            if enemies_nearby:
+            # Look for the nearest enemy within engagement range of the defense line
+            nearest = None
+            nearest_d2 = 250 * 250  # Engage enemies that get close
+            ux, uy = unit.x, unit.y
+            for i in self._enemy_indices_near(ux, uy, 250):
+                d2 = _d2(exs[i], eys[i], ux, uy)
+                if d2 < nearest_d2:
+                    nearest_d2 = d2
+                    nearest = enemies[i]
+
+            if nearest:
                 # Attack the nearest enemy
-                nearest = min(enemies_nearby, key=lambda e: unit.distance_to_unit(e))
                 unit.set_attack_target(nearest)
             else:
                 # No enemies nearby - hold position in defense line
                 # Assign each unit to a position in the line
-                unit_index = military.index(unit) % len(self.defense_positions)
-                target_pos = self.defense_positions[unit_index]
+                target_pos = defense_positions[index % num_positions]
 
                 # Only move if not already at position (with some tolerance)
-                dist_to_pos = unit.distance_to(target_pos[0], target_pos[1])
-                if dist_to_pos > 30:
+                if _d2(ux, uy, target_pos[0], target_pos[1]) > 30 * 30:
                     # Move to defensive position
                     unit.set_move_target(target_pos[0], target_pos[1])
 
     def _find_nearest_enemy(self, unit: Unit) -> Optional[Unit]:
         """Find the nearest enemy unit to the given unit."""
-        if not self.enemy_units:
+        enemies = self.enemy_units
+        if not enemies:
             return None
 
-        return min(
-            self.enemy_units,
-            key=lambda e: unit.distance_to_unit(e)
+        # Scan the coordinate snapshot taken with the roster - every unit
+        # queried this frame shares it instead of re-reading enemy attributes
+        best_index = _nearest_indices([unit.x], [unit.y], self._enemy_xs, self._enemy_ys)[0]
+        return enemies[best_index]
+
+    def _nearest_enemies(self, units: List[Unit]) -> List[Optional[Unit]]:
+        """
+        Find the nearest enemy unit for each of the given units in one batched scan.
+
+        Args:
+            units: Units to find nearest enemies for
+
+        Returns:
+            Nearest enemy per unit (parallel to units), or None for all if no enemies exist
+        """
+        enemies = self.enemy_units
+        if not enemies:
+            return [None] * len(units)
+        indices = _nearest_indices(
+            [u.x for u in units], [u.y for u in units], self._enemy_xs, self._enemy_ys
         )
+        return [enemies[i] for i in indices]
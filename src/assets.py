@@ -36,6 +36,7 @@ See mods/example_mod for a template.
 import pygame
 import json
 import os
+import struct
 from typing import Dict, Tuple, Optional, List
 from .constants import TILE_SIZE, UNIT_STATS, UNIT_COSTS, BUILDING_STATS, BUILDING_COSTS, BUILDING_RESOURCE_GENERATION
 
@@ -76,6 +77,7 @@ DEFAULT_ASSET_REGISTRY = {
     'building_castle': {
         'file': 'ancient-stone-castle-transparent-background_1101614-40027-3216294613.jpg',
         'size': (128, 128),
+        'use_alpha': False,  # JPG - no alpha channel to preserve
         'description': 'Castle - main base'
     },
     'building_farm': {
@@ -98,11 +100,13 @@ DEFAULT_ASSET_REGISTRY = {
     'terrain_grass': {
         'file': 'tileable_grass_01-1560797743.png',
         'size': (TILE_SIZE, TILE_SIZE),
+        'use_alpha': False,  # Fully opaque tile
         'description': 'Grass terrain tile'
     },
     'terrain_stone': {
         'file': 'Stone_Floor-2623938694.png',
         'size': (TILE_SIZE, TILE_SIZE),
+        'use_alpha': False,  # Fully opaque tile
         'description': 'Stone floor tile'
     },
 
@@ -115,6 +119,85 @@ DEFAULT_ASSET_REGISTRY = {
 }
 
 
+# Assets drawn on the very first frames - loaded up front, everything else on first use
+CRITICAL_ASSETS = ('terrain_grass', 'building_castle')
+
+
+# =============================================================================
+# ASSET DISK CACHE - Decoded, pre-scaled RGBA pixels so startup skips PNG decode
+# =============================================================================
+
+ASSET_CACHE_FILE = '.asset_cache.bin'
+_ASSET_CACHE_MAGIC = b'MRTSAC01'
+# Per entry: name length, path length, source mtime, width, height, pixel byte count
+_ASSET_CACHE_ENTRY = struct.Struct('<HHdIII')
+
+
+def _pack_asset_cache(entries: Dict[str, Tuple[str, float, Tuple[int, int], bytes]]) -> bytes:
+    """
+    Serialize cached asset pixels.
+
+    Args:
+        entries: Asset name -> (source path, source mtime, size, RGBA bytes)
+
+    Returns:
+        Packed cache file contents
+    """
+    chunks = [_ASSET_CACHE_MAGIC]
+    for asset_name, (path, mtime, size, pixels) in entries.items():
+        name_bytes = asset_name.encode('utf-8')
+        path_bytes = path.encode('utf-8')
+        chunks.append(_ASSET_CACHE_ENTRY.pack(
+            len(name_bytes), len(path_bytes), mtime, size[0], size[1], len(pixels)
+        ))
+        chunks.append(name_bytes)
+        chunks.append(path_bytes)
+        chunks.append(pixels)
+    return b''.join(chunks)
+
+
+def _unpack_asset_cache(data: bytes) -> Dict[str, Tuple[str, float, Tuple[int, int], bytes]]:
+    """
+    Deserialize cached asset pixels.
+
+    Args:
+        data: Packed cache file contents
+
+    Returns:
+        Asset name -> (source path, source mtime, size, RGBA bytes)
+
+    Raises:
+        ValueError: If the data is not a valid cache file
+    """
+    if not data.startswith(_ASSET_CACHE_MAGIC):
+        raise ValueError("not an asset cache file")
+
+    entries = {}
+    view = memoryview(data)
+    offset = len(_ASSET_CACHE_MAGIC)
+    while offset < len(data):
+        if offset + _ASSET_CACHE_ENTRY.size > len(data):
+            raise ValueError("truncated asset cache entry")
+        name_len, path_len, mtime, width, height, pixel_len = _ASSET_CACHE_ENTRY.unpack_from(data, offset)
+        offset += _ASSET_CACHE_ENTRY.size
+        end = offset + name_len + path_len + pixel_len
+        if end > len(data):
+            raise ValueError("truncated asset cache entry")
+        asset_name = bytes(view[offset:offset + name_len]).decode('utf-8')
+        offset += name_len
+        path = bytes(view[offset:offset + path_len]).decode('utf-8')
+        offset += path_len
+        entries[asset_name] = (path, mtime, (width, height), bytes(view[offset:end]))
+        offset = end
+    return entries
+
+
+def _read_json(path: str):
+    """Read and parse a JSON file in one read (json.loads accepts UTF-8 bytes)."""
+    with open(path, 'rb') as f:
+        return json.loads(f.read())
+
+
 # =============================================================================
 # MOD MANAGER
 # =============================================================================
@@ -131,17 +214,26 @@ class ModManager:
         self.building_stat_overrides: Dict[str, dict] = {}
         self.building_cost_overrides: Dict[str, dict] = {}
         self.building_generation_overrides: Dict[str, dict] = {}  # For worker limits, resource gen
+        # Base tables with overrides applied, rebuilt by finalize() after mods load
+        self.merged_unit_stats: Dict[str, dict] = {}
+        self.merged_unit_costs: Dict[str, dict] = {}
+        self.merged_building_stats: Dict[str, dict] = {}
+        self.merged_building_costs: Dict[str, dict] = {}
+        self.merged_building_generation: Dict[str, dict] = {}
+        # (health, attack, defense, speed, range, cooldown) per unit type, from merged_unit_stats
+        self.unit_stat_tuples: Dict[str, Tuple[int, int, int, float, int, float]] = {}
+        self.building_generation_tuples: Dict[str, Tuple[int, int, int, int]] = {}
         # Mod configuration: which mods are enabled and their load order
         self.mod_config: Dict[str, dict] = {}  # mod_folder -> {enabled: bool, order: int}
         self.config_path = os.path.join(mods_directory, "mod_config.json")
         self._load_config()
+        self.finalize()
 
     def _load_config(self):
         """Load mod configuration from file."""
         if os.path.exists(self.config_path):
             try:
-                with open(self.config_path, 'r') as f:
-                    self.mod_config = json.load(f)
+                self.mod_config = _read_json(self.config_path)
             except Exception as e:
                 print(f"Failed to load mod config: {e}")
                 self.mod_config = {}
@@ -161,11 +253,10 @@ class ModManager:
         if not os.path.exists(self.mods_directory):
             return mods
 
-        for item in os.listdir(self.mods_directory):
-            mod_path = os.path.join(self.mods_directory, item)
-            mod_json = os.path.join(mod_path, "mod.json")
-            if os.path.isdir(mod_path) and os.path.exists(mod_json):
-                mods.append(item)
+        with os.scandir(self.mods_directory) as entries:
+            for entry in entries:
+                if entry.is_dir() and os.path.exists(os.path.join(entry.path, "mod.json")):
+                    mods.append(entry.name)
         return mods
 
     def load_mod(self, mod_name: str) -> bool:
@@ -178,8 +269,7 @@ class ModManager:
             return False
 
         try:
-            with open(mod_json_path, 'r') as f:
-                mod_config = json.load(f)
+            mod_config = _read_json(mod_json_path)
 
             mod_config['_path'] = mod_path
             self.loaded_mods.append(mod_config)
@@ -226,8 +316,44 @@ class ModManager:
             if cfg.get('enabled', True):
                 self.load_mod(mod_name)
 
+        self.finalize()
         self.save_config()
 
+    def finalize(self):
+        """Precompute the merged stat/cost tables once the set of loaded mods is final."""
+        def merge(base: Dict[str, dict], overrides: Dict[str, dict]) -> Dict[str, dict]:
+            merged = {}
+            for key in list(base) + [k for k in overrides if k not in base]:
+                merged[key] = {**base.get(key, {}), **overrides.get(key, {})}
+            return merged
+
+        self.merged_unit_stats = merge(UNIT_STATS, self.unit_stat_overrides)
+        self.merged_unit_costs = merge(UNIT_COSTS, self.unit_cost_overrides)
+        self.merged_building_stats = merge(BUILDING_STATS, self.building_stat_overrides)
+        self.merged_building_costs = merge(BUILDING_COSTS, self.building_cost_overrides)
+        self.merged_building_generation = merge(
+            BUILDING_RESOURCE_GENERATION, self.building_generation_overrides
+        )
+        self.unit_stat_tuples = {
+            key: self._unit_stat_tuple(stats) for key, stats in self.merged_unit_stats.items()
+        }
+        self.building_generation_tuples = {
+            key: self._building_generation_tuple(gen)
+            for key, gen in self.merged_building_generation.items()
+        }
+
+    @staticmethod
+    def _unit_stat_tuple(stats: dict) -> Tuple[int, int, int, float, int, float]:
+        """Flatten a unit stat dict into a tuple, using the same defaults as Unit."""
+        return (stats.get('health', 100), stats.get('attack', 10), stats.get('defense', 5),
+                stats.get('speed', 2.0), stats.get('range', 30), stats.get('cooldown', 1.0))
+
+    @staticmethod
+    def _building_generation_tuple(gen: dict) -> Tuple[int, int, int, int]:
+        """Flatten a building generation dict into (gold, food, wood, max_workers)."""
+        return (gen.get('gold', 0), gen.get('food', 0), gen.get('wood', 0),
+                gen.get('max_workers', 1))
+
     def get_all_mods_info(self) -> List[dict]:
         """Get info for all discovered mods (enabled or not) in load order."""
         discovered = self.discover_mods()
@@ -238,8 +364,7 @@ class ModManager:
             mod_json_path = os.path.join(mod_path, "mod.json")
 
             try:
-                with open(mod_json_path, 'r') as f:
-                    info = json.load(f)
+                info = _read_json(mod_json_path)
                 info['_folder'] = mod_name
                 info['_enabled'] = self.mod_config.get(mod_name, {}).get('enabled', True)
                 info['_order'] = self.mod_config.get(mod_name, {}).get('order', 0)
@@ -309,8 +434,7 @@ class ModManager:
         # Check for assets.json which maps asset names to files
         assets_json = os.path.join(mod_path, "assets.json")
         if os.path.exists(assets_json):
-            with open(assets_json, 'r') as f:
-                custom_assets = json.load(f)
+            custom_assets = _read_json(assets_json)
             for asset_name, asset_data in custom_assets.items():
                 # Skip comments and non-dict entries
                 if asset_name.startswith('_') or not isinstance(asset_data, dict):
@@ -319,7 +443,9 @@ class ModManager:
                 self.asset_overrides[asset_name] = asset_data
         else:
             # Auto-detect based on naming convention
-            for filename in os.listdir(images_path):
+            with os.scandir(images_path) as entries:
+                filenames = [entry.name for entry in entries if entry.is_file()]
+            for filename in filenames:
                 if filename.endswith(('.png', '.jpg', '.jpeg')):
                     # Extract asset name from filename (e.g., unit_knight.png -> unit_knight)
                     asset_name = os.path.splitext(filename)[0]
@@ -339,8 +465,7 @@ class ModManager:
         # Load unit overrides
         units_json = os.path.join(data_path, "units.json")
         if os.path.exists(units_json):
-            with open(units_json, 'r') as f:
-                units_data = json.load(f)
+            units_data = _read_json(units_json)
             if 'stats' in units_data and isinstance(units_data['stats'], dict):
                 # Filter out comment keys (starting with _)
                 for key, value in units_data['stats'].items():
@@ -354,8 +479,7 @@ class ModManager:
         # Load building overrides
         buildings_json = os.path.join(data_path, "buildings.json")
         if os.path.exists(buildings_json):
-            with open(buildings_json, 'r') as f:
-                buildings_data = json.load(f)
+            buildings_data = _read_json(buildings_json)
             if 'stats' in buildings_data and isinstance(buildings_data['stats'], dict):
                 for key, value in buildings_data['stats'].items():
                     if not key.startswith('_') and isinstance(value, dict):
@@ -376,39 +500,38 @@ class ModManager:
         return DEFAULT_ASSET_REGISTRY.get(asset_name, {})
 
     def get_unit_stats(self, unit_type: str) -> dict:
-        """Get unit stats with mod overrides applied."""
-        base_stats = UNIT_STATS.get(unit_type, {}).copy()
-        if unit_type in self.unit_stat_overrides:
-            base_stats.update(self.unit_stat_overrides[unit_type])
-        return base_stats
+        """Get unit stats with mod overrides applied (shared dict - do not modify)."""
+        return self.merged_unit_stats.get(unit_type, {})
+
+    def get_unit_stat_tuple(self, unit_type: str) -> Tuple[int, int, int, float, int, float]:
+        """Get (health, attack, defense, speed, range, cooldown) with mod overrides applied."""
+        stats = self.unit_stat_tuples.get(unit_type)
+        if stats is None:
+            stats = self._unit_stat_tuple({})
+        return stats
 
     def get_unit_costs(self, unit_type: str) -> dict:
-        """Get unit costs with mod overrides applied."""
-        base_costs = UNIT_COSTS.get(unit_type, {}).copy()
-        if unit_type in self.unit_cost_overrides:
-            base_costs.update(self.unit_cost_overrides[unit_type])
-        return base_costs
+        """Get unit costs with mod overrides applied (shared dict - do not modify)."""
+        return self.merged_unit_costs.get(unit_type, {})
 
     def get_building_stats(self, building_type: str) -> dict:
-        """Get building stats with mod overrides applied."""
-        base_stats = BUILDING_STATS.get(building_type, {}).copy()
-        if building_type in self.building_stat_overrides:
-            base_stats.update(self.building_stat_overrides[building_type])
-        return base_stats
+        """Get building stats with mod overrides applied (shared dict - do not modify)."""
+        return self.merged_building_stats.get(building_type, {})
 
     def get_building_costs(self, building_type: str) -> dict:
-        """Get building costs with mod overrides applied."""
-        base_costs = BUILDING_COSTS.get(building_type, {}).copy()
-        if building_type in self.building_cost_overrides:
-            base_costs.update(self.building_cost_overrides[building_type])
-        return base_costs
+        """Get building costs with mod overrides applied (shared dict - do not modify)."""
+        return self.merged_building_costs.get(building_type, {})
 
     def get_building_generation(self, building_type: str) -> dict:
-        """Get building resource generation with mod overrides applied."""
-        base_gen = BUILDING_RESOURCE_GENERATION.get(building_type, {}).copy()
-        if building_type in self.building_generation_overrides:
-            base_gen.update(self.building_generation_overrides[building_type])
-        return base_gen
+        """Get building resource generation with mod overrides applied (shared dict - do not modify)."""
+        return self.merged_building_generation.get(building_type, {})
+
+    def get_building_generation_tuple(self, building_type: str) -> Tuple[int, int, int, int]:
+        """Get (gold, food, wood, max_workers) generation with mod overrides applied."""
+        gen = self.building_generation_tuples.get(building_type)
+        if gen is None:
+            gen = self._building_generation_tuple({})
+        return gen
 
 
 # =============================================================================
@@ -422,6 +545,13 @@ class AssetManager:
         self.base_path = base_path
         self.mod_manager = mod_manager or ModManager()
         self.images: Dict[str, pygame.Surface] = {}
+        self._scaled_cache: Dict[Tuple[str, Tuple[int, int]], pygame.Surface] = {}  # get_scaled results
+        self._tinted_cache: Dict[tuple, pygame.Surface] = {}  # get_tinted results
+        # Decoded pixels from previous runs, keyed by asset name (see ASSET DISK CACHE)
+        self._cache_path = os.path.join(base_path, ASSET_CACHE_FILE)
+        self._disk_cache: Dict[str, Tuple[str, float, Tuple[int, int], bytes]] = {}
+        self._disk_cache_dirty = False
+        self._disk_cache_read = False
         self._placeholder_colors = {
             'unit_knight': (50, 50, 200),
             'unit_peasant': (139, 90, 43),
@@ -434,11 +564,38 @@ class AssetManager:
             'terrain_stone': (128, 128, 128),
             'effect_blood': (200, 50, 50)
         }
+        # Placeholders are never drawn on, so one surface per (name, size) is shared
+        self._placeholder_surfaces: Dict[Tuple[str, Tuple[int, int]], pygame.Surface] = {}
 
     def load_all_assets(self):
-        """Load all game assets."""
-        for asset_name in DEFAULT_ASSET_REGISTRY.keys():
+        """Load the critical game assets; the rest are loaded on first get()."""
+        self._read_disk_cache()
+        for asset_name in CRITICAL_ASSETS:
             self._load_asset(asset_name)
+        if self._disk_cache_dirty:
+            self._write_disk_cache()
+
+    def _read_disk_cache(self):
+        """Read decoded asset pixels saved by a previous run."""
+        self._disk_cache = {}
+        self._disk_cache_dirty = False
+        self._disk_cache_read = True
+        if not os.path.exists(self._cache_path):
+            return
+        try:
+            with open(self._cache_path, 'rb') as f:
+                self._disk_cache = _unpack_asset_cache(f.read())
+        except (OSError, ValueError, struct.error, UnicodeDecodeError) as e:
+            print(f"Warning: Ignoring asset cache {self._cache_path}: {e}")
+
+    def _write_disk_cache(self):
+        """Save decoded asset pixels so the next startup can skip image decoding."""
+        try:
+            with open(self._cache_path, 'wb') as f:
+                f.write(_pack_asset_cache(self._disk_cache))
+            self._disk_cache_dirty = False
+        except OSError as e:
+            print(f"Warning: Could not write asset cache {self._cache_path}: {e}")
 
     def _load_asset(self, asset_name: str):
         """Load a single asset, checking mod overrides first."""
@@ -454,36 +611,107 @@ class AssetManager:
         else:
             file_path = os.path.join(self.base_path, asset_info['file'])
 
-        size = asset_info.get('size', (64, 64))
+        size = tuple(asset_info.get('size', (64, 64)))
+        # Opaque images blit as a straight copy when converted without per-pixel alpha
+        use_alpha = asset_info.get('use_alpha', True)
+
+        # Reuse decoded pixels if the source file is unchanged since they were cached
+        try:
+            mtime = os.path.getmtime(file_path)
+        except OSError:
+            mtime = None
+        cached = self._disk_cache.get(asset_name)
+        if mtime is not None and cached and cached[:3] == (file_path, mtime, size):
+            try:
+                img = pygame.image.frombuffer(cached[3], size, 'RGBA')
+                self.images[asset_name] = img.convert_alpha() if use_alpha else img.convert()
+                return
+            except (pygame.error, ValueError):
+                pass  # Fall back to decoding the source image
 
         try:
-            img = pygame.image.load(file_path).convert_alpha()
-            self.images[asset_name] = pygame.transform.scale(img, size)
+            img = pygame.image.load(file_path)
+            img = img.convert_alpha() if use_alpha else img.convert()
+            # Images already authored at their target size need no rescale
+            scaled = img if img.get_size() == size else pygame.transform.scale(img, size)
+            self.images[asset_name] = scaled
+            if mtime is not None:
+                self._disk_cache[asset_name] = (file_path, mtime, size, pygame.image.tostring(scaled, 'RGBA'))
+                self._disk_cache_dirty = True
         except pygame.error as e:
             print(f"Warning: Could not load '{asset_name}' from {file_path}: {e}")
             self.images[asset_name] = self._create_placeholder(asset_name, size)
 
     def _create_placeholder(self, asset_name: str, size: Tuple[int, int]) -> pygame.Surface:
-        """Create a placeholder surface for missing assets."""
-        surf = pygame.Surface(size, pygame.SRCALPHA)
-        color = self._placeholder_colors.get(asset_name, (255, 255, 255))
-        surf.fill(color)
+        """Get the shared placeholder surface for a missing asset, creating it once."""
+        key = (asset_name, tuple(size))
+        surf = self._placeholder_surfaces.get(key)
+        if surf is None:
+            surf = pygame.Surface(size, pygame.SRCALPHA)
+            color = self._placeholder_colors.get(asset_name, (255, 255, 255))
+            surf.fill(color)
+            self._placeholder_surfaces[key] = surf
         return surf
 
     def get(self, asset_name: str) -> pygame.Surface:
         """Get an asset by name."""
         if asset_name not in self.images:
+            if not self._disk_cache_read:
+                self._read_disk_cache()
             self._load_asset(asset_name)
-        return self.images.get(asset_name, self._create_placeholder(asset_name, (32, 32)))
+            if self._disk_cache_dirty:
+                self._write_disk_cache()
+        image = self.images.get(asset_name)
+        if image is None:
+            # Only build the fallback on a miss, not as an eager default argument
+            image = self._create_placeholder(asset_name, (32, 32))
+        return image
 
     def get_scaled(self, asset_name: str, size: Tuple[int, int]) -> pygame.Surface:
-        """Get an asset scaled to a specific size."""
-        base = self.get(asset_name)
-        return pygame.transform.scale(base, size)
+        """Get an asset scaled to a specific size (cached - do not draw on the result)."""
+        key = (asset_name, tuple(size))
+        scaled = self._scaled_cache.get(key)
+        if scaled is None:
+            base = self.get(asset_name)
+            scaled = base if base.get_size() == key[1] else pygame.transform.scale(base, size)
+            self._scaled_cache[key] = scaled
+        return scaled
+
+    def get_tinted(self, asset_name: str, size: Tuple[int, int],
+                   tint: Optional[Tuple[int, int, int]] = None,
+                   alpha: Optional[int] = None) -> pygame.Surface:
+        """
+        Get a scaled asset with a multiplicative tint and/or surface alpha applied.
+
+        Cached like get_scaled - do not draw on the result.
+
+        Args:
+            asset_name: Name of the asset
+            size: Target (width, height) in pixels
+            tint: RGB color multiplied into the sprite, or None
+            alpha: Whole-surface alpha (0-255), or None for opaque
+
+        Returns:
+            The prepared surface
+        """
+        key = (asset_name, tuple(size), tint, alpha)
+        tinted = self._tinted_cache.get(key)
+        if tinted is None:
+            tinted = self.get_scaled(asset_name, size)
+            if tint is not None or alpha is not None:
+                tinted = tinted.copy()
+                if alpha is not None:
+                    tinted.set_alpha(alpha)
+                if tint is not None:
+                    tinted.fill(tint, special_flags=pygame.BLEND_MULT)
+            self._tinted_cache[key] = tinted
+        return tinted
 
     def reload_assets(self):
         """Reload all assets (useful after loading new mods)."""
         self.images.clear()
+        self._scaled_cache.clear()
+        self._tinted_cache.clear()
         self.load_all_assets()
 
 
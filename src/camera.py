@@ -3,14 +3,26 @@ Camera and viewport handling.
 """
 
 import pygame
-from typing import Tuple
+from typing import Hashable, Iterable, List, Sequence, Set, Tuple
 
-from .constants import MAP_WIDTH, MAP_HEIGHT, BASE_WIDTH, BASE_HEIGHT
+from .constants import MAP_WIDTH, MAP_HEIGHT, TILE_SIZE, BASE_WIDTH, BASE_HEIGHT
+
+# Scroll keycodes, bound once so update() skips the pygame attribute lookups
+_K_LEFT, _K_A = pygame.K_LEFT, pygame.K_a
+_K_RIGHT, _K_D = pygame.K_RIGHT, pygame.K_d
+_K_UP, _K_W = pygame.K_UP, pygame.K_w
+_K_DOWN, _K_S = pygame.K_DOWN, pygame.K_s
 
 
 class Camera:
     """Handles viewport and map scrolling."""
 
+    __slots__ = (
+        'x', 'y', 'screen_width', 'screen_height', 'width', 'height',
+        'speed', 'edge_scroll_margin', 'edge_scroll_enabled',
+        '_max_x', '_max_y', '_viewport_key', '_viewport_rect', '_visible_area',
+    )
+
     def __init__(self, width: int, height: int):
         """
         Initialize camera.
@@ -30,6 +42,13 @@ class Camera:
         self.speed = 10.0
         self.edge_scroll_margin = 20
         self.edge_scroll_enabled = True
+        # Largest top-left position that keeps the viewport on the map
+        self._max_x = MAP_WIDTH - self.width
+        self._max_y = MAP_HEIGHT - self.height
+        # Viewport rect/bounds cache, keyed on the position and size they were built from
+        self._viewport_key = None
+        self._viewport_rect = None
+        self._visible_area = None
 
     @property
     def scale(self) -> float:
@@ -47,35 +66,42 @@ class Camera:
         """
         move_speed = self.speed * dt * 60
 
-        # Keyboard scrolling
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            self.x -= move_speed
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            self.x += move_speed
-        if keys[pygame.K_UP] or keys[pygame.K_w]:
-            self.y -= move_speed
-        if keys[pygame.K_DOWN] or keys[pygame.K_s]:
-            self.y += move_speed
+        # Keyboard scrolling (pressed states are bools, so they subtract as 0/1)
+        step_x = bool(keys[_K_RIGHT] or keys[_K_D]) - bool(keys[_K_LEFT] or keys[_K_A])
+        step_y = bool(keys[_K_DOWN] or keys[_K_S]) - bool(keys[_K_UP] or keys[_K_W])
 
         # Edge scrolling (use screen dimensions for edge detection)
         if self.edge_scroll_enabled and mouse_pos:
             mouse_x, mouse_y = mouse_pos
-            if mouse_x < self.edge_scroll_margin:
-                self.x -= move_speed
-            elif mouse_x > self.screen_width - self.edge_scroll_margin:
-                self.x += move_speed
-            if mouse_y < self.edge_scroll_margin:
-                self.y -= move_speed
-            elif mouse_y > self.screen_height - self.edge_scroll_margin:
-                self.y += move_speed
-
-        # Clamp to map bounds
+            margin = self.edge_scroll_margin
+            step_x += (mouse_x > self.screen_width - margin) - (mouse_x < margin)
+            step_y += (mouse_y > self.screen_height - margin) - (mouse_y < margin)
+
+        # Apply the combined move, then clamp to map bounds
+        self.x += move_speed * step_x
+        self.y += move_speed * step_y
         self.clamp_to_map()
 
     def clamp_to_map(self):
         """Clamp camera position to map boundaries."""
-        self.x = max(0, min(MAP_WIDTH - self.width, self.x))
-        self.y = max(0, min(MAP_HEIGHT - self.height, self.y))
+        max_x, max_y = self._max_x, self._max_y
+        x, y = self.x, self.y
+        self.x = 0 if x < 0 else (max_x if x > max_x else x)
+        self.y = 0 if y < 0 else (max_y if y > max_y else y)
+
+    def resize(self, width: int, height: int):
+        """
+        Update the screen size after a resolution change.
+
+        Args:
+            width: New screen width
+            height: New screen height
+        """
+        self.screen_width = width
+        self.screen_height = height
+        self._max_x = MAP_WIDTH - self.width
+        self._max_y = MAP_HEIGHT - self.height
+        self.clamp_to_map()
 
     def world_to_screen(self, world_x: float, world_y: float) -> Tuple[int, int]:
         """
@@ -88,9 +114,40 @@ class Camera:
         Returns:
             Tuple of (screen_x, screen_y)
         """
-        s = self.scale
+        # Inline the scale property; this runs for every entity each frame.
+        # Truncation has to stay after scaling: most resolutions have a
+        # non-integer scale, so integer camera offsets would shift pixels.
+        s = self.screen_width / self.width
         return (int((world_x - self.x) * s), int((world_y - self.y) * s))
 
+    def world_to_screen_batch(self, points: Iterable[Tuple[float, float]]) -> List[Tuple[int, int]]:
+        """
+        Convert many world positions to screen coordinates in one call.
+
+        Args:
+            points: (world_x, world_y) pairs
+
+        Returns:
+            List of (screen_x, screen_y), in the same order as points
+        """
+        s = self.scale
+        cam_x, cam_y = self.x, self.y
+        return [(int((wx - cam_x) * s), int((wy - cam_y) * s)) for wx, wy in points]
+
+    def screen_to_world_batch(self, points: Iterable[Tuple[int, int]]) -> List[Tuple[float, float]]:
+        """
+        Convert many screen positions to world coordinates in one call.
+
+        Args:
+            points: (screen_x, screen_y) pairs
+
+        Returns:
+            List of (world_x, world_y), in the same order as points
+        """
+        s = self.scale
+        cam_x, cam_y = self.x, self.y
+        return [(sx / s + cam_x, sy / s + cam_y) for sx, sy in points]
+
     def screen_to_world(self, screen_x: int, screen_y: int) -> Tuple[float, float]:
         """
         Convert screen coordinates to world coordinates.
@@ -119,8 +176,44 @@ class Camera:
         Returns:
             True if any part of rect is visible
         """
-        viewport_rect = pygame.Rect(self.x, self.y, self.width, self.height)
-        return viewport_rect.colliderect(rect)
+        return self.is_aabb_visible(rect.x, rect.y, rect.width, rect.height)
+
+    def is_aabb_visible(self, x: float, y: float, w: float, h: float) -> bool:
+        """
+        Check if a world-space box is visible on screen.
+
+        Same test as is_rect_visible, for callers holding raw coordinates.
+
+        Args:
+            x: Box left in world space
+            y: Box top in world space
+            w: Box width
+            h: Box height
+
+        Returns:
+            True if any part of the box is visible
+        """
+        cam_x = self.x
+        cam_y = self.y
+        return (x + w > cam_x and x < cam_x + self.width and
+                y + h > cam_y and y < cam_y + self.height)
+
+    def rects_visible_batch(self, rects: Iterable[Tuple[float, float, float, float]]) -> List[bool]:
+        """
+        Check many world-space boxes for visibility in one call.
+
+        Args:
+            rects: (x, y, w, h) boxes in world coordinates
+
+        Returns:
+            List of booleans, in the same order as rects
+        """
+        left = self.x
+        top = self.y
+        right = left + self.width
+        bottom = top + self.height
+        return [x + w > left and x < right and y + h > top and y < bottom
+                for x, y, w, h in rects]
 
     def is_point_visible(self, x: float, y: float, margin: int = 50) -> bool:
         """
@@ -137,6 +230,84 @@ class Camera:
         return (self.x - margin <= x <= self.x + self.width + margin and
                 self.y - margin <= y <= self.y + self.height + margin)
 
+    def visible_mask(self, points: Iterable[Tuple[float, float]], margin: int = 50) -> List[bool]:
+        """
+        Check many world-space points for visibility in one call.
+
+        Args:
+            points: (world_x, world_y) pairs
+            margin: Extra margin around screen bounds
+
+        Returns:
+            List of booleans, in the same order as points
+        """
+        left = self.x - margin
+        top = self.y - margin
+        right = self.x + self.width + margin
+        bottom = self.y + self.height + margin
+        return [left <= x <= right and top <= y <= bottom for x, y in points]
+
+    def cull_entities(self, points: Sequence[Tuple[float, float]], margin: int = 50) -> List[int]:
+        """
+        Get the indices of the world-space points that are visible.
+
+        Args:
+            points: (world_x, world_y) pairs
+            margin: Extra margin around screen bounds
+
+        Returns:
+            Indices into points of the visible entries, in ascending order
+        """
+        left = self.x - margin
+        top = self.y - margin
+        right = self.x + self.width + margin
+        bottom = self.y + self.height + margin
+        return [i for i, (x, y) in enumerate(points) if left <= x <= right and top <= y <= bottom]
+
+    def visible_tile_range(self, tile_size: int = TILE_SIZE) -> Tuple[int, int, int, int]:
+        """
+        Get the range of map tiles overlapping the viewport, clamped to the map.
+
+        Args:
+            tile_size: Tile width/height in world units
+
+        Returns:
+            Tuple of (tx0, ty0, tx1, ty1); the end indices are exclusive
+        """
+        max_tx = -(-MAP_WIDTH // tile_size)
+        max_ty = -(-MAP_HEIGHT // tile_size)
+        return (max(0, int(self.x // tile_size)),
+                max(0, int(self.y // tile_size)),
+                min(max_tx, int((self.x + self.width) // tile_size) + 1),
+                min(max_ty, int((self.y + self.height) // tile_size) + 1))
+
+    def visible_chunks(self, chunk_px: int = 512) -> Tuple[int, int, int, int]:
+        """
+        Get the range of fixed-size world chunks overlapping the viewport.
+
+        Args:
+            chunk_px: Chunk width/height in world units
+
+        Returns:
+            Tuple of (cx0, cy0, cx1, cy1); the end indices are exclusive
+        """
+        return self.visible_tile_range(chunk_px)
+
+    def visible_ids(self, grid, margin: int = 0) -> Set[Hashable]:
+        """
+        Get the ids of grid entities inside the viewport.
+
+        Args:
+            grid: SpatialGrid holding entity positions
+            margin: Extra margin around the viewport in world units
+
+        Returns:
+            Set of visible entity ids
+        """
+        return set(grid.query_rect(self.x - margin, self.y - margin,
+                                   self.x + self.width + margin,
+                                   self.y + self.height + margin))
+
     def center_on(self, x: float, y: float):
         """
         Center camera on a world position.
@@ -161,9 +332,24 @@ class Camera:
         self.y = y
         self.clamp_to_map()
 
+    def _refresh_viewport_cache(self):
+        """Rebuild the cached viewport rect and bounds if the camera moved."""
+        key = (self.x, self.y, self.width, self.height)
+        if key == self._viewport_key:
+            return
+        self._viewport_key = key
+        self._viewport_rect = pygame.Rect(int(self.x), int(self.y), self.width, self.height)
+        self._visible_area = (int(self.x), int(self.y),
+                              int(self.x + self.width), int(self.y + self.height))
+
     def get_viewport_rect(self) -> pygame.Rect:
-        """Get the current viewport as a rectangle in world coordinates."""
-        return pygame.Rect(int(self.x), int(self.y), self.width, self.height)
+        """
+        Get the current viewport as a rectangle in world coordinates.
+
+        The rect is shared until the camera moves; callers must not mutate it.
+        """
+        self._refresh_viewport_cache()
+        return self._viewport_rect
 
     def get_visible_area(self) -> Tuple[int, int, int, int]:
         """
@@ -172,5 +358,5 @@ class Camera:
         Returns:
             Tuple of (left, top, right, bottom) in world coordinates
         """
-        return (int(self.x), int(self.y),
-                int(self.x + self.width), int(self.y + self.height))
+        self._refresh_viewport_cache()
+        return self._visible_area
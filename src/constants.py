@@ -2,7 +2,9 @@
 Game constants and configuration.
 """
 
-from enum import Enum, auto
+from enum import IntEnum, auto
+from functools import lru_cache
+from types import MappingProxyType
 
 # =============================================================================
 # DISPLAY SETTINGS
@@ -25,27 +27,45 @@ RESOLUTIONS = [
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 
-# Scale factor (computed at runtime based on resolution)
-SCALE = 1.0
+# Scale factor (computed at runtime based on resolution; update via set_resolution)
+SCALE = SCREEN_WIDTH / BASE_WIDTH
+
+def set_resolution(width, height):
+    """Change the current resolution and recompute the cached scale factor."""
+    global SCREEN_WIDTH, SCREEN_HEIGHT, SCALE
+    SCREEN_WIDTH = width
+    SCREEN_HEIGHT = height
+    SCALE = width / BASE_WIDTH
+    scale.cache_clear()
 
 def get_scale():
     """Get current scale factor."""
-    return SCREEN_WIDTH / BASE_WIDTH
+    return SCALE
 
+@lru_cache(maxsize=4096)
 def scale(value):
-    """Scale a value from base resolution to current resolution."""
-    return int(value * get_scale())
+    """Scale a value from base resolution to current resolution (memoized per resolution)."""
+    return int(value * SCALE)
 
 def scale_pos(x, y):
     """Scale a position tuple."""
-    s = get_scale()
-    return (int(x * s), int(y * s))
+    return (scale(x), scale(y))
 
 def scale_rect(x, y, w, h):
     """Scale a rectangle."""
-    s = get_scale()
+    s = SCALE
     return (int(x * s), int(y * s), int(w * s), int(h * s))
 
+def _freeze(table):
+    """Wrap a stat/cost table (and its per-type rows) in read-only views."""
+    return MappingProxyType({key: MappingProxyType(row) if isinstance(row, dict) else row
+                             for key, row in table.items()})
+
+def _cost_amounts(table):
+    """Flatten a cost table into (gold, food, wood) tuples per type."""
+    return MappingProxyType({key: (row.get('gold', 0), row.get('food', 0), row.get('wood', 0))
+                             for key, row in table.items()})
+
 # Map dimensions (in game units, not affected by UI scale)
 MAP_WIDTH = 2000
 MAP_HEIGHT = 2000
@@ -68,6 +88,9 @@ LIGHT_GRAY = (192, 192, 192)
 BROWN = (139, 90, 43)
 GOLD = (255, 215, 0)
 DARK_GREEN = (34, 139, 34)
+# BLEND_MULT sprite tints (enemy units/buildings, placement preview)
+RED_TINT = (255, 100, 100)
+GREEN_TINT = (100, 255, 100)
 
 # =============================================================================
 # NETWORK SETTINGS
@@ -88,26 +111,27 @@ STARTING_WOOD = 300
 # UNIT DEFINITIONS
 # =============================================================================
 
-UNIT_COSTS = {
+UNIT_COSTS = _freeze({
     'peasant': {'gold': 50, 'food': 25},
     'knight': {'gold': 150, 'food': 50},
     'cavalry': {'gold': 200, 'food': 75},
     'cannon': {'gold': 300, 'food': 0, 'wood': 100}
-}
+})
+UNIT_COST_AMOUNTS = _cost_amounts(UNIT_COSTS)  # (gold, food, wood) per unit type
 
 # Build time in seconds (for buildings and cannons)
-BUILD_TIMES = {
+BUILD_TIMES = _freeze({
     'house': 10.0,
     'farm': 8.0,
     'castle': 30.0,
     'cannon': 5.0,
     'tower': 15.0
-}
+})
 
 # Refund percentage when deconstructing
 DECONSTRUCT_REFUND = 0.7
 
-UNIT_STATS = {
+UNIT_STATS = _freeze({
     'peasant': {
         'health': 50,
         'attack': 5,
@@ -140,27 +164,28 @@ UNIT_STATS = {
         'range': 200,
         'cooldown': 3.0
     }
-}
+})
 
 # =============================================================================
 # BUILDING DEFINITIONS
 # =============================================================================
 
-BUILDING_COSTS = {
+BUILDING_COSTS = _freeze({
     'house': {'gold': 100, 'wood': 50},
     'castle': {'gold': 500, 'wood': 200},
     'farm': {'gold': 75, 'wood': 25},
     'tower': {'gold': 200, 'wood': 100},
     'barricade': {'gold': 50, 'wood': 150}
-}
+})
+BUILDING_COST_AMOUNTS = _cost_amounts(BUILDING_COSTS)  # (gold, food, wood) per building type
 
-BUILDING_STATS = {
+BUILDING_STATS = _freeze({
     'house': {'health': 300},
     'castle': {'health': 2000},
     'farm': {'health': 200},
     'tower': {'health': 500},
     'barricade': {'health': 1500}
-}
+})
 
 # =============================================================================
 # RESOURCE GENERATION
@@ -169,13 +194,18 @@ BUILDING_STATS = {
 RESOURCE_TICK_INTERVAL = 5.0  # seconds
 
 # Base generation when a peasant is working at the building
-BUILDING_RESOURCE_GENERATION = {
+BUILDING_RESOURCE_GENERATION = _freeze({
     'house': {'gold': 20, 'food': 0, 'wood': 0, 'max_workers': 2},
     'farm': {'gold': 0, 'food': 25, 'wood': 5, 'max_workers': 3},
     'castle': {'gold': 10, 'food': 5, 'wood': 5, 'max_workers': 1},
     'tower': {'gold': 0, 'food': 0, 'wood': 0, 'max_workers': 2},
     'barricade': {'gold': 0, 'food': 0, 'wood': 0, 'max_workers': 1}
-}
+})
+# (gold, food, wood, max_workers) per building type, for the economy tick
+BUILDING_GENERATION_AMOUNTS = MappingProxyType({
+    key: (gen.get('gold', 0), gen.get('food', 0), gen.get('wood', 0), gen.get('max_workers', 1))
+    for key, gen in BUILDING_RESOURCE_GENERATION.items()
+})
 
 # Barricade repair settings
 BARRICADE_REPAIR = {
@@ -197,6 +227,7 @@ TOWER_STATS = {
 
 # Worker assignment range - how close peasant must be to work
 WORKER_RANGE = 80
+WORKER_RANGE_SQ = WORKER_RANGE * WORKER_RANGE  # For squared-distance checks
 
 # =============================================================================
 # FOOD CONSUMPTION
@@ -210,7 +241,7 @@ STARVATION_DAMAGE = 5  # damage taken when no food available
 # AI DIFFICULTY SETTINGS
 # =============================================================================
 
-class Difficulty(Enum):
+class Difficulty(IntEnum):
     EASY = auto()
     NORMAL = auto()
     HARD = auto()
@@ -252,7 +283,7 @@ DIFFICULTY_SETTINGS = {
 # ENUMS
 # =============================================================================
 
-class GameState(Enum):
+class GameState(IntEnum):
     MAIN_MENU = auto()
     PLAYING = auto()
     PAUSED = auto()
@@ -270,14 +301,14 @@ class GameState(Enum):
     STATS = auto()  # Player statistics screen
 
 
-class UnitType(Enum):
+class UnitType(IntEnum):
     PEASANT = auto()
     KNIGHT = auto()
     CAVALRY = auto()
     CANNON = auto()
 
 
-class BuildingType(Enum):
+class BuildingType(IntEnum):
     HOUSE = auto()
     CASTLE = auto()
     FARM = auto()
@@ -285,16 +316,43 @@ class BuildingType(Enum):
     BARRICADE = auto()
 
 
-class Team(Enum):
+class Team(IntEnum):
     PLAYER = auto()
     ENEMY = auto()
 
 
+# Lowercase keys used by the stat/cost tables, precomputed per enum member
+UNIT_TYPE_KEYS = {unit_type: unit_type.name.lower() for unit_type in UnitType}
+BUILDING_TYPE_KEYS = {building_type: building_type.name.lower() for building_type in BuildingType}
+
+# Enum member names for serialization (Enum.name is a slow property lookup)
+UNIT_TYPE_NAMES = {unit_type: unit_type.name for unit_type in UnitType}
+BUILDING_TYPE_NAMES = {building_type: building_type.name for building_type in BuildingType}
+TEAM_NAMES = {team: team.name for team in Team}
+
+UNIT_TYPE_COUNT = len(UnitType)
+BUILDING_TYPE_COUNT = len(BuildingType)
+
+# Struct-of-arrays view of UNIT_STATS: one tuple per stat, indexed by unit_type - 1
+_UNIT_STAT_ROWS = [UNIT_STATS[UNIT_TYPE_KEYS[unit_type]] for unit_type in UnitType]
+UNIT_HEALTH = tuple(row['health'] for row in _UNIT_STAT_ROWS)
+UNIT_ATTACK = tuple(row['attack'] for row in _UNIT_STAT_ROWS)
+UNIT_DEFENSE = tuple(row['defense'] for row in _UNIT_STAT_ROWS)
+UNIT_SPEED = tuple(row['speed'] for row in _UNIT_STAT_ROWS)
+UNIT_RANGE = tuple(row['range'] for row in _UNIT_STAT_ROWS)
+UNIT_COOLDOWN = tuple(row['cooldown'] for row in _UNIT_STAT_ROWS)
+del _UNIT_STAT_ROWS
+
+# Building health column, indexed by building_type - 1
+BUILDING_HEALTH = tuple(BUILDING_STATS[BUILDING_TYPE_KEYS[building_type]]['health']
+                        for building_type in BuildingType)
+
+
 # =============================================================================
 # RAID MODE SETTINGS
 # =============================================================================
 
-class RaidDifficulty(Enum):
+class RaidDifficulty(IntEnum):
     EASY = auto()
     NORMAL = auto()
     HARD = auto()
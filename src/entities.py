@@ -9,20 +9,43 @@ from typing import Optional, Tuple, TYPE_CHECKING
 
 from .constants import (
     UnitType, BuildingType, Team, MAP_WIDTH, MAP_HEIGHT,
-    UNIT_STATS, BUILDING_STATS, STARTING_GOLD, STARTING_FOOD, STARTING_WOOD,
-    WORKER_RANGE, BUILDING_RESOURCE_GENERATION
+    STARTING_GOLD, STARTING_FOOD, STARTING_WOOD,
+    UNIT_TYPE_KEYS, UNIT_HEALTH, UNIT_ATTACK, UNIT_DEFENSE, UNIT_SPEED, UNIT_RANGE, UNIT_COOLDOWN,
+    BUILDING_TYPE_KEYS, BUILDING_HEALTH,
+    UNIT_TYPE_NAMES, BUILDING_TYPE_NAMES, TEAM_NAMES,
+    WORKER_RANGE_SQ, BUILDING_GENERATION_AMOUNTS
 )
 from typing import List
 
 if TYPE_CHECKING:
     from .assets import ModManager
 
+# Units are kept this far inside the map edges
+_MIN_POS = 20
+_MAX_X = MAP_WIDTH - 20
+_MAX_Y = MAP_HEIGHT - 20
+
+# Per-type footprint tables, looked up instead of rebuilt on every call
+_UNIT_SIZES = {UnitType.CAVALRY: 48}  # Everything else is 40
+_UNIT_COLLISION_RADII = {
+    UnitType.PEASANT: 14.0,
+    UnitType.KNIGHT: 16.0,
+    UnitType.CAVALRY: 20.0,
+    UnitType.CANNON: 18.0
+}
+_BUILDING_SIZES = {
+    BuildingType.HOUSE: (80, 80),
+    BuildingType.CASTLE: (128, 128),
+    BuildingType.FARM: (96, 96),
+    BuildingType.TOWER: (64, 64)
+}
+
 
 # =============================================================================
 # RESOURCES
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Resources:
     """Player resources."""
     gold: int = STARTING_GOLD
@@ -31,17 +54,23 @@ class Resources:
 
     def can_afford(self, costs: dict) -> bool:
         """Check if player can afford a cost."""
-        return (self.gold >= costs.get('gold', 0) and
-                self.food >= costs.get('food', 0) and
-                self.wood >= costs.get('wood', 0))
+        return self.can_afford_amounts(costs.get('gold', 0), costs.get('food', 0), costs.get('wood', 0))
+
+    def can_afford_amounts(self, gold: int, food: int, wood: int) -> bool:
+        """Check if player can afford a cost given as plain amounts (see UNIT_COST_AMOUNTS)."""
+        return self.gold >= gold and self.food >= food and self.wood >= wood
 
     def spend(self, costs: dict) -> bool:
         """Spend resources if affordable. Returns True if successful."""
-        if not self.can_afford(costs):
+        return self.spend_amounts(costs.get('gold', 0), costs.get('food', 0), costs.get('wood', 0))
+
+    def spend_amounts(self, gold: int, food: int, wood: int) -> bool:
+        """Spend plain resource amounts if affordable. Returns True if successful."""
+        if self.gold < gold or self.food < food or self.wood < wood:
             return False
-        self.gold -= costs.get('gold', 0)
-        self.food -= costs.get('food', 0)
-        self.wood -= costs.get('wood', 0)
+        self.gold -= gold
+        self.food -= food
+        self.wood -= wood
         return True
 
     def add(self, gold: int = 0, food: int = 0, wood: int = 0):
@@ -55,7 +84,7 @@ class Resources:
 # UNIT
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Unit:
     """Represents a game unit."""
     x: float
@@ -100,45 +129,53 @@ class Unit:
 
     def _apply_stats(self):
         """Apply stats from constants or mod overrides."""
-        # Map UnitType enum to string key
-        type_key = self.unit_type.name.lower()
+        if not self._mod_manager:
+            # Base stats come straight from the per-stat columns
+            i = self.unit_type - 1
+            self.health = self.max_health = UNIT_HEALTH[i]
+            self.attack = UNIT_ATTACK[i]
+            self.defense = UNIT_DEFENSE[i]
+            self.speed = UNIT_SPEED[i]
+            self.attack_range = UNIT_RANGE[i]
+            self.attack_cooldown = UNIT_COOLDOWN[i]
+            return
 
-        if self._mod_manager:
-            stats = self._mod_manager.get_unit_stats(type_key)
-        else:
-            stats = UNIT_STATS.get(type_key, UNIT_STATS['peasant'])
+        (self.health, self.attack, self.defense, self.speed,
+         self.attack_range, self.attack_cooldown) = self._mod_manager.get_unit_stat_tuple(
+            UNIT_TYPE_KEYS[self.unit_type])
+        self.max_health = self.health
 
-        self.health = stats.get('health', 100)
-        self.max_health = stats.get('health', 100)
-        self.attack = stats.get('attack', 10)
-        self.defense = stats.get('defense', 5)
-        self.speed = stats.get('speed', 2.0)
-        self.attack_range = stats.get('range', 30)
-        self.attack_cooldown = stats.get('cooldown', 1.0)
+    def get_bbox(self) -> Tuple[int, int, int, int]:
+        """Get unit collision box as (left, top, width, height) without building a Rect."""
+        size = _UNIT_SIZES.get(self.unit_type, 40)
+        return (int(self.x - size // 2), int(self.y - size // 2), size, size)
 
     def get_rect(self) -> pygame.Rect:
         """Get unit collision rectangle."""
-        size = 48 if self.unit_type == UnitType.CAVALRY else 40
-        return pygame.Rect(self.x - size // 2, self.y - size // 2, size, size)
+        return pygame.Rect(*self.get_bbox())
+
+    def contains_point(self, x: float, y: float) -> bool:
+        """Check if a world position falls inside the collision box (same edges as Rect.collidepoint)."""
+        left, top, w, h = self.get_bbox()
+        return left <= x < left + w and top <= y < top + h
 
     def get_size(self) -> int:
         """Get unit visual size."""
-        return 48 if self.unit_type == UnitType.CAVALRY else 40
+        return _UNIT_SIZES.get(self.unit_type, 40)
 
     def get_collision_radius(self) -> float:
         """Get unit collision radius for soft collisions."""
-        if self.unit_type == UnitType.CAVALRY:
-            return 20.0
-        elif self.unit_type == UnitType.CANNON:
-            return 18.0
-        elif self.unit_type == UnitType.KNIGHT:
-            return 16.0
-        else:  # Peasant
-            return 14.0
+        return _UNIT_COLLISION_RADII.get(self.unit_type, 14.0)
 
     def distance_to(self, other_x: float, other_y: float) -> float:
         """Calculate distance to a point."""
-        return math.sqrt((self.x - other_x) ** 2 + (self.y - other_y) ** 2)
+        return math.hypot(self.x - other_x, self.y - other_y)
+
+    def distance_sq_to(self, other_x: float, other_y: float) -> float:
+        """Calculate squared distance to a point (for range checks without a sqrt)."""
+        dx = self.x - other_x
+        dy = self.y - other_y
+        return dx * dx + dy * dy
 
     def distance_to_unit(self, other: 'Unit') -> float:
         """Calculate distance to another unit."""
@@ -157,16 +194,27 @@ class Unit:
             dt: Delta time
             speed_multiplier: Speed multiplier (e.g., 0.6 for 40% slowdown)
         """
-        dist = self.distance_to(target_x, target_y)
+        self.step_towards(target_x, target_y, self.speed * speed_multiplier * dt * 60)
+
+    def step_towards(self, target_x: float, target_y: float, max_step: float):
+        """Move towards a target position by a precomputed step length.
+
+        Args:
+            target_x: Target X coordinate
+            target_y: Target Y coordinate
+            max_step: Distance to cover this frame (speed * multiplier * dt * 60)
+        """
+        dx = target_x - self.x
+        dy = target_y - self.y
+        dist = math.hypot(dx, dy)
         if dist > 5:
-            dx = (target_x - self.x) / dist
-            dy = (target_y - self.y) / dist
-            effective_speed = self.speed * speed_multiplier
-            self.x += dx * effective_speed * dt * 60
-            self.y += dy * effective_speed * dt * 60
+            # One factor folds normalization and step length together
+            step = max_step / dist
+            x = self.x + dx * step
+            y = self.y + dy * step
             # Clamp to map bounds
-            self.x = max(20, min(MAP_WIDTH - 20, self.x))
-            self.y = max(20, min(MAP_HEIGHT - 20, self.y))
+            self.x = _MIN_POS if x < _MIN_POS else (_MAX_X if x > _MAX_X else x)
+            self.y = _MIN_POS if y < _MIN_POS else (_MAX_Y if y > _MAX_Y else y)
         else:
             self.target_x = None
             self.target_y = None
@@ -229,12 +277,14 @@ class Unit:
             return
 
         # Check if close enough to work
-        dist = self.distance_to_building(self.assigned_building)
-        self.is_working = dist <= WORKER_RANGE
+        building = self.assigned_building
+        dx = self.x - building.x
+        dy = self.y - building.y
+        self.is_working = dx * dx + dy * dy <= WORKER_RANGE_SQ
 
         # If not working and not moving, move back to building
         if not self.is_working and self.target_x is None:
-            self.set_move_target(self.assigned_building.x, self.assigned_building.y)
+            self.set_move_target(building.x, building.y)
 
     def take_damage(self, damage: int) -> bool:
         """Take damage. Returns True if unit dies."""
@@ -266,8 +316,8 @@ class Unit:
             'uid': self.uid,
             'x': self.x,
             'y': self.y,
-            'type': self.unit_type.name,
-            'team': self.team.name,
+            'type': UNIT_TYPE_NAMES[self.unit_type],
+            'team': TEAM_NAMES[self.team],
             'health': self.health,
             'max_health': self.max_health
         }
@@ -291,7 +341,7 @@ class Unit:
 # BUILDING
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Building:
     """Represents a game building."""
     x: float
@@ -312,32 +362,52 @@ class Building:
     # Tower attack state
     last_attack: float = 0
 
+    # Peasants working here, tallied once per frame by Game._update_workers
+    worker_count: int = field(default=0, repr=False, compare=False)
+    # Peasants in range constructing this building, tallied in the same pass
+    builder_count: int = field(default=0, repr=False, compare=False)
+
     # Reference to mod manager
     _mod_manager: Optional['ModManager'] = field(default=None, repr=False)
 
+    def _generation_amounts(self) -> Tuple[int, int, int, int]:
+        """Get (gold, food, wood, max_workers) for this building type, with mod overrides."""
+        type_key = BUILDING_TYPE_KEYS[self.building_type]
+        if self._mod_manager:
+            return self._mod_manager.get_building_generation_tuple(type_key)
+        return BUILDING_GENERATION_AMOUNTS.get(type_key, (0, 0, 0, 1))
+
     def get_max_workers(self) -> int:
         """Get maximum number of workers this building can have."""
-        type_key = self.building_type.name.lower()
-        if self._mod_manager:
-            gen_data = self._mod_manager.get_building_generation(type_key)
-        else:
-            gen_data = BUILDING_RESOURCE_GENERATION.get(type_key, {})
-        return gen_data.get('max_workers', 1)
+        return self._generation_amounts()[3]
 
-    def count_workers(self, units: List['Unit']) -> int:
-        """Count how many peasants are working at this building."""
+    def count_workers(self, units: Optional[List['Unit']] = None) -> int:
+        """
+        Count how many peasants are working at this building.
+
+        Args:
+            units: Units to scan; when omitted, the per-frame worker_count tally is used
+
+        Returns:
+            Number of working peasants
+        """
+        if units is None:
+            return self.worker_count
         count = 0
         for unit in units:
             if (unit.unit_type == UnitType.PEASANT and
                 unit.team == self.team and
-                unit.assigned_building == self and
+                unit.assigned_building is self and
                 unit.is_working):
                 count += 1
         return count
 
-    def get_production_multiplier(self, units: List['Unit']) -> float:
+    def get_production_multiplier(self, units: Optional[List['Unit']] = None) -> float:
         """Get production multiplier based on workers (0.0 to 1.0, or higher if unlimited)."""
-        max_workers = self.get_max_workers()
+        return self._production_multiplier(self._generation_amounts()[3], units)
+
+    def _production_multiplier(self, max_workers: int, units: Optional[List['Unit']]) -> float:
+        """Production multiplier for a known worker capacity."""
         if max_workers == 0:
             return 0.0
         workers = self.count_workers(units)
@@ -346,20 +416,16 @@ class Building:
             return float(workers)
         return min(1.0, workers / max_workers)
 
-    def get_resource_generation(self, units: List['Unit']) -> dict:
+    def get_resource_generation(self, units: Optional[List['Unit']] = None) -> dict:
         """Get actual resource generation based on workers."""
-        type_key = self.building_type.name.lower()
-        if self._mod_manager:
-            base_gen = self._mod_manager.get_building_generation(type_key)
-        else:
-            base_gen = BUILDING_RESOURCE_GENERATION.get(type_key, {})
-        multiplier = self.get_production_multiplier(units)
+        gold, food, wood = self.get_resource_amounts(units)
+        return {'gold': gold, 'food': food, 'wood': wood}
 
-        return {
-            'gold': int(base_gen.get('gold', 0) * multiplier),
-            'food': int(base_gen.get('food', 0) * multiplier),
-            'wood': int(base_gen.get('wood', 0) * multiplier)
-        }
+    def get_resource_amounts(self, units: Optional[List['Unit']] = None) -> Tuple[int, int, int]:
+        """Get actual (gold, food, wood) generation based on workers, without building a dict."""
+        gold, food, wood, max_workers = self._generation_amounts()
+        multiplier = self._production_multiplier(max_workers, units)
+        return (int(gold * multiplier), int(food * multiplier), int(wood * multiplier))
 
     def __post_init__(self):
         """Initialize building stats based on type."""
@@ -367,36 +433,30 @@ class Building:
 
     def _apply_stats(self):
         """Apply stats from constants or mod overrides."""
-        type_key = self.building_type.name.lower()
+        if not self._mod_manager:
+            self.health = self.max_health = BUILDING_HEALTH[self.building_type - 1]
+            return
 
-        if self._mod_manager:
-            stats = self._mod_manager.get_building_stats(type_key)
-        else:
-            stats = BUILDING_STATS.get(type_key, BUILDING_STATS['house'])
+        stats = self._mod_manager.get_building_stats(BUILDING_TYPE_KEYS[self.building_type])
+        self.health = self.max_health = stats.get('health', 500)
 
-        self.health = stats.get('health', 500)
-        self.max_health = stats.get('health', 500)
+    def get_bbox(self) -> Tuple[int, int, int, int]:
+        """Get building collision box as (left, top, width, height) without building a Rect."""
+        w, h = _BUILDING_SIZES.get(self.building_type, (64, 64))
+        return (int(self.x - w // 2), int(self.y - h // 2), w, h)
 
     def get_rect(self) -> pygame.Rect:
         """Get building collision rectangle."""
-        sizes = {
-            BuildingType.HOUSE: (80, 80),
-            BuildingType.CASTLE: (128, 128),
-            BuildingType.FARM: (96, 96),
-            BuildingType.TOWER: (64, 64)
-        }
-        w, h = sizes.get(self.building_type, (64, 64))
-        return pygame.Rect(self.x - w // 2, self.y - h // 2, w, h)
+        return pygame.Rect(*self.get_bbox())
+
+    def contains_point(self, x: float, y: float) -> bool:
+        """Check if a world position falls inside the collision box (same edges as Rect.collidepoint)."""
+        left, top, w, h = self.get_bbox()
+        return left <= x < left + w and top <= y < top + h
 
     def get_size(self) -> tuple:
         """Get building visual size."""
-        sizes = {
-            BuildingType.HOUSE: (80, 80),
-            BuildingType.CASTLE: (128, 128),
-            BuildingType.FARM: (96, 96),
-            BuildingType.TOWER: (64, 64)
-        }
-        return sizes.get(self.building_type, (64, 64))
+        return _BUILDING_SIZES.get(self.building_type, (64, 64))
 
     def take_damage(self, damage: int) -> bool:
         """Take damage. Returns True if building is destroyed."""
@@ -413,8 +473,8 @@ class Building:
             'uid': self.uid,
             'x': self.x,
             'y': self.y,
-            'type': self.building_type.name,
-            'team': self.team.name,
+            'type': BUILDING_TYPE_NAMES[self.building_type],
+            'team': TEAM_NAMES[self.team],
             'health': self.health,
             'max_health': self.max_health
         }
@@ -438,7 +498,7 @@ class Building:
 # VISUAL EFFECTS
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class BloodEffect:
     """Visual effect for combat."""
     x: float
@@ -458,6 +518,71 @@ class BloodEffect:
         return max(0, min(255, self.alpha))
 
 
+class BloodEffectPool:
+    """Recycles expired blood effects so combat doesn't allocate one per hit."""
+
+    def __init__(self, max_free: int = 256):
+        """
+        Initialize an empty pool.
+
+        Args:
+            max_free: Most expired effects kept around for reuse
+        """
+        self.max_free = max_free
+        self._free: List[BloodEffect] = []
+
+    def spawn(self, x: float, y: float, lifetime: float = 1.0) -> BloodEffect:
+        """
+        Get a fresh effect at a position, reusing an expired one if available.
+
+        Args:
+            x: World X position
+            y: World Y position
+            lifetime: Seconds until the effect fades out
+
+        Returns:
+            Effect reset to full alpha
+        """
+        if not self._free:
+            return BloodEffect(x, y, lifetime, lifetime)
+        effect = self._free.pop()
+        effect.x = x
+        effect.y = y
+        effect.lifetime = lifetime
+        effect.max_lifetime = lifetime
+        effect.alpha = 255
+        return effect
+
+    def release(self, effect: BloodEffect):
+        """Return an expired effect to the pool."""
+        if len(self._free) < self.max_free:
+            self._free.append(effect)
+
+    def update_all(self, effects: List[BloodEffect], dt: float):
+        """
+        Age every live effect in one pass and release the expired ones.
+
+        Does the same math as BloodEffect.update without a method call per effect.
+
+        Args:
+            effects: Live effects; expired entries are removed in place
+            dt: Delta time in seconds
+        """
+        live = []
+        append = live.append
+        free = self._free
+        max_free = self.max_free
+        for effect in effects:
+            lifetime = effect.lifetime - dt
+            effect.lifetime = lifetime
+            effect.alpha = int(255 * (lifetime / effect.max_lifetime))
+            if lifetime > 0:
+                append(effect)
+            elif len(free) < max_free:
+                free.append(effect)
+        effects[:] = live
+
+
 @dataclass
 class Projectile:
     """Visual projectile for towers and cannons."""
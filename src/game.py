@@ -13,14 +13,16 @@ from .constants import (
     MAP_WIDTH, MAP_HEIGHT, TILE_SIZE, FPS,
     BASE_WIDTH, BASE_HEIGHT, RESOLUTIONS, scale, scale_pos, get_scale,
     WHITE, BLACK, RED, GREEN, GOLD, GRAY, DARK_GRAY, LIGHT_GRAY, BROWN, YELLOW,
+    RED_TINT, GREEN_TINT,
     GameState, UnitType, BuildingType, Team, Difficulty, DIFFICULTY_SETTINGS,
-    UNIT_COSTS, BUILDING_COSTS, RESOURCE_TICK_INTERVAL, BUILD_TIMES, DECONSTRUCT_REFUND,
-    FOOD_CONSUMPTION_INTERVAL, FOOD_PER_UNIT, STARVATION_DAMAGE, WORKER_RANGE, TOWER_STATS,
+    UNIT_COST_AMOUNTS, BUILDING_COST_AMOUNTS, RESOURCE_TICK_INTERVAL, BUILD_TIMES, DECONSTRUCT_REFUND,
+    FOOD_CONSUMPTION_INTERVAL, FOOD_PER_UNIT, STARVATION_DAMAGE, WORKER_RANGE_SQ, TOWER_STATS,
     RaidDifficulty, RAID_DIFFICULTY_SETTINGS, RAID_WAVE_COMPOSITION, BARRICADE_REPAIR
 )
 from .assets import AssetManager, ModManager, get_unit_asset_name, get_building_asset_name
-from .entities import Unit, Building, BloodEffect, Resources, Projectile
+from .entities import Unit, Building, BloodEffect, BloodEffectPool, Resources, Projectile
 from .camera import Camera
+from .spatial_grid import SpatialGrid
 from .ai import AIBot
 from .network import NetworkManager
 from .ui import (
@@ -29,6 +31,111 @@ from .ui import (
 )
 from .savedata import SaveDataManager, KEYBIND_PRESETS
 
+# Knights, cavalry and cannons: larger aggro range and will attack buildings
+_MILITARY_TYPES = frozenset((UnitType.KNIGHT, UnitType.CAVALRY, UnitType.CANNON))
+
+# Melee damage is scaled by a uniform roll in [0.8, 1.2). random.uniform is a
+# Python wrapper around random(), so the roll is inlined with the same formula
+# (and the same result for a given random state)
+_random = random.random
+_DAMAGE_ROLL_MIN = 0.8
+_DAMAGE_ROLL_SPAN = 1.2 - 0.8
+
+# Spawn directions on the ring around a castle, picked with one random() call
+# instead of random.uniform plus cos/sin per trained unit
+_SPAWN_DIRECTION_STEPS = 256
+_SPAWN_DIRECTIONS = [
+    (math.cos(2 * math.pi * i / _SPAWN_DIRECTION_STEPS), math.sin(2 * math.pi * i / _SPAWN_DIRECTION_STEPS))
+    for i in range(_SPAWN_DIRECTION_STEPS)
+]
+
+# HUD training/placement buttons as (x, type, asset name, cost label); the
+# labels come from the (gold, food, wood) cost tuples once, not every frame
+_HUD_UNIT_BUTTONS = (
+    (10, UnitType.PEASANT, 'unit_peasant', f"{UNIT_COST_AMOUNTS['peasant'][0]}g"),
+    (75, UnitType.KNIGHT, 'unit_knight', f"{UNIT_COST_AMOUNTS['knight'][0]}g"),
+    (140, UnitType.CAVALRY, 'unit_cavalry', f"{UNIT_COST_AMOUNTS['cavalry'][0]}g"),
+    (205, UnitType.CANNON, 'unit_cannon', f"{UNIT_COST_AMOUNTS['cannon'][0]}g"),
+)
+_HUD_BUILDING_BUTTONS = (
+    (10, BuildingType.HOUSE, 'building_house', f"{BUILDING_COST_AMOUNTS['house'][0]}g"),
+    (75, BuildingType.FARM, 'building_farm', f"{BUILDING_COST_AMOUNTS['farm'][0]}g"),
+    (140, BuildingType.TOWER, 'building_tower', f"{BUILDING_COST_AMOUNTS['tower'][0]}g"),
+    (205, BuildingType.BARRICADE, 'building_barricade', f"{BUILDING_COST_AMOUNTS['barricade'][2]}w"),
+)
+
+# Footprints used for building placement checks
+_PLACEMENT_SIZES = {
+    BuildingType.HOUSE: (80, 80),
+    BuildingType.CASTLE: (128, 128),
+    BuildingType.FARM: (96, 96),
+    BuildingType.TOWER: (64, 64),
+    BuildingType.BARRICADE: (160, 160)
+}
+
+
+def _remove_identical(items: list, item) -> bool:
+    """
+    Remove an entity from a list by identity.
+
+    Units, buildings and projectiles are dataclasses whose == compares every
+    field, so list.remove() and 'in' would run a full comparison per element.
+
+    Args:
+        items: List to remove from
+        item: Entity to remove
+
+    Returns:
+        True if the entity was found and removed
+    """
+    for i, other in enumerate(items):
+        if other is item:
+            del items[i]
+            return True
+    return False
+
+
+def _blit_batch(surface: pygame.Surface, blits: list):
+    """
+    Blit many (source, dest) pairs in one call.
+
+    Uses Surface.fblits where available (pygame-ce), else Surface.blits.
+
+    Args:
+        surface: Surface to draw onto
+        blits: (source surface, (x, y)) pairs, drawn in order
+    """
+    fblits = getattr(surface, 'fblits', None)
+    if fblits is not None:
+        fblits(blits)
+    else:
+        surface.blits(blits, doreturn=False)
+
+
+def _building_obstacles(buildings: list) -> list:
+    """
+    Precompute the movement-slowdown footprint of every building.
+
+    Args:
+        buildings: Buildings currently on the map
+
+    Returns:
+        List of (x, y, radius, team, same_team_mult, other_team_mult) tuples
+    """
+    obstacles = []
+    for building in buildings:
+        bw, bh = building.get_size()
+        if building.building_type == BuildingType.BARRICADE:
+            # Barricades slow friendly units by 40% and enemies by 70%
+            same_mult, other_mult = 0.6, 0.3
+        else:
+            # Other buildings: 70% slow for completed, 40% for incomplete
+            same_mult = other_mult = 0.3 if building.completed else 0.6
+        # Radius is slightly smaller than the visual footprint
+        obstacles.append((building.x, building.y, max(bw, bh) * 0.4,
+                          building.team, same_mult, other_mult))
+    return obstacles
+
 
 class Game:
     """Main game class."""
@@ -65,7 +172,20 @@ class Game:
         self.units: List[Unit] = []
         self.buildings: List[Building] = []
         self.blood_effects: List[BloodEffect] = []
+        self._blood_pool = BloodEffectPool()
         self.projectiles: List[Projectile] = []
+        # Sound effects requested by the simulation this frame, played by draw()
+        self._pending_sounds: List[str] = []
+
+        # Spatial indexes, rebuilt each frame from list indices
+        self._render_grid = SpatialGrid()  # Viewport culling
+        self._unit_grid = SpatialGrid()  # Auto-attack target search
+        self._collision_grid = SpatialGrid(64)  # Unit soft-collision neighbours
+
+        # Pre-tiled terrain background, rebuilt when the tile asset or camera scale changes
+        self._terrain_background: Optional[pygame.Surface] = None
+        self._terrain_background_source: Optional[pygame.Surface] = None
+        self._terrain_background_scale = 0.0
 
         # Resources
         self.player_resources = Resources()
@@ -266,6 +386,35 @@ class Game:
         self.resource_display = ResourceDisplay(w - int(300 * s), h - int(95 * s), font_size=hud_font, spacing=int(25 * s))
         self.selection_info = SelectionInfo(int(520 * s), h - int(70 * s), font_size=hud_font)
 
+        # HUD button hit areas (unscaled bottom panel), built once per resolution
+        hud_y = h - 100
+        tab_height = 25
+        content_y = hud_y + tab_height + 5
+        button_size = 60
+        small_btn = 45
+        cmd_x = 345
+        self.hud_tab_rects = [
+            (pygame.Rect(10, hud_y, 80, tab_height), 0),  # Units tab
+            (pygame.Rect(95, hud_y, 80, tab_height), 1),  # Buildings tab
+        ]
+        self.hud_unit_rects = [
+            (pygame.Rect(bx, content_y, button_size, button_size), unit_type)
+            for bx, unit_type in ((10, UnitType.PEASANT), (75, UnitType.KNIGHT),
+                                  (140, UnitType.CAVALRY), (205, UnitType.CANNON))
+        ]
+        self.hud_building_rects = [
+            (pygame.Rect(bx, content_y, button_size, button_size), building_type)
+            for bx, building_type in ((10, BuildingType.HOUSE), (75, BuildingType.FARM),
+                                      (140, BuildingType.TOWER), (205, BuildingType.BARRICADE))
+        ]
+        self.hud_grid_snap_rect = pygame.Rect(275, content_y, button_size, button_size)
+        self.hud_attack_move_rect = pygame.Rect(cmd_x, content_y, small_btn, small_btn)
+        self.hud_deconstruct_rect = pygame.Rect(cmd_x + 50, content_y, small_btn, small_btn)
+        self.hud_stop_rect = pygame.Rect(cmd_x + 100, content_y, small_btn, small_btn)
+        self.hud_heal_rect = pygame.Rect(cmd_x + 150, content_y, small_btn, small_btn)
+        self.hud_menu_rect = pygame.Rect(cmd_x + 200, content_y, small_btn, small_btn)
+        self.hud_select_military_rect = pygame.Rect(w - 170, content_y, 80, small_btn)
+
     def _load_sounds(self):
         """Load all sound effects."""
         import os
@@ -316,6 +465,17 @@ class Game:
         else:
             sound.play()
 
+    def _queue_sound(self, sound_name: str):
+        """Request a sound effect from the simulation; played once per frame by draw()."""
+        self._pending_sounds.append(sound_name)
+
+    def _play_pending_sounds(self):
+        """Play each queued sound effect once and clear the queue."""
+        # Repeats within one frame would start on the same tick, so one play each is enough
+        for sound_name in dict.fromkeys(self._pending_sounds):
+            self.play_sound(sound_name)
+        self._pending_sounds.clear()
+
     def next_uid(self, for_enemy: bool = False) -> int:
         """Get next unique ID.
 
@@ -871,8 +1031,7 @@ class Game:
         new_width, new_height = RESOLUTIONS[self.resolution_index]
 
         # Update the global constants
-        constants.SCREEN_WIDTH = new_width
-        constants.SCREEN_HEIGHT = new_height
+        constants.set_resolution(new_width, new_height)
 
         # Recreate the display
         flags = 0
@@ -884,8 +1043,7 @@ class Game:
         self.screen = pygame.display.set_mode((new_width, new_height), flags, vsync=1 if self.vsync else 0)
 
         # Update camera dimensions
-        self.camera.screen_width = new_width
-        self.camera.screen_height = new_height
+        self.camera.resize(new_width, new_height)
 
         # Update button text
         self.resolution_button.text = f"Resolution: {new_width}x{new_height}"
@@ -1178,82 +1336,57 @@ class Game:
 
         # Delete selected
         elif event.key == pygame.K_DELETE:
-            for unit in self.selected_units[:]:
-                if unit in self.units:
+            for unit in self.selected_units:
+                if _remove_identical(self.units, unit):
                     # Sync deletion in multiplayer
                     if self.is_multiplayer and self.network.connected:
                         self.network.send_unit_death(unit.uid)
-                    self.units.remove(unit)
             self.selected_units.clear()
 
     def _handle_hud_click(self, mouse_pos: Tuple[int, int]):
         """Handle HUD button clicks."""
-        hud_y = constants.SCREEN_HEIGHT - 100
-        tab_height = 25
-        content_y = hud_y + tab_height + 5
-        button_size = 60
-        small_btn = 45
-
         # Tab clicks (Units / Buildings)
-        tab_width = 80
-        if pygame.Rect(10, hud_y, tab_width, tab_height).collidepoint(mouse_pos):
-            self.hud_tab = 0  # Units tab
-            return
-        if pygame.Rect(95, hud_y, tab_width, tab_height).collidepoint(mouse_pos):
-            self.hud_tab = 1  # Buildings tab
-            return
+        for rect, tab in self.hud_tab_rects:
+            if rect.collidepoint(mouse_pos):
+                self.hud_tab = tab
+                return
 
         # Content area based on active tab
         if self.hud_tab == 0:
             # Units tab - unit training buttons
-            unit_buttons = [
-                (10, UnitType.PEASANT),
-                (75, UnitType.KNIGHT),
-                (140, UnitType.CAVALRY),
-                (205, UnitType.CANNON),
-            ]
-
-            for bx, unit_type in unit_buttons:
-                if pygame.Rect(bx, content_y, button_size, button_size).collidepoint(mouse_pos):
+            for rect, unit_type in self.hud_unit_rects:
+                if rect.collidepoint(mouse_pos):
                     self._train_unit(unit_type)
                     return
 
         elif self.hud_tab == 1:
             # Buildings tab - building placement buttons
-            building_buttons = [
-                (10, BuildingType.HOUSE),
-                (75, BuildingType.FARM),
-                (140, BuildingType.TOWER),
-                (205, BuildingType.BARRICADE),
-            ]
-
-            for bx, building_type in building_buttons:
-                if pygame.Rect(bx, content_y, button_size, button_size).collidepoint(mouse_pos):
+            for rect, building_type in self.hud_building_rects:
+                if rect.collidepoint(mouse_pos):
                     self.placing_building = building_type
                     return
 
             # Grid snap toggle button
-            if pygame.Rect(275, content_y, button_size, button_size).collidepoint(mouse_pos):
+            if self.hud_grid_snap_rect.collidepoint(mouse_pos):
                 self._toggle_grid_snap()
                 return
 
         # Command buttons (right side of left panel)
-        cmd_x = 345
 
         # Attack-move button
-        if pygame.Rect(cmd_x, content_y, small_btn, small_btn).collidepoint(mouse_pos):
+        if self.hud_attack_move_rect.collidepoint(mouse_pos):
             if self.selected_units:
                 self.attack_move_mode = not self.attack_move_mode
             return
 
         # Deconstruct button
-        if pygame.Rect(cmd_x + 50, content_y, small_btn, small_btn).collidepoint(mouse_pos):
+        if self.hud_deconstruct_rect.collidepoint(mouse_pos):
             if self.selected_building and self.selected_building.team == Team.PLAYER:
                 self._deconstruct_building(self.selected_building)
             return
 
         # Cancel/Stop button
-        if pygame.Rect(cmd_x + 100, content_y, small_btn, small_btn).collidepoint(mouse_pos):
+        if self.hud_stop_rect.collidepoint(mouse_pos):
             self.placing_building = None
             self.attack_move_mode = False
             for unit in self.selected_units:
@@ -1261,19 +1394,18 @@ class Game:
             return
 
         # Heal toggle button
-        if pygame.Rect(cmd_x + 150, content_y, small_btn, small_btn).collidepoint(mouse_pos):
+        if self.hud_heal_rect.collidepoint(mouse_pos):
             self._toggle_player_healing()
             return
 
         # Menu button
-        if pygame.Rect(cmd_x + 200, content_y, small_btn, small_btn).collidepoint(mouse_pos):
+        if self.hud_menu_rect.collidepoint(mouse_pos):
             self.state = GameState.MAIN_MENU
             self.network.close()
             return
 
         # Select Military button (in selection info area)
-        sel_btn_x = constants.SCREEN_WIDTH - 170
-        if pygame.Rect(sel_btn_x, content_y, 80, small_btn).collidepoint(mouse_pos):
+        if self.hud_select_military_rect.collidepoint(mouse_pos):
             self._select_all_military()
             # Clear selection_start so mouse-up doesn't trigger _finish_selection
             self.selection_start = None
@@ -1306,27 +1438,35 @@ class Game:
         x2 = max(start_world[0], end_world[0])
         y2 = max(start_world[1], end_world[1])
 
-        selection_area = pygame.Rect(x1, y1, x2 - x1, y2 - y1)
+        # Selection area in whole world units, as a Rect would store it
+        sel_x, sel_y = int(x1), int(y1)
+        sel_w, sel_h = int(x2 - x1), int(y2 - y1)
 
         # Small click = single selection
-        if selection_area.width < 10 and selection_area.height < 10:
+        if sel_w < 10 and sel_h < 10:
             # Try to select unit
             for unit in self.units:
-                if unit.team == Team.PLAYER and unit.get_rect().collidepoint(start_world):
+                if unit.team == Team.PLAYER and unit.contains_point(*start_world):
                     unit.selected = True
                     self.selected_units.append(unit)
                     return
 
             # Try to select building
             for building in self.buildings:
-                if building.team == Team.PLAYER and building.get_rect().collidepoint(start_world):
+                if building.team == Team.PLAYER and building.contains_point(*start_world):
                     building.selected = True
                     self.selected_building = building
                     return
         else:
-            # Box selection
+            # Box selection, overlap-tested on raw bounds instead of a Rect per
+            # unit (same rule as Rect.colliderect: strict overlap)
+            sel_right = sel_x + sel_w
+            sel_bottom = sel_y + sel_h
             for unit in self.units:
-                if unit.team == Team.PLAYER and selection_area.colliderect(unit.get_rect()):
+                if unit.team != Team.PLAYER:
+                    continue
+                left, top, w, h = unit.get_bbox()
+                if left < sel_right and left + w > sel_x and top < sel_bottom and top + h > sel_y:
                     unit.selected = True
                     self.selected_units.append(unit)
 
@@ -1342,9 +1482,8 @@ class Game:
             self.selected_building = None
 
         # Select all military units (non-peasants)
-        military_types = {UnitType.KNIGHT, UnitType.CAVALRY, UnitType.CANNON}
         for unit in self.units:
-            if unit.team == Team.PLAYER and unit.unit_type in military_types:
+            if unit.team == Team.PLAYER and unit.unit_type in _MILITARY_TYPES:
                 unit.selected = True
                 self.selected_units.append(unit)
 
@@ -1355,16 +1494,18 @@ class Game:
         friendly_building = None
         under_construction = None
 
-        # Check for enemy unit target
+        world_x, world_y = world_pos
+
+        # Check for enemy unit target (first hit wins)
         for unit in self.units:
-            if unit.team == Team.ENEMY and unit.get_rect().collidepoint(world_pos):
+            if unit.team == Team.ENEMY and unit.contains_point(world_x, world_y):
                 target_unit = unit
                 break
 
         # Check for building target
         if not target_unit:
             for building in self.buildings:
-                if building.get_rect().collidepoint(world_pos):
+                if building.contains_point(world_x, world_y):
                     if building.team == Team.ENEMY:
                         target_building = building
                     elif not building.completed:
@@ -1376,16 +1517,26 @@ class Game:
         # Issue commands
         assigned_workers = []  # Track workers assigned to buildings for network sync
 
+        # Peasants assigned to the clicked building (working or on their way),
+        # gathered once by identity and kept current as selected peasants
+        # leave and join, instead of rescanning all units per peasant
+        assigned_ids = set()
+        if friendly_building:
+            for u in self.units:
+                if u.assigned_building is friendly_building and u.unit_type == UnitType.PEASANT:
+                    assigned_ids.add(id(u))
+
         for unit in self.selected_units:
             # Unassign peasant from current building when given new orders
             if unit.unit_type == UnitType.PEASANT and unit.assigned_building:
+                assigned_ids.discard(id(unit))
                 unit.unassign_from_building()
             if unit.unit_type == UnitType.PEASANT and unit.constructing_building:
                 unit.constructing_building = None
 
             if self.attack_move_mode:
                 # Attack-move: move towards target, attack enemies along the way
-                unit.set_attack_move_target(world_pos[0], world_pos[1])
+                unit.set_attack_move_target(world_x, world_y)
             elif target_unit:
                 unit.set_attack_target(target_unit)
             elif target_building:
@@ -1396,18 +1547,13 @@ class Game:
                 unit.set_move_target(under_construction.x, under_construction.y)
             elif friendly_building and unit.unit_type == UnitType.PEASANT:
                 # Check if building has room for more workers
-                current_workers = friendly_building.count_workers(self.units)
-                max_workers = friendly_building.get_max_workers()
-                # Also count peasants already assigned but not yet working
-                assigned_count = sum(1 for u in self.units
-                                   if u.assigned_building == friendly_building
-                                   and u.unit_type == UnitType.PEASANT)
-                if assigned_count < max_workers:
+                if len(assigned_ids) < friendly_building.get_max_workers():
                     # Assign peasant to work at friendly building
                     unit.assign_to_building(friendly_building)
+                    assigned_ids.add(id(unit))
                     assigned_workers.append((unit.uid, friendly_building.uid))
             else:
-                unit.set_move_target(world_pos[0], world_pos[1])
+                unit.set_move_target(world_x, world_y)
 
         # Reset attack-move mode
         self.attack_move_mode = False
@@ -1438,11 +1584,7 @@ class Game:
             return
 
         # Find player's castle
-        castle = next(
-            (b for b in self.buildings
-             if b.building_type == BuildingType.CASTLE and b.team == Team.PLAYER),
-            None
-        )
+        castle = self._find_castle(Team.PLAYER)
 
         if not castle:
             return
@@ -1450,9 +1592,9 @@ class Game:
         self.player_resources.spend(cost)
 
         # Spawn near castle
-        angle = random.uniform(0, 2 * math.pi)
-        x = castle.x + math.cos(angle) * 80
-        y = castle.y + math.sin(angle) * 80
+        cos_a, sin_a = _SPAWN_DIRECTIONS[int(_random() * _SPAWN_DIRECTION_STEPS)]
+        x = castle.x + cos_a * 80
+        y = castle.y + sin_a * 80
 
         unit = Unit(x, y, unit_type, Team.PLAYER, _mod_manager=self.mod_manager)
         unit.uid = self.next_uid()
@@ -1478,24 +1620,20 @@ class Game:
     def _can_place_building(self, world_pos: Tuple[float, float], building_type: BuildingType) -> bool:
         """Check if a building can be placed at the given position."""
         # Get building size
-        sizes = {
-            BuildingType.HOUSE: (80, 80),
-            BuildingType.CASTLE: (128, 128),
-            BuildingType.FARM: (96, 96),
-            BuildingType.TOWER: (64, 64),
-            BuildingType.BARRICADE: (160, 160)
-        }
-        w, h = sizes.get(building_type, (64, 64))
+        w, h = _PLACEMENT_SIZES.get(building_type, (64, 64))
 
-        # Create a rect for the new building
-        new_rect = pygame.Rect(world_pos[0] - w // 2, world_pos[1] - h // 2, w, h)
+        # Bounds of the new building (runs every frame while placing, so no Rects)
+        new_left = int(world_pos[0] - w // 2)
+        new_top = int(world_pos[1] - h // 2)
+        new_right = new_left + w
+        new_bottom = new_top + h
 
         # Check collision with existing buildings
         for building in self.buildings:
-            existing_rect = building.get_rect()
-            # Add a small margin to prevent buildings from touching
-            existing_rect = existing_rect.inflate(10, 10)
-            if new_rect.colliderect(existing_rect):
+            left, top, bw, bh = building.get_bbox()
+            # Add a small margin (5 per side) to prevent buildings from touching
+            if (new_left < left + bw + 5 and new_right > left - 5 and
+                    new_top < top + bh + 5 and new_bottom > top - 5):
                 return False
 
         # Check map bounds
@@ -1570,9 +1708,9 @@ class Game:
 
         # Unassign any workers from this building
         for unit in self.units:
-            if unit.assigned_building == building:
+            if unit.assigned_building is building:
                 unit.unassign_from_building()
-            if unit.constructing_building == building:
+            if unit.constructing_building is building:
                 unit.constructing_building = None
 
         # Network sync
@@ -1583,8 +1721,8 @@ class Game:
             })
 
         # Remove building
-        self.buildings.remove(building)
-        if self.selected_building == building:
+        _remove_identical(self.buildings, building)
+        if self.selected_building is building:
             self.selected_building = None
 
     # =========================================================================
@@ -1608,6 +1746,10 @@ class Game:
         elif self.state == GameState.MULTIPLAYER_LOBBY:
             self.ip_input.update(self.dt)
 
+        # Send this frame's multiplayer actions as one message
+        if self.network.outbox:
+            self.network.flush_actions()
+
     def _update_game(self):
         """Update game logic."""
         keys = pygame.key.get_pressed()
@@ -1718,11 +1860,7 @@ class Game:
     def _check_raid_game_over(self):
         """Check if player lost in Raid mode."""
         # Player loses if their castle is destroyed
-        player_castle = None
-        for building in self.buildings:
-            if building.team == Team.PLAYER and building.building_type == BuildingType.CASTLE:
-                player_castle = building
-                break
+        player_castle = self._find_castle(Team.PLAYER)
 
         if player_castle is None or player_castle.is_destroyed():
             if self.state != GameState.GAME_OVER:  # Only trigger once
@@ -1737,60 +1875,106 @@ class Game:
         """Update all units."""
         current_time = time.time()
 
-        for unit in self.units[:]:
-            # Check if unit is colliding with a building (70% slow for complete, 40% for incomplete)
-            speed_mult = self._get_building_collision_slowdown(unit)
-
+        # Index unit positions for the nearest-enemy search. Units move at most
+        # one step during this loop, so queries widen by that much and then
+        # check live positions exactly.
+        units = self.units
+        snapshot = units[:]
+        grid = self._unit_grid
+        grid.clear()
+        for i, unit in enumerate(snapshot):
+            grid.insert(i, unit.x, unit.y)
+        frame_scale = self.dt * 60  # Per-frame movement factor shared by every unit
+        move_slack = max((unit.speed for unit in snapshot), default=0) * frame_scale + 1
+        removed = set()  # Snapshot indices of units that died this frame
+
+        # Bind per-frame lookups once; this loop runs for every unit
+        query_circle = grid.query_circle
+        buildings = self.buildings
+        collision_slowdown = self._get_building_collision_slowdown
+        # Building footprints for the movement slowdown, rebuilt only when an
+        # attack below destroys a building
+        obstacles = _building_obstacles(buildings)
+        do_attack = self._do_attack
+        do_attack_building = self._do_attack_building
+
+        for i, unit in enumerate(snapshot):
             # Movement and combat
             if unit.target_x is not None:
-                if unit.target_unit and unit.target_unit.is_alive():
-                    dist = unit.distance_to_unit(unit.target_unit)
-                    if dist <= unit.attack_range:
+                # Units in attack range stand still; everyone else steps
+                # towards their goal, slowed while inside a building footprint.
+                # Target mode is a live unit, else a standing building, else a
+                # position; health is read directly instead of through
+                # is_alive()/is_destroyed() since this runs per moving unit.
+                target_unit = unit.target_unit
+                target_building = unit.target_building
+                if target_unit is not None and target_unit.health > 0:
+                    if unit.distance_sq_to(target_unit.x, target_unit.y) <= unit.attack_range * unit.attack_range:
                         if current_time - unit.last_attack >= unit.attack_cooldown:
-                            self._do_attack(unit, unit.target_unit)
+                            do_attack(unit, target_unit)
                             unit.last_attack = current_time
+                        goal = None
                     else:
-                        unit.move_towards(unit.target_unit.x, unit.target_unit.y, self.dt, speed_mult)
-                elif unit.target_building and not unit.target_building.is_destroyed():
-                    dist = unit.distance_to_building(unit.target_building)
-                    if dist <= unit.attack_range + 50:
+                        goal = (target_unit.x, target_unit.y)
+                elif target_building is not None and target_building.health > 0:
+                    reach = unit.attack_range + 50
+                    if unit.distance_sq_to(target_building.x, target_building.y) <= reach * reach:
                         if current_time - unit.last_attack >= unit.attack_cooldown:
-                            self._do_attack_building(unit, unit.target_building)
+                            do_attack_building(unit, target_building)
                             unit.last_attack = current_time
+                            if target_building.health <= 0:
+                                obstacles = _building_obstacles(buildings)
+                        goal = None
                     else:
-                        unit.move_towards(unit.target_building.x, unit.target_building.y, self.dt, speed_mult)
+                        goal = (target_building.x, target_building.y)
                 else:
-                    unit.move_towards(unit.target_x, unit.target_y, self.dt, speed_mult)
+                    goal = (unit.target_x, unit.target_y)
+                if goal is not None:
+                    max_step = unit.speed * collision_slowdown(unit, obstacles) * frame_scale
+                    unit.step_towards(goal[0], goal[1], max_step)
 
             # Auto-attack nearby enemies (military units are more aggressive)
             if unit.target_unit is None and unit.target_building is None:
                 # Military units (knights, cavalry, cannons) have larger aggro range
-                is_military = unit.unit_type in [UnitType.KNIGHT, UnitType.CAVALRY, UnitType.CANNON]
+                is_military = unit.unit_type in _MILITARY_TYPES
                 # Attack-move units always look for targets
                 is_attack_moving = unit.attack_move_target is not None
                 aggro_range = unit.attack_range * 4 if is_attack_moving else (
                     unit.attack_range * 3 if is_military else unit.attack_range * 1.5
                 )
 
-                # Find nearest enemy in range
+                # Find nearest enemy in range (lower list index breaks ties, so
+                # the unordered grid result needs no sort); compared as squared
+                # distances to skip the sqrt
+                aggro_range_sq = aggro_range * aggro_range
+                my_team = unit.team
+                ux, uy = unit.x, unit.y
                 nearest_enemy = None
-                nearest_dist = float('inf')
-                for other in self.units:
-                    if other.team != unit.team:
-                        dist = unit.distance_to_unit(other)
-                        if dist <= aggro_range and dist < nearest_dist:
-                            nearest_dist = dist
-                            nearest_enemy = other
+                nearest_dist_sq = aggro_range_sq
+                nearest_j = -1
+                for j in query_circle(ux, uy, aggro_range + move_slack):
+                    other = snapshot[j]
+                    if other.team == my_team or j in removed:
+                        continue
+                    dx = ux - other.x
+                    dy = uy - other.y
+                    dist_sq = dx * dx + dy * dy
+                    if dist_sq < nearest_dist_sq or (dist_sq == nearest_dist_sq and
+                                                     (nearest_enemy is None or j < nearest_j)):
+                        nearest_dist_sq = dist_sq
+                        nearest_enemy = other
+                        nearest_j = j
 
                 if nearest_enemy:
                     # Save attack-move target so we can resume after killing
                     unit.set_attack_target(nearest_enemy)
                 # Military units and attack-moving units also attack nearby buildings
                 elif (is_military or is_attack_moving) and not unit.assigned_building:
-                    for building in self.buildings:
-                        if building.team != unit.team:
-                            dist = unit.distance_to_building(building)
-                            if dist <= unit.attack_range * 2:
+                    reach = unit.attack_range * 2
+                    reach_sq = reach * reach
+                    for building in buildings:
+                        if building.team != my_team:
+                            if unit.distance_sq_to(building.x, building.y) <= reach_sq:
                                 unit.set_building_target(building)
                                 break
 
@@ -1802,21 +1986,25 @@ class Game:
                         unit.target_x, unit.target_y = unit.attack_move_target
                     # Check if reached destination
                     dest_x, dest_y = unit.attack_move_target
-                    if unit.distance_to(dest_x, dest_y) < 20:
+                    if unit.distance_sq_to(dest_x, dest_y) < 400:
                         unit.attack_move_target = None
 
-            # Remove dead units
-            if not unit.is_alive():
-                self.blood_effects.append(BloodEffect(unit.x, unit.y))
-                self.units.remove(unit)
-                for u in self.units:
-                    if u.target_unit == unit:
+            # Collect dead units; they are compacted out in one pass below
+            if unit.health <= 0:
+                self._spawn_blood(unit.x, unit.y)
+                removed.add(i)
+                for u in units:
+                    if u.target_unit is unit:
                         u.target_unit = None
 
+        if removed:
+            dead = {id(snapshot[i]) for i in removed}
+            units[:] = [u for u in units if id(u) not in dead]
+
     def _do_attack(self, attacker: Unit, defender: Unit):
         """Perform an attack."""
         damage = max(1, attacker.attack - defender.defense // 2)
-        damage = int(damage * random.uniform(0.8, 1.2))
+        damage = int(damage * (_DAMAGE_ROLL_MIN + _DAMAGE_ROLL_SPAN * _random()))
 
         # Cannons fire projectiles instead of instant damage
         if attacker.unit_type == UnitType.CANNON:
@@ -1832,14 +2020,14 @@ class Game:
                 size=5
             )
             self.projectiles.append(projectile)
-            self.play_sound('cannon')
+            self._queue_sound('cannon')
         else:
             killed = defender.take_damage(damage)
-            self.blood_effects.append(BloodEffect(defender.x, defender.y, 0.5, 0.5))
-            self.play_sound('sword')
+            self._spawn_blood(defender.x, defender.y, 0.5)
+            self._queue_sound('sword')
 
             if killed:
-                self.play_sound('death')
+                self._queue_sound('death')
 
             # Sync damage/death in multiplayer (only when our units attack enemy units)
             if self.is_multiplayer and self.network.connected and attacker.team == Team.PLAYER:
@@ -1871,7 +2059,7 @@ class Game:
                 size=5
             )
             self.projectiles.append(projectile)
-            self.play_sound('cannon')
+            self._queue_sound('cannon')
             return  # Don't apply instant damage
 
         destroyed = building.take_damage(damage)
@@ -1884,113 +2072,142 @@ class Game:
                 self.network.send_building_damage(building.uid, building.health)
 
         if destroyed:
-            self.buildings.remove(building)
+            _remove_identical(self.buildings, building)
             for u in self.units:
-                if u.target_building == building:
+                if u.target_building is building:
                     u.target_building = None
 
-    def _get_building_collision_slowdown(self, unit: Unit) -> float:
+    def _get_building_collision_slowdown(self, unit: Unit, obstacles: list = None) -> float:
         """Check if a unit is colliding with any building and return speed multiplier.
 
+        Args:
+            unit: Unit to check
+            obstacles: Precomputed _building_obstacles() table; built from
+                self.buildings when omitted
+
         Returns:
             1.0 if no collision, varies based on building type and team
         """
+        if obstacles is None:
+            obstacles = _building_obstacles(self.buildings)
         unit_radius = unit.get_collision_radius()
+        ux, uy = unit.x, unit.y
 
-        for building in self.buildings:
-            bw, bh = building.get_size()
-            building_radius = max(bw, bh) * 0.4  # Slightly smaller than visual
+        for bx, by, building_radius, team, same_mult, other_mult in obstacles:
             min_dist = unit_radius + building_radius
-
-            dx = unit.x - building.x
-            dy = unit.y - building.y
-            dist = math.sqrt(dx * dx + dy * dy)
-
-            if dist < min_dist:
-                # Barricades only slow same-team units by 40% (0.6 multiplier)
-                if building.building_type == BuildingType.BARRICADE:
-                    if unit.team == building.team:
-                        return 0.6  # 40% slowdown for friendly units
-                    else:
-                        return 0.3  # 70% slowdown for enemies
-                # Other buildings: 70% slow for completed, 40% for incomplete
-                return 0.3 if building.completed else 0.6
+            dx = ux - bx
+            dy = uy - by
+            if dx * dx + dy * dy < min_dist * min_dist:
+                return same_mult if unit.team == team else other_mult
         return 1.0
 
     def _update_unit_collisions(self):
         """Apply soft collision between units to push them apart."""
         push_strength = 2.0  # How strongly units push each other
-
-        for i, unit in enumerate(self.units):
+        # Each unit of an overlapping pair gets half the push force
+        half_push_factor = push_strength * self.dt * 60 * 0.5
+        min_x, max_x = 20, MAP_WIDTH - 20
+        min_y, max_y = 20, MAP_HEIGHT - 20
+
+        units = self.units
+        radii = [unit.get_collision_radius() for unit in units]
+        max_radius = max(radii, default=0.0)
+        n = len(units)
+
+        # Bucket units by position so each unit only checks nearby ones; the
+        # grid is kept current as pushes move units
+        grid = self._collision_grid
+        grid.clear()
+        for i, unit in enumerate(units):
+            grid.insert(i, unit.x, unit.y)
+
+        for i in range(n):
+            unit = units[i]
+            # Unit i is only moved by later pairs after its own pass, so its
+            # position is fixed for the inner loop
+            ux = unit.x
+            uy = unit.y
+            unit_radius = radii[i]
             push_x = 0.0
             push_y = 0.0
 
-            unit_radius = unit.get_collision_radius()
-
-            # Check against other units
-            for j, other in enumerate(self.units):
-                if i >= j:  # Skip self and already-checked pairs
+            # Check against later units (earlier pairs were already handled),
+            # in list order so pushes accumulate exactly as a full scan would
+            reach = unit_radius + max_radius
+            nearby = [j for j in grid.query_rect(ux - reach, uy - reach, ux + reach, uy + reach)
+                      if j > i]
+            nearby.sort()
+            for j in nearby:
+                min_dist = unit_radius + radii[j]
+                other = units[j]
+                dx = ux - other.x
+                if dx >= min_dist or dx <= -min_dist:
+                    continue
+                dy = uy - other.y
+                if dy >= min_dist or dy <= -min_dist:
+                    continue
+                dist_sq = dx * dx + dy * dy
+                if dist_sq >= min_dist * min_dist or dist_sq <= 0.01:
                     continue
 
-                other_radius = other.get_collision_radius()
-                min_dist = unit_radius + other_radius
-
-                dx = unit.x - other.x
-                dy = unit.y - other.y
-                dist = math.sqrt(dx * dx + dy * dy)
-
-                if dist < min_dist and dist > 0.1:
-                    # Units are overlapping - calculate push
-                    overlap = min_dist - dist
-                    # Normalize direction
-                    nx = dx / dist
-                    ny = dy / dist
-                    # Push force (stronger when more overlap)
-                    push_force = overlap * push_strength * self.dt * 60
-
-                    # Apply half push to each unit (equal and opposite)
-                    half_push = push_force * 0.5
-                    push_x += nx * half_push
-                    push_y += ny * half_push
-
-                    # Push the other unit in opposite direction
-                    other.x -= nx * half_push
-                    other.y -= ny * half_push
-                    # Clamp other to map bounds
-                    other.x = max(20, min(MAP_WIDTH - 20, other.x))
-                    other.y = max(20, min(MAP_HEIGHT - 20, other.y))
+                # Units are overlapping - push harder the more they overlap
+                dist = math.sqrt(dist_sq)
+                half_push = (min_dist - dist) * half_push_factor
+                nx = dx / dist * half_push
+                ny = dy / dist * half_push
+                push_x += nx
+                push_y += ny
+
+                # Push the other unit in opposite direction, clamped to map bounds
+                ox = other.x - nx
+                oy = other.y - ny
+                other.x = min_x if ox < min_x else (max_x if ox > max_x else ox)
+                other.y = min_y if oy < min_y else (max_y if oy > max_y else oy)
+                grid.move(j, other.x, other.y)
 
             # Apply accumulated push (from unit-to-unit collisions only)
-            unit.x += push_x
-            unit.y += push_y
-            # Clamp to map bounds
-            unit.x = max(20, min(MAP_WIDTH - 20, unit.x))
-            unit.y = max(20, min(MAP_HEIGHT - 20, unit.y))
+            x = ux + push_x
+            y = uy + push_y
+            unit.x = min_x if x < min_x else (max_x if x > max_x else x)
+            unit.y = min_y if y < min_y else (max_y if y > max_y else y)
+            grid.move(i, unit.x, unit.y)
 
     def _update_workers(self):
-        """Update worker status for all peasants."""
+        """Update worker status for all peasants and tally workers and builders per building.
+
+        The builder tally is consumed by _update_construction, which runs next
+        in the same frame, so construction needs no scan of its own.
+        """
+        # Buildings compare field-by-field, so check existence by identity
+        live_buildings = set()
+        for building in self.buildings:
+            building.worker_count = 0
+            building.builder_count = 0
+            live_buildings.add(id(building))
+
         for unit in self.units:
             if unit.unit_type == UnitType.PEASANT:
                 # Check if assigned building still exists
-                if unit.assigned_building and unit.assigned_building not in self.buildings:
+                if unit.assigned_building and id(unit.assigned_building) not in live_buildings:
                     unit.unassign_from_building()
                 # Check if constructing building still exists
-                if unit.constructing_building and unit.constructing_building not in self.buildings:
-                    unit.constructing_building = None
+                constructing = unit.constructing_building
+                if constructing and id(constructing) not in live_buildings:
+                    unit.constructing_building = constructing = None
+                # Count builders in range of their construction site
+                if constructing and unit.distance_sq_to(constructing.x, constructing.y) <= WORKER_RANGE_SQ:
+                    constructing.builder_count += 1
                 # Update work status
                 unit.update_work_status()
+                if unit.is_working and unit.assigned_building.team == unit.team:
+                    unit.assigned_building.worker_count += 1
 
     def _update_construction(self):
         """Update building construction progress."""
         for building in self.buildings:
             if not building.completed and building.team == Team.PLAYER:
-                # Count peasants constructing this building
-                builders = 0
-                for unit in self.units:
-                    if (unit.unit_type == UnitType.PEASANT and
-                        unit.constructing_building == building and
-                        unit.distance_to_building(building) <= WORKER_RANGE):
-                        builders += 1
+                # Peasants constructing this building (tallied by _update_workers)
+                builders = building.builder_count
 
                 if builders > 0:
                     # Each builder adds progress (more builders = faster)
@@ -2005,7 +2222,7 @@ class Game:
                         building.completed = True
                         # Unassign builders
                         for unit in self.units:
-                            if unit.constructing_building == building:
+                            if unit.constructing_building is building:
                                 unit.constructing_building = None
 
                     # Sync construction progress in multiplayer (only for our buildings)
@@ -2024,7 +2241,7 @@ class Game:
                 continue
 
             # Check if tower has 2 workers (required to operate)
-            worker_count = building.count_workers(self.units)
+            worker_count = building.count_workers()
             if worker_count < 2:
                 continue
 
@@ -2066,66 +2283,71 @@ class Game:
 
     def _update_projectiles(self):
         """Update all projectiles and handle hits."""
-        for projectile in self.projectiles[:]:
+        dt = self.dt
+        projectiles = self.projectiles
+        in_flight = []  # Rebuilt in order instead of removing hits one by one
+        for projectile in projectiles:
             # Update projectile position
-            hit = projectile.update(self.dt)
+            hit = projectile.update(dt)
 
-            if hit:
-                # Projectile reached target
-                self.projectiles.remove(projectile)
+            if not hit:
+                in_flight.append(projectile)
+                continue
 
-                # Check if target is still valid
-                if projectile.target_unit and projectile.target_unit.is_alive():
-                    # Tower projectiles have 70% hit chance, cannon projectiles always hit
-                    should_hit = True
-                    if projectile.is_tower_projectile:
-                        should_hit = random.random() < TOWER_STATS['hit_chance']
+            # Projectile reached target; check if target is still valid
+            if projectile.target_unit and projectile.target_unit.is_alive():
+                # Tower projectiles have 70% hit chance, cannon projectiles always hit
+                should_hit = True
+                if projectile.is_tower_projectile:
+                    should_hit = _random() < TOWER_STATS['hit_chance']
+
+                if should_hit:
+                    killed = projectile.target_unit.take_damage(projectile.damage)
+                    if killed:
+                        # Target killed
+                        self._spawn_blood(projectile.target_unit.x, projectile.target_unit.y)
+                        self._queue_sound('death')
+                        if _remove_identical(self.units, projectile.target_unit):
+                            for u in self.units:
+                                if u.target_unit is projectile.target_unit:
+                                    u.target_unit = None
+                    else:
+                        # Hit but not killed
+                        self._spawn_blood(projectile.target_unit.x, projectile.target_unit.y, 0.5)
 
-                    if should_hit:
-                        killed = projectile.target_unit.take_damage(projectile.damage)
+                    # Sync damage/death in multiplayer (only for our projectiles)
+                    if self.is_multiplayer and self.network.connected and projectile.team == Team.PLAYER:
                         if killed:
-                            # Target killed
-                            self.blood_effects.append(BloodEffect(projectile.target_unit.x, projectile.target_unit.y))
-                            self.play_sound('death')
-                            if projectile.target_unit in self.units:
-                                self.units.remove(projectile.target_unit)
-                                for u in self.units:
-                                    if u.target_unit == projectile.target_unit:
-                                        u.target_unit = None
+                            self.network.send_unit_death(projectile.target_unit.uid)
                         else:
-                            # Hit but not killed
-                            self.blood_effects.append(BloodEffect(projectile.target_unit.x, projectile.target_unit.y, 0.5, 0.5))
+                            self.network.send_unit_damage(projectile.target_unit.uid, projectile.target_unit.health)
 
-                        # Sync damage/death in multiplayer (only for our projectiles)
-                        if self.is_multiplayer and self.network.connected and projectile.team == Team.PLAYER:
-                            if killed:
-                                self.network.send_unit_death(projectile.target_unit.uid)
-                            else:
-                                self.network.send_unit_damage(projectile.target_unit.uid, projectile.target_unit.health)
+            elif projectile.target_building and not projectile.target_building.is_destroyed():
+                # Cannon projectile hitting building
+                destroyed = projectile.target_building.take_damage(projectile.damage)
+
+                # Sync damage/destruction in multiplayer (only for our projectiles)
+                if self.is_multiplayer and self.network.connected and projectile.team == Team.PLAYER:
+                    if destroyed:
+                        self.network.send_building_destroyed(projectile.target_building.uid)
+                    else:
+                        self.network.send_building_damage(projectile.target_building.uid, projectile.target_building.health)
 
-                elif projectile.target_building and not projectile.target_building.is_destroyed():
-                    # Cannon projectile hitting building
-                    destroyed = projectile.target_building.take_damage(projectile.damage)
+                if destroyed:
+                    if _remove_identical(self.buildings, projectile.target_building):
+                        for u in self.units:
+                            if u.target_building is projectile.target_building:
+                                u.target_building = None
 
-                    # Sync damage/destruction in multiplayer (only for our projectiles)
-                    if self.is_multiplayer and self.network.connected and projectile.team == Team.PLAYER:
-                        if destroyed:
-                            self.network.send_building_destroyed(projectile.target_building.uid)
-                        else:
-                            self.network.send_building_damage(projectile.target_building.uid, projectile.target_building.health)
+        projectiles[:] = in_flight
 
-                    if destroyed:
-                        if projectile.target_building in self.buildings:
-                            self.buildings.remove(projectile.target_building)
-                            for u in self.units:
-                                if u.target_building == projectile.target_building:
-                                    u.target_building = None
+    def _spawn_blood(self, x: float, y: float, lifetime: float = 1.0):
+        """Add a blood effect, reusing an expired one when possible."""
+        self.blood_effects.append(self._blood_pool.spawn(x, y, lifetime))
 
     def _update_effects(self):
-        """Update visual effects."""
-        for effect in self.blood_effects[:]:
-            if effect.update(self.dt):
-                self.blood_effects.remove(effect)
+        """Update visual effects, returning expired ones to the pool."""
+        self._blood_pool.update_all(self.blood_effects, self.dt)
 
     def _update_resources(self):
         """Update resource generation based on workers at buildings."""
@@ -2133,26 +2355,29 @@ class Game:
         if self.resource_timer >= RESOURCE_TICK_INTERVAL:
             self.resource_timer = 0
 
+            # Sum generation per team, then credit each team once
+            player_gold = player_food = player_wood = 0
+            enemy_gold = enemy_food = enemy_wood = 0
             for building in self.buildings:
-                # Only completed buildings generate resources
-                if not building.completed:
+                # Only completed buildings generate resources, and only with
+                # workers (worker_count is tallied by _update_workers this frame)
+                if not building.completed or not building.worker_count:
                     continue
 
                 # Get resource generation based on workers
-                gen = building.get_resource_generation(self.units)
+                gold, food, wood = building.get_resource_amounts()
 
                 if building.team == Team.PLAYER:
-                    self.player_resources.add(
-                        gold=gen.get('gold', 0),
-                        food=gen.get('food', 0),
-                        wood=gen.get('wood', 0)
-                    )
+                    player_gold += gold
+                    player_food += food
+                    player_wood += wood
                 else:
-                    self.enemy_resources.add(
-                        gold=gen.get('gold', 0),
-                        food=gen.get('food', 0),
-                        wood=gen.get('wood', 0)
-                    )
+                    enemy_gold += gold
+                    enemy_food += food
+                    enemy_wood += wood
+
+            self.player_resources.add(gold=player_gold, food=player_food, wood=player_wood)
+            self.enemy_resources.add(gold=enemy_gold, food=enemy_food, wood=enemy_wood)
 
     def _update_food_consumption(self):
         """Update food consumption and starvation."""
@@ -2160,29 +2385,34 @@ class Game:
         if self.food_timer >= FOOD_CONSUMPTION_INTERVAL:
             self.food_timer = 0
 
-            # Count units per team
-            player_units = [u for u in self.units if u.team == Team.PLAYER]
-            enemy_units = [u for u in self.units if u.team == Team.ENEMY]
+            # Count units per team in one pass (no per-team lists)
+            player_count = 0
+            for unit in self.units:
+                if unit.team == Team.PLAYER:
+                    player_count += 1
+            enemy_count = len(self.units) - player_count
 
             # Player food consumption
-            player_food_needed = len(player_units) * FOOD_PER_UNIT
-            if self.player_resources.food >= player_food_needed:
-                self.player_resources.food -= player_food_needed
-            else:
-                # Starvation! Units take damage
+            player_food_needed = player_count * FOOD_PER_UNIT
+            player_starving = self.player_resources.food < player_food_needed
+            if player_starving:
                 self.player_resources.food = 0
-                for unit in player_units:
-                    unit.take_damage(STARVATION_DAMAGE)
+            else:
+                self.player_resources.food -= player_food_needed
 
             # Enemy food consumption
-            enemy_food_needed = len(enemy_units) * FOOD_PER_UNIT
-            if self.enemy_resources.food >= enemy_food_needed:
-                self.enemy_resources.food -= enemy_food_needed
-            else:
-                # Enemy starvation
+            enemy_food_needed = enemy_count * FOOD_PER_UNIT
+            enemy_starving = self.enemy_resources.food < enemy_food_needed
+            if enemy_starving:
                 self.enemy_resources.food = 0
-                for unit in enemy_units:
-                    unit.take_damage(STARVATION_DAMAGE)
+            else:
+                self.enemy_resources.food -= enemy_food_needed
+
+            # Starvation! Units of a starving team take damage
+            if player_starving or enemy_starving:
+                for unit in self.units:
+                    if player_starving if unit.team == Team.PLAYER else enemy_starving:
+                        unit.take_damage(STARVATION_DAMAGE)
 
     def _update_barricade_repairs(self):
         """Update barricade repairs by workers using wood."""
@@ -2201,7 +2431,7 @@ class Game:
                 continue
 
             # Check if there's a worker assigned
-            workers = building.count_workers(self.units)
+            workers = building.count_workers()
             if workers == 0:
                 continue
 
@@ -2315,15 +2545,11 @@ class Game:
                     unit_type = UnitType[unit_type_name.upper()]
 
                     # Find enemy castle
-                    castle = next(
-                        (b for b in self.buildings
-                         if b.building_type == BuildingType.CASTLE and b.team == Team.ENEMY),
-                        None
-                    )
+                    castle = self._find_castle(Team.ENEMY)
                     if castle:
-                        angle = random.uniform(0, 2 * math.pi)
-                        x = castle.x + math.cos(angle) * 80
-                        y = castle.y + math.sin(angle) * 80
+                        cos_a, sin_a = _SPAWN_DIRECTIONS[int(_random() * _SPAWN_DIRECTION_STEPS)]
+                        x = castle.x + cos_a * 80
+                        y = castle.y + sin_a * 80
 
                         unit = Unit(x, y, unit_type, Team.ENEMY, _mod_manager=self.mod_manager)
                         # Translate the UID from peer
@@ -2358,11 +2584,11 @@ class Game:
                     if building:
                         # Unassign workers
                         for unit in self.units:
-                            if unit.assigned_building == building:
+                            if unit.assigned_building is building:
                                 unit.unassign_from_building()
-                            if unit.constructing_building == building:
+                            if unit.constructing_building is building:
                                 unit.constructing_building = None
-                        self.buildings.remove(building)
+                        _remove_identical(self.buildings, building)
 
                 elif command == 'unit_death':
                     # Handle unit death from peer - translate UID
@@ -2371,11 +2597,10 @@ class Game:
                         (u for u in self.units if u.uid == translated_uid), None
                     )
                     if unit:
-                        self.blood_effects.append(BloodEffect(unit.x, unit.y))
-                        if unit in self.units:
-                            self.units.remove(unit)
+                        self._spawn_blood(unit.x, unit.y)
+                        _remove_identical(self.units, unit)
                         for u in self.units:
-                            if u.target_unit == unit:
+                            if u.target_unit is unit:
                                 u.target_unit = None
 
                 elif command == 'building_destroyed':
@@ -2386,14 +2611,13 @@ class Game:
                     )
                     if building:
                         for unit in self.units:
-                            if unit.assigned_building == building:
+                            if unit.assigned_building is building:
                                 unit.unassign_from_building()
-                            if unit.constructing_building == building:
+                            if unit.constructing_building is building:
                                 unit.constructing_building = None
-                            if unit.target_building == building:
+                            if unit.target_building is building:
                                 unit.target_building = None
-                        if building in self.buildings:
-                            self.buildings.remove(building)
+                        _remove_identical(self.buildings, building)
 
                 elif command == 'unit_damage':
                     # Sync unit health - translate UID
@@ -2423,16 +2647,28 @@ class Game:
                         building.build_progress = data['progress']
                         building.completed = data['completed']
 
+    def _find_castle(self, team: Team) -> Optional[Building]:
+        """
+        Find a team's first castle.
+
+        Castles are placed before anything else, so the scan normally stops
+        within the first couple of buildings.
+
+        Args:
+            team: Team whose castle to find
+
+        Returns:
+            The castle, or None if the team has none
+        """
+        for building in self.buildings:
+            if building.building_type == BuildingType.CASTLE and building.team == team:
+                return building
+        return None
+
     def _check_game_over(self):
         """Check win/lose conditions."""
-        player_castle = any(
-            b for b in self.buildings
-            if b.building_type == BuildingType.CASTLE and b.team == Team.PLAYER
-        )
-        enemy_castle = any(
-            b for b in self.buildings
-            if b.building_type == BuildingType.CASTLE and b.team == Team.ENEMY
-        )
+        player_castle = self._find_castle(Team.PLAYER)
+        enemy_castle = self._find_castle(Team.ENEMY)
 
         if not player_castle or not enemy_castle:
             if self.state != GameState.GAME_OVER:  # Only trigger once
@@ -2462,6 +2698,8 @@ class Game:
 
     def draw(self):
         """Draw the game."""
+        if self._pending_sounds:
+            self._play_pending_sounds()
         if self.state == GameState.MAIN_MENU:
             self._draw_main_menu()
         elif self.state == GameState.PLAYING:
@@ -3021,49 +3259,94 @@ class Game:
         self._draw_minimap()
 
     def _draw_terrain(self):
-        """Draw terrain tiles."""
+        """Draw terrain as one blit of the pre-tiled background, aligned to the tile grid."""
         grass = self.assets.get('terrain_grass')
         scale = self.camera.scale
+        if grass is not self._terrain_background_source or scale != self._terrain_background_scale:
+            self._terrain_background = self._build_terrain_background(grass, scale)
+            self._terrain_background_source = grass
+            self._terrain_background_scale = scale
+
+        # Snap to the tile containing the viewport's top-left corner; the
+        # background extends one tile past the viewport to cover the offset
+        origin_x = int(self.camera.x // TILE_SIZE) * TILE_SIZE
+        origin_y = int(self.camera.y // TILE_SIZE) * TILE_SIZE
+        self.screen.blit(self._terrain_background, self.camera.world_to_screen(origin_x, origin_y))
+
+    def _build_terrain_background(self, grass: pygame.Surface, scale: float) -> pygame.Surface:
+        """
+        Render grass tiles over a viewport-plus-one-tile area at the given screen scale.
 
+        The map uses a single tile type, so the same background serves every
+        camera position once aligned to the tile grid.
+
+        Args:
+            grass: Unscaled grass tile
+            scale: World-to-screen scale factor
+
+        Returns:
+            Opaque surface covering the viewport plus one tile in each direction
+        """
         # Scale tile if needed
         if scale != 1.0:
             scaled_size = int(TILE_SIZE * scale)
             grass = pygame.transform.scale(grass, (scaled_size, scaled_size))
-        else:
-            scaled_size = TILE_SIZE
-
-        start_x = int(self.camera.x // TILE_SIZE) * TILE_SIZE
-        start_y = int(self.camera.y // TILE_SIZE) * TILE_SIZE
 
-        # Use the viewport size (in world units) for iteration
-        for y in range(start_y, int(start_y + self.camera.height + TILE_SIZE * 2), TILE_SIZE):
-            for x in range(start_x, int(start_x + self.camera.width + TILE_SIZE * 2), TILE_SIZE):
-                screen_pos = self.camera.world_to_screen(x, y)
-                self.screen.blit(grass, screen_pos)
+        width = (-(-self.camera.width // TILE_SIZE) + 1) * TILE_SIZE
+        height = (-(-self.camera.height // TILE_SIZE) + 1) * TILE_SIZE
+        background = pygame.Surface((int(width * scale), int(height * scale))).convert()
+        background.blits([(grass, (int(x * scale), int(y * scale)))
+                          for y in range(0, height, TILE_SIZE)
+                          for x in range(0, width, TILE_SIZE)],
+                         doreturn=False)
+        return background
 
-    def _draw_units(self):
-        """Draw all units."""
-        scale = self.camera.scale
-        for unit in self.units:
-            screen_pos = self.camera.world_to_screen(unit.x, unit.y)
-
-            # Get sprite and scale it
-            asset_name = get_unit_asset_name(unit.unit_type)
-            sprite = self.assets.get(asset_name)
+    def _visible_entities(self, entities: list, margin: int) -> list:
+        """
+        Get the entities near the viewport, keeping list (draw) order.
 
-            # Scale sprite if needed
-            if scale != 1.0:
-                new_size = (int(sprite.get_width() * scale), int(sprite.get_height() * scale))
-                sprite = pygame.transform.scale(sprite, new_size)
+        Selected entities are always kept so their range indicators still draw.
 
-            # Tint enemy units
-            if unit.team == Team.ENEMY:
-                sprite = sprite.copy()
-                sprite.fill((255, 100, 100), special_flags=pygame.BLEND_MULT)
+        Args:
+            entities: Units or buildings to cull
+            margin: World-space margin covering sprite half-size
 
-            rect = sprite.get_rect(center=screen_pos)
-            self.screen.blit(sprite, rect)
+        Returns:
+            Entities to draw this frame
+        """
+        grid = self._render_grid
+        grid.clear()
+        for i, entity in enumerate(entities):
+            grid.insert(i, entity.x, entity.y)
+        visible = self.camera.visible_ids(grid, margin)
+        return [e for i, e in enumerate(entities) if i in visible or e.selected]
 
+    def _draw_units(self):
+        """Draw all units: sprites in one batched blit, then indicators and health bars."""
+        scale = self.camera.scale
+        units = self._visible_entities(self.units, 50)
+        screen_positions = self.camera.world_to_screen_batch([(u.x, u.y) for u in units])
+
+        # Scaled (and enemy-tinted) sprites come from the asset cache; look
+        # each one up once per frame with its half size for centering
+        sprites = {}
+        blits = []
+        for unit, (sx, sy) in zip(units, screen_positions):
+            key = (unit.unit_type, unit.team == Team.ENEMY)
+            entry = sprites.get(key)
+            if entry is None:
+                asset_name = get_unit_asset_name(unit.unit_type)
+                w, h = self.assets.get(asset_name).get_size()
+                if scale != 1.0:
+                    w, h = int(w * scale), int(h * scale)
+                sprite = self.assets.get_tinted(asset_name, (w, h), RED_TINT if key[1] else None)
+                entry = sprites[key] = (sprite, w // 2, h // 2)
+            sprite, half_w, half_h = entry
+            blits.append((sprite, (sx - half_w, sy - half_h)))
+        if blits:
+            _blit_batch(self.screen, blits)
+
+        for unit, screen_pos in zip(units, screen_positions):
             # Selection indicator
             if unit.selected:
                 pygame.draw.circle(self.screen, GREEN, screen_pos, int(30 * scale), 2)
@@ -3108,29 +3391,33 @@ class Game:
                           int(40 * scale), int(6 * scale), int(-25 * scale))
 
     def _draw_buildings(self):
-        """Draw all buildings."""
+        """Draw all buildings: sprites in one batched blit, then indicators and bars."""
         scale = self.camera.scale
-        for building in self.buildings:
-            screen_pos = self.camera.world_to_screen(building.x, building.y)
-
-            asset_name = get_building_asset_name(building.building_type)
-            sprite = self.assets.get(asset_name).copy()
-
-            # Scale sprite if needed
-            if scale != 1.0:
-                new_size = (int(sprite.get_width() * scale), int(sprite.get_height() * scale))
-                sprite = pygame.transform.scale(sprite, new_size)
-
-            # Make incomplete buildings semi-transparent
-            if not building.completed:
-                sprite.set_alpha(128)
-
-            if building.team == Team.ENEMY:
-                sprite.fill((255, 100, 100), special_flags=pygame.BLEND_MULT)
-
-            rect = sprite.get_rect(center=screen_pos)
-            self.screen.blit(sprite, rect)
-
+        buildings = self._visible_entities(self.buildings, 100)
+        screen_positions = self.camera.world_to_screen_batch([(b.x, b.y) for b in buildings])
+
+        # Incomplete buildings are semi-transparent and enemy ones tinted; the
+        # prepared sprites are cached by the asset manager
+        sprites = {}
+        rects = []
+        blits = []
+        for building, (sx, sy) in zip(buildings, screen_positions):
+            key = (building.building_type, building.team == Team.ENEMY, building.completed)
+            sprite = sprites.get(key)
+            if sprite is None:
+                asset_name = get_building_asset_name(building.building_type)
+                w, h = self.assets.get(asset_name).get_size()
+                if scale != 1.0:
+                    w, h = int(w * scale), int(h * scale)
+                sprite = sprites[key] = self.assets.get_tinted(
+                    asset_name, (w, h), RED_TINT if key[1] else None, None if key[2] else 128)
+            rect = sprite.get_rect(center=(sx, sy))
+            rects.append(rect)
+            blits.append((sprite, rect.topleft))
+        if blits:
+            _blit_batch(self.screen, blits)
+
+        for building, screen_pos, rect in zip(buildings, screen_positions, rects):
             if building.selected:
                 pygame.draw.rect(self.screen, GREEN, rect.inflate(int(10 * scale), int(10 * scale)), 3)
 
@@ -3166,7 +3453,7 @@ class Game:
                 self.screen.blit(text_surf, text_rect)
             # Draw worker count for completed player buildings
             elif building.team == Team.PLAYER and building.completed:
-                workers = building.count_workers(self.units)
+                workers = building.count_workers()
                 max_workers = building.get_max_workers()
                 if max_workers > 0:
                     # Worker indicator
@@ -3188,24 +3475,36 @@ class Game:
     def _draw_effects(self):
         """Draw visual effects."""
         scale = self.camera.scale
-        for effect in self.blood_effects:
-            screen_pos = self.camera.world_to_screen(effect.x, effect.y)
-            blood = self.assets.get('effect_blood').copy()
-
-            # Scale if needed
-            if scale != 1.0:
-                new_size = (int(blood.get_width() * scale), int(blood.get_height() * scale))
-                blood = pygame.transform.scale(blood, new_size)
+        positions = [(e.x, e.y) for e in self.blood_effects]
+        visible = self.camera.cull_entities(positions)
+        effects = [self.blood_effects[i] for i in visible]
+        if not effects:
+            return
+        screen_positions = self.camera.world_to_screen_batch([positions[i] for i in visible])
 
+        # Scale the sprite once per frame (cached across frames) rather than
+        # copying and scaling it per effect. The one copy is ours to set_alpha
+        # on, since the scaled cache is shared.
+        base = self.assets.get('effect_blood')
+        size = base.get_size()
+        if scale != 1.0:
+            size = (int(size[0] * scale), int(size[1] * scale))
+        blood = self.assets.get_scaled('effect_blood', size).copy()
+        half_w = blood.get_width() // 2
+        half_h = blood.get_height() // 2
+        blit = self.screen.blit
+        for effect, (sx, sy) in zip(effects, screen_positions):
             blood.set_alpha(effect.get_alpha())
-            rect = blood.get_rect(center=screen_pos)
-            self.screen.blit(blood, rect)
+            blit(blood, (sx - half_w, sy - half_h))
 
     def _draw_projectiles(self):
         """Draw all projectiles as small black dots."""
         scale = self.camera.scale
-        for projectile in self.projectiles:
-            screen_pos = self.camera.world_to_screen(projectile.x, projectile.y)
+        positions = [(p.x, p.y) for p in self.projectiles]
+        visible = self.camera.cull_entities(positions)
+        projectiles = [self.projectiles[i] for i in visible]
+        screen_positions = self.camera.world_to_screen_batch([positions[i] for i in visible])
+        for projectile, screen_pos in zip(projectiles, screen_positions):
             pygame.draw.circle(self.screen, BLACK, screen_pos, int(projectile.size * scale))
 
     def _draw_movement_lines(self):
@@ -3283,10 +3582,10 @@ class Game:
         # Tint based on validity
         if can_place:
             # Green tint for valid placement
-            sprite.fill((100, 255, 100), special_flags=pygame.BLEND_MULT)
+            sprite.fill(GREEN_TINT, special_flags=pygame.BLEND_MULT)
         else:
             # Red tint for invalid placement
-            sprite.fill((255, 100, 100), special_flags=pygame.BLEND_MULT)
+            sprite.fill(RED_TINT, special_flags=pygame.BLEND_MULT)
 
         rect = sprite.get_rect(center=screen_pos)
         self.screen.blit(sprite, rect)
@@ -3344,14 +3643,7 @@ class Game:
         # Tab content
         if self.hud_tab == 0:
             # Units tab - unit training buttons
-            units = [
-                (10, UnitType.PEASANT, 'unit_peasant', f"{UNIT_COSTS['peasant']['gold']}g"),
-                (75, UnitType.KNIGHT, 'unit_knight', f"{UNIT_COSTS['knight']['gold']}g"),
-                (140, UnitType.CAVALRY, 'unit_cavalry', f"{UNIT_COSTS['cavalry']['gold']}g"),
-                (205, UnitType.CANNON, 'unit_cannon', f"{UNIT_COSTS['cannon']['gold']}g"),
-            ]
-
-            for bx, unit_type, asset_name, label in units:
+            for bx, unit_type, asset_name, label in _HUD_UNIT_BUTTONS:
                 rect = pygame.Rect(bx, content_y, button_size, button_size)
                 pygame.draw.rect(self.screen, GRAY, rect)
                 pygame.draw.rect(self.screen, BLACK, rect, 2)
@@ -3364,14 +3656,7 @@ class Game:
 
         elif self.hud_tab == 1:
             # Buildings tab - building placement buttons
-            buildings = [
-                (10, BuildingType.HOUSE, 'building_house', f"{BUILDING_COSTS['house']['gold']}g"),
-                (75, BuildingType.FARM, 'building_farm', f"{BUILDING_COSTS['farm']['gold']}g"),
-                (140, BuildingType.TOWER, 'building_tower', f"{BUILDING_COSTS['tower']['gold']}g"),
-                (205, BuildingType.BARRICADE, 'building_barricade', f"{BUILDING_COSTS['barricade']['wood']}w"),
-            ]
-
-            for bx, building_type, asset_name, label in buildings:
+            for bx, building_type, asset_name, label in _HUD_BUILDING_BUTTONS:
                 rect = pygame.Rect(bx, content_y, button_size, button_size)
                 color = LIGHT_GRAY if self.placing_building == building_type else GRAY
                 pygame.draw.rect(self.screen, color, rect)
@@ -3492,7 +3777,7 @@ class Game:
                 prog = f"Building: {int(self.selected_building.build_progress)}%"
                 self.screen.blit(self.font.render(prog, True, YELLOW), (info_x, info_y + 36))
             elif self.selected_building.building_type != BuildingType.CASTLE:
-                workers = self.selected_building.count_workers(self.units)
+                workers = self.selected_building.count_workers()
                 max_w = self.selected_building.get_max_workers()
                 self.screen.blit(self.font.render(f"Workers: {workers}/{max_w}", True, LIGHT_GRAY), (info_x, info_y + 36))
                 # Tower special info
@@ -3574,10 +3859,7 @@ class Game:
         overlay.set_alpha(180)
         self.screen.blit(overlay, (0, 0))
 
-        player_castle = any(
-            b for b in self.buildings
-            if b.building_type == BuildingType.CASTLE and b.team == Team.PLAYER
-        )
+        player_castle = self._find_castle(Team.PLAYER)
 
         if player_castle:
             text = "VICTORY!"
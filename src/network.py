@@ -2,16 +2,79 @@
 Networking for multiplayer support.
 """
 
+import base64
 import socket
 import threading
 import json
 import struct
-from typing import Optional, Tuple, List, TYPE_CHECKING
+from typing import Iterable, Optional, Tuple, List, TYPE_CHECKING
 
 from .constants import DEFAULT_PORT, BUFFER_SIZE, MAP_WIDTH, MAP_HEIGHT
 
 if TYPE_CHECKING:
     from .game import Game
+    from .entities import Unit, Building
+
+# One entity in a game_state snapshot: uid, x, y, type, team, health, max_health.
+# Positions travel as int16 in 1/POSITION_SCALE pixel steps and health as int16,
+# which halves the record against float32/int32 fields.
+ENTITY_RECORD = struct.Struct('<IhhBBhh')
+POSITION_SCALE = 8
+
+
+def _int16(value: int) -> int:
+    """Clamp an integer to the int16 range of the packed fields."""
+    return -32768 if value < -32768 else (32767 if value > 32767 else value)
+
+
+def pack_units(units: Iterable['Unit']) -> str:
+    """
+    Pack units into one fixed-width binary blob for a game_state snapshot.
+
+    Args:
+        units: Units to pack
+
+    Returns:
+        Base64 text of the packed ENTITY_RECORD rows (JSON-safe)
+    """
+    pack = ENTITY_RECORD.pack
+    blob = b''.join([pack(u.uid, _int16(round(u.x * POSITION_SCALE)), _int16(round(u.y * POSITION_SCALE)),
+                          u.unit_type, u.team, _int16(u.health), _int16(u.max_health))
+                     for u in units])
+    return base64.b64encode(blob).decode('ascii')
+
+
+def pack_buildings(buildings: Iterable['Building']) -> str:
+    """
+    Pack buildings into one fixed-width binary blob for a game_state snapshot.
+
+    Args:
+        buildings: Buildings to pack
+
+    Returns:
+        Base64 text of the packed ENTITY_RECORD rows (JSON-safe)
+    """
+    pack = ENTITY_RECORD.pack
+    blob = b''.join([pack(b.uid, _int16(round(b.x * POSITION_SCALE)), _int16(round(b.y * POSITION_SCALE)),
+                          b.building_type, b.team, _int16(b.health), _int16(b.max_health))
+                     for b in buildings])
+    return base64.b64encode(blob).decode('ascii')
+
+
+def unpack_entities(payload: str) -> List[Tuple[int, float, float, int, int, int, int]]:
+    """
+    Unpack a blob made by pack_units/pack_buildings.
+
+    Args:
+        payload: Base64 text from a game_state message
+
+    Returns:
+        List of (uid, x, y, type, team, health, max_health) rows; positions are
+        rounded to 1/POSITION_SCALE pixel, type and team are the enum values
+    """
+    return [(uid, x / POSITION_SCALE, y / POSITION_SCALE, entity_type, team, health, max_health)
+            for uid, x, y, entity_type, team, health, max_health
+            in ENTITY_RECORD.iter_unpack(base64.b64decode(payload))]
 
 
 class NetworkManager:
@@ -34,6 +97,9 @@ class NetworkManager:
         self.message_queue: List[dict] = []
         self.lock = threading.Lock()
 
+        # Actions queued this frame, sent together by flush_actions()
+        self.outbox: List[dict] = []
+
         # Connection state for async connect
         self.connecting = False
         self.connect_result: Optional[bool] = None
@@ -190,8 +256,7 @@ class NetworkManager:
             try:
                 data = self._receive_message()
                 if data:
-                    with self.lock:
-                        self.message_queue.append(data)
+                    self._enqueue_received(data)
             except socket.timeout:
                 continue
             except Exception as e:
@@ -199,8 +264,20 @@ class NetworkManager:
                 break
         self.connected = False
 
+    def _enqueue_received(self, data: dict):
+        """Queue a received message, unpacking an action batch into single actions."""
+        if data.get('type') == 'actions':
+            messages = [{'type': 'action', 'data': action} for action in data['data']]
+        else:
+            messages = [data]
+        with self.lock:
+            self.message_queue.extend(messages)
+
     def _send_message(self, data: dict):
         """Send a message to peer."""
+        # Queued actions go first so the peer sees everything in send order
+        if self.outbox and data.get('type') != 'actions':
+            self.flush_actions()
         try:
             msg = json.dumps(data).encode('utf-8')
             length = struct.pack('!I', len(msg))
@@ -268,13 +345,12 @@ class NetworkManager:
         if not self.connected:
             return
 
-        unit_data = [u.to_dict() for u in units]
-        building_data = [b.to_dict() for b in buildings]
-
+        # Entities go as packed binary rows (see unpack_entities) rather than
+        # one dict per entity, which keeps large snapshots cheap to encode
         self._send_message({
             'type': 'game_state',
-            'units': unit_data,
-            'buildings': building_data,
+            'units': pack_units(units),
+            'buildings': pack_buildings(buildings),
             'resources': {
                 'gold': resources.gold,
                 'food': resources.food,
@@ -283,9 +359,18 @@ class NetworkManager:
         })
 
     def send_action(self, action: dict):
-        """Send a player action to peer."""
+        """Queue a player action for the peer; sent with the frame's batch by flush_actions()."""
+        if self.connected:
+            self.outbox.append(action)
+
+    def flush_actions(self):
+        """Send all queued actions to the peer as one message."""
+        if not self.outbox:
+            return
+        actions = self.outbox[:]
+        self.outbox.clear()
         if self.connected:
-            self._send_message({'type': 'action', 'data': action})
+            self._send_message({'type': 'actions', 'data': actions})
 
     def send_unit_command(self, unit_uids: List[int], target_pos: Tuple[float, float],
                          target_unit_uid: Optional[int] = None,
@@ -383,6 +468,8 @@ class NetworkManager:
 
     def close(self):
         """Close the connection."""
+        # Deliver anything queued this frame before the socket goes away
+        self.flush_actions()
         self.running = False
         self.connected = False
         self.connecting = False
@@ -0,0 +1,149 @@
+"""
+Uniform-grid spatial index for viewport culling and range queries.
+"""
+
+from typing import Dict, Hashable, List, Set, Tuple
+
+
+class SpatialGrid:
+    """Buckets entity ids into fixed-size square cells by position."""
+
+    def __init__(self, cell_size: int = 256):
+        """
+        Initialize an empty grid.
+
+        Args:
+            cell_size: Width/height of each cell in world units
+        """
+        self.cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], Set[Hashable]] = {}
+        self._positions: Dict[Hashable, Tuple[float, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def _cell_of(self, x: float, y: float) -> Tuple[int, int]:
+        """Get the cell coordinates containing a world position."""
+        return (int(x // self.cell_size), int(y // self.cell_size))
+
+    def clear(self):
+        """Remove all entities."""
+        self._cells.clear()
+        self._positions.clear()
+
+    def insert(self, entity_id: Hashable, x: float, y: float):
+        """
+        Add an entity at a position (moves it if already present).
+
+        Args:
+            entity_id: Unique id for the entity
+            x: World X position
+            y: World Y position
+        """
+        if entity_id in self._positions:
+            self.move(entity_id, x, y)
+            return
+        self._positions[entity_id] = (x, y)
+        cell = self._cell_of(x, y)
+        bucket = self._cells.get(cell)
+        if bucket is None:
+            self._cells[cell] = {entity_id}
+        else:
+            bucket.add(entity_id)
+
+    def move(self, entity_id: Hashable, x: float, y: float):
+        """
+        Update an entity's position, re-bucketing only if it changed cell.
+
+        Args:
+            entity_id: Id of an entity already in the grid
+            x: New world X position
+            y: New world Y position
+        """
+        old_x, old_y = self._positions[entity_id]
+        self._positions[entity_id] = (x, y)
+        old_cell = self._cell_of(old_x, old_y)
+        new_cell = self._cell_of(x, y)
+        if old_cell == new_cell:
+            return
+        self._discard_from_cell(old_cell, entity_id)
+        bucket = self._cells.get(new_cell)
+        if bucket is None:
+            self._cells[new_cell] = {entity_id}
+        else:
+            bucket.add(entity_id)
+
+    def remove(self, entity_id: Hashable):
+        """Remove an entity if present."""
+        position = self._positions.pop(entity_id, None)
+        if position is not None:
+            self._discard_from_cell(self._cell_of(*position), entity_id)
+
+    def _discard_from_cell(self, cell: Tuple[int, int], entity_id: Hashable):
+        """Remove an id from a cell bucket, dropping the bucket once empty."""
+        bucket = self._cells.get(cell)
+        if bucket is not None:
+            bucket.discard(entity_id)
+            if not bucket:
+                del self._cells[cell]
+
+    def query_rect(self, left: float, top: float, right: float, bottom: float) -> List[Hashable]:
+        """
+        Get the ids of all entities whose position lies inside a rectangle.
+
+        Cells fully inside the rectangle are taken wholesale; only entities in
+        the partially covered edge cells get an exact position test.
+
+        Args:
+            left: Rectangle left edge in world units
+            top: Rectangle top edge
+            right: Rectangle right edge
+            bottom: Rectangle bottom edge
+
+        Returns:
+            Matching entity ids (unordered)
+        """
+        size = self.cell_size
+        cx0, cy0 = self._cell_of(left, top)
+        cx1, cy1 = self._cell_of(right, bottom)
+        positions = self._positions
+        result = []
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = self._cells.get((cx, cy))
+                if not bucket:
+                    continue
+                cell_left = cx * size
+                cell_top = cy * size
+                if (cell_left >= left and cell_left + size <= right and
+                        cell_top >= top and cell_top + size <= bottom):
+                    result.extend(bucket)
+                    continue
+                for entity_id in bucket:
+                    x, y = positions[entity_id]
+                    if left <= x <= right and top <= y <= bottom:
+                        result.append(entity_id)
+        return result
+
+    def query_circle(self, cx: float, cy: float, radius: float) -> List[Hashable]:
+        """
+        Get the ids of all entities whose position lies within a circle.
+
+        Args:
+            cx: Circle center X in world units
+            cy: Circle center Y
+            radius: Circle radius
+
+        Returns:
+            Matching entity ids (unordered)
+        """
+        positions = self._positions
+        radius_sq = radius * radius
+        result = []
+        for entity_id in self.query_rect(cx - radius, cy - radius, cx + radius, cy + radius):
+            x, y = positions[entity_id]
+            dx = x - cx
+            dy = y - cy
+            if dx * dx + dy * dy <= radius_sq:
+                result.append(entity_id)
+        return result
@@ -7,7 +7,7 @@ from typing import Tuple, Optional, Callable
 
 from . import constants
 from .constants import (
-    WHITE, BLACK, GRAY, LIGHT_GRAY, DARK_GRAY, RED, GREEN, GOLD, BROWN,
+    WHITE, BLACK, GRAY, LIGHT_GRAY, DARK_GRAY, RED, BLUE, GREEN, GOLD, BROWN,
     UNIT_COSTS, BUILDING_COSTS
 )
 
@@ -249,7 +249,7 @@ class Minimap:
 
         # Draw buildings
         for building in buildings:
-            color = (50, 50, 200) if building.team == player_team else (200, 50, 50)
+            color = BLUE if building.team == player_team else RED
             x = self.rect.x + int(building.x * self.scale_x)
             y = self.rect.y + int(building.y * self.scale_y)
             size = 6 if building.building_type.name == 'CASTLE' else 4
@@ -258,7 +258,7 @@ class Minimap:
 
         # Draw units with different sizes based on unit type
         for unit in units:
-            color = (50, 50, 200) if unit.team == player_team else (200, 50, 50)
+            color = BLUE if unit.team == player_team else RED
             x = self.rect.x + int(unit.x * self.scale_x)
             y = self.rect.y + int(unit.y * self.scale_y)
             # Different sizes for different unit types
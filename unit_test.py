@@ -8,6 +8,8 @@ Or with pytest: pytest unit_test.py -v
 import unittest
 import sys
 import os
+import tempfile
+from collections import defaultdict
 from unittest.mock import MagicMock
 
 # Add src to path for imports
@@ -44,12 +46,19 @@ sys.modules['pygame'].Rect = MockRect
 from src.constants import (
     UnitType, BuildingType, Team, MAP_WIDTH, MAP_HEIGHT,
     UNIT_STATS, BUILDING_STATS, UNIT_COSTS, BUILDING_COSTS,
+    UNIT_COST_AMOUNTS, BUILDING_COST_AMOUNTS,
     STARTING_GOLD, STARTING_FOOD, STARTING_WOOD,
-    BASE_WIDTH, BASE_HEIGHT, get_scale, scale
+    BASE_WIDTH, BASE_HEIGHT, get_scale, scale,
+    UNIT_TYPE_KEYS, BUILDING_TYPE_KEYS,
+    UNIT_HEALTH, UNIT_ATTACK, UNIT_DEFENSE, UNIT_SPEED, UNIT_RANGE, UNIT_COOLDOWN,
+    BUILDING_HEALTH, UNIT_TYPE_COUNT, BUILDING_TYPE_COUNT, RED_TINT
 )
-from src.entities import Unit, Building, Resources, BloodEffect, Projectile
+from src.entities import Unit, Building, Resources, BloodEffect, BloodEffectPool, Projectile
 from src.camera import Camera
-from src.network import NetworkManager
+from src.spatial_grid import SpatialGrid
+from src.network import NetworkManager, pack_units, pack_buildings, unpack_entities
+from src.ai import AIBot
+from src.assets import AssetManager, ModManager, _pack_asset_cache, _unpack_asset_cache
 
 
 # =============================================================================
@@ -96,6 +105,18 @@ class TestResources(unittest.TestCase):
         self.assertFalse(result)
         self.assertEqual(res.gold, 100)  # Unchanged
 
+    def test_spend_amounts(self):
+        """Test tuple cost tables work with the plain-amount API."""
+        res = Resources(gold=200, food=100, wood=0)
+        knight = UNIT_COST_AMOUNTS['knight']
+        self.assertEqual(knight, (150, 50, 0))
+        self.assertTrue(res.can_afford_amounts(*knight))
+        self.assertFalse(res.can_afford_amounts(*BUILDING_COST_AMOUNTS['house']))
+        self.assertTrue(res.spend_amounts(*knight))
+        self.assertEqual((res.gold, res.food, res.wood), (50, 50, 0))
+        self.assertFalse(res.spend_amounts(*knight))
+        self.assertEqual((res.gold, res.food, res.wood), (50, 50, 0))
+
     def test_add_resources(self):
         """Test adding resources."""
         res = Resources(gold=100, food=50, wood=50)
@@ -142,12 +163,52 @@ class TestUnit(unittest.TestCase):
         self.assertEqual(cannon.attack, UNIT_STATS['cannon']['attack'])
         self.assertEqual(cannon.attack_range, UNIT_STATS['cannon']['range'])
 
+    def test_entities_have_no_instance_dict(self):
+        """Test entity dataclasses keep their fields in slots."""
+        entities = [Resources(), Unit(0, 0, UnitType.KNIGHT, Team.PLAYER),
+                    Building(0, 0, BuildingType.FARM, Team.PLAYER), BloodEffect(0, 0)]
+        for entity in entities:
+            self.assertFalse(hasattr(entity, '__dict__'))
+        with self.assertRaises(AttributeError):
+            entities[1].morale = 1.0
+
     def test_distance_to(self):
         """Test distance calculation."""
         unit = Unit(0, 0, UnitType.PEASANT, Team.PLAYER)
         self.assertAlmostEqual(unit.distance_to(3, 4), 5.0)
         self.assertAlmostEqual(unit.distance_to(0, 0), 0.0)
 
+    def test_distance_sq_to(self):
+        """Test squared distance matches distance_to squared."""
+        unit = Unit(10, 20, UnitType.PEASANT, Team.PLAYER)
+        self.assertEqual(unit.distance_sq_to(13, 24), 25)
+        self.assertAlmostEqual(unit.distance_sq_to(-5, 7), unit.distance_to(-5, 7) ** 2)
+
+    def test_move_towards(self):
+        """Test movement steps toward the target and stops on arrival."""
+        unit = Unit(100, 100, UnitType.KNIGHT, Team.PLAYER)
+        unit.set_move_target(400, 500)
+        unit.move_towards(400, 500, 1 / 60)
+        self.assertAlmostEqual(unit.distance_to(100, 100), unit.speed)
+        self.assertAlmostEqual((unit.x - 100) * 4, (unit.y - 100) * 3)
+        unit.x, unit.y = 398, 499
+        unit.move_towards(400, 500, 1 / 60)
+        self.assertIsNone(unit.target_x)
+
+    def test_move_towards_clamped(self):
+        """Test movement stays inside the map margin."""
+        unit = Unit(21, 21, UnitType.CAVALRY, Team.PLAYER)
+        unit.move_towards(-500, -500, 1.0)
+        self.assertEqual((unit.x, unit.y), (20, 20))
+
+    def test_step_towards(self):
+        """Test a precomputed step length moves the same as move_towards."""
+        a = Unit(100, 100, UnitType.KNIGHT, Team.PLAYER)
+        b = Unit(100, 100, UnitType.KNIGHT, Team.PLAYER)
+        a.move_towards(400, 500, 0.016, 0.6)
+        b.step_towards(400, 500, b.speed * 0.6 * 0.016 * 60)
+        self.assertEqual((a.x, a.y), (b.x, b.y))
+
     def test_distance_to_unit(self):
         """Test distance to another unit."""
         unit1 = Unit(0, 0, UnitType.PEASANT, Team.PLAYER)
@@ -215,6 +276,17 @@ class TestUnit(unittest.TestCase):
         self.assertFalse(player_unit.is_enemy_of(Team.PLAYER))
         self.assertTrue(enemy_unit.is_enemy_of(Team.PLAYER))
 
+    def test_get_bbox_and_contains_point(self):
+        """Test bbox matches get_rect and point hits use half-open edges."""
+        unit = Unit(100.5, 200, UnitType.KNIGHT, Team.PLAYER)
+        self.assertEqual(unit.get_bbox(), (80, 180, 40, 40))
+        rect = unit.get_rect()
+        self.assertEqual((rect.x, rect.y, rect.width, rect.height), unit.get_bbox())
+        self.assertTrue(unit.contains_point(80, 180))
+        self.assertTrue(unit.contains_point(119.9, 219))
+        self.assertFalse(unit.contains_point(120, 200))
+        self.assertFalse(unit.contains_point(100, 179))
+
     def test_set_move_target(self):
         """Test setting movement target."""
         unit = Unit(0, 0, UnitType.PEASANT, Team.PLAYER)
@@ -344,12 +416,41 @@ class TestBuilding(unittest.TestCase):
         self.assertGreater(castle_size[0], house_size[0])
         self.assertLess(tower_size[0], house_size[0])
 
+    def test_contains_point(self):
+        """Test building hit test covers its footprint."""
+        farm = Building(500, 500, BuildingType.FARM, Team.PLAYER)
+        left, top, w, h = farm.get_bbox()
+        self.assertTrue(farm.contains_point(500, 500))
+        self.assertTrue(farm.contains_point(left, top))
+        self.assertFalse(farm.contains_point(left + w, top))
+
     def test_get_max_workers(self):
         """Test max workers varies by building type."""
         farm = Building(0, 0, BuildingType.FARM, Team.PLAYER)
         castle = Building(0, 0, BuildingType.CASTLE, Team.PLAYER)
         self.assertGreater(farm.get_max_workers(), castle.get_max_workers())
 
+    def test_count_workers_tally(self):
+        """Test worker count uses the per-frame tally unless units are given."""
+        farm = Building(0, 0, BuildingType.FARM, Team.PLAYER)
+        worker = Unit(10, 10, UnitType.PEASANT, Team.PLAYER)
+        worker.assigned_building = farm
+        worker.is_working = True
+        self.assertEqual(farm.count_workers([worker]), 1)
+        self.assertEqual(farm.count_workers(), 0)
+        farm.worker_count = 3
+        self.assertEqual(farm.count_workers(), 3)
+        self.assertEqual(farm.get_production_multiplier(), 1.0)
+
+    def test_resource_amounts(self):
+        """Test tuple generation matches the dict API and scales with workers."""
+        farm = Building(0, 0, BuildingType.FARM, Team.PLAYER)
+        self.assertEqual(farm.get_resource_amounts(), (0, 0, 0))
+        farm.worker_count = 3
+        gen = farm.get_resource_generation()
+        self.assertEqual(farm.get_resource_amounts(), (gen['gold'], gen['food'], gen['wood']))
+        self.assertEqual(gen['food'], 25)
+
     def test_to_dict(self):
         """Test serialization to dictionary."""
         building = Building(100, 200, BuildingType.FARM, Team.ENEMY, uid=99)
@@ -445,6 +546,35 @@ class TestProjectile(unittest.TestCase):
         self.assertGreater(proj.x, initial_x)
 
 
+class TestBloodEffectPool(unittest.TestCase):
+    """Tests for the BloodEffectPool class."""
+
+    def test_spawn_reuses_released(self):
+        """Test released effects are reset and handed out again."""
+        pool = BloodEffectPool()
+        effect = pool.spawn(10, 20, 0.5)
+        self.assertEqual((effect.max_lifetime, effect.alpha), (0.5, 255))
+        effect.update(1.0)
+        pool.release(effect)
+        reused = pool.spawn(30, 40)
+        self.assertIs(reused, effect)
+        self.assertEqual((reused.x, reused.y, reused.lifetime, reused.alpha), (30, 40, 1.0, 255))
+        self.assertIsNot(pool.spawn(0, 0), effect)
+
+    def test_update_all_matches_update(self):
+        """Test batch update ages effects like update() and recycles expired ones."""
+        pool = BloodEffectPool()
+        effects = [pool.spawn(0, 0, 1.0), pool.spawn(0, 0, 0.25), pool.spawn(0, 0, 2.0)]
+        reference = [BloodEffect(0, 0, e.lifetime, e.max_lifetime) for e in effects]
+        expired = [ref.update(0.5) for ref in reference]
+        pool.update_all(effects, 0.5)
+        live_refs = [ref for ref, gone in zip(reference, expired) if not gone]
+        self.assertEqual(len(effects), len(live_refs))
+        for effect, ref in zip(effects, live_refs):
+            self.assertEqual((effect.lifetime, effect.alpha), (ref.lifetime, ref.alpha))
+        self.assertEqual(len(pool._free), 1)
+
+
 # =============================================================================
 # CAMERA TESTS
 # =============================================================================
@@ -462,6 +592,13 @@ class TestCamera(unittest.TestCase):
         self.assertEqual(camera.x, 0)
         self.assertEqual(camera.y, 0)
 
+    def test_camera_has_no_instance_dict(self):
+        """Test camera attributes live in slots."""
+        camera = Camera(1280, 720)
+        self.assertFalse(hasattr(camera, '__dict__'))
+        with self.assertRaises(AttributeError):
+            camera.zoom = 2.0
+
     def test_scale_property(self):
         """Test scale calculation."""
         camera = Camera(1280, 720)
@@ -487,6 +624,17 @@ class TestCamera(unittest.TestCase):
         self.assertEqual(world_x, 200)  # 100 + 100
         self.assertEqual(world_y, 150)  # 100 + 50
 
+    def test_world_to_screen_batch(self):
+        """Test batch conversion matches per-point conversion."""
+        camera = Camera(2560, 1440)
+        camera.x = 100
+        camera.y = 50
+        points = [(200, 150), (100, 50), (333.7, 90.2)]
+        self.assertEqual(camera.world_to_screen_batch(points),
+                         [camera.world_to_screen(x, y) for x, y in points])
+        self.assertEqual(camera.screen_to_world_batch([(200, 200)]), [camera.screen_to_world(200, 200)])
+        self.assertEqual(camera.world_to_screen_batch([]), [])
+
     def test_world_to_screen_scaled(self):
         """Test coordinate conversion with scaling."""
         camera = Camera(2560, 1440)  # 2x scale
@@ -542,6 +690,25 @@ class TestCamera(unittest.TestCase):
         camera = Camera(2560, 1440)  # 2x scale
         self.assertEqual(camera.scale_size(50), 100)
 
+    def test_is_rect_visible(self):
+        """Test rectangle visibility uses strict overlap."""
+        camera = Camera(1280, 720)
+        camera.x = 100
+        camera.y = 100
+        self.assertTrue(camera.is_rect_visible(MockRect(50, 50, 100, 100)))
+        self.assertFalse(camera.is_rect_visible(MockRect(0, 0, 100, 100)))
+        self.assertTrue(camera.is_aabb_visible(100 + camera.width - 1, 200, 10, 10))
+        self.assertFalse(camera.is_aabb_visible(100 + camera.width, 200, 10, 10))
+
+    def test_rects_visible_batch(self):
+        """Test batch rect visibility matches per-rect checks."""
+        camera = Camera(1280, 720)
+        camera.x = 100
+        camera.y = 100
+        rects = [(50, 50, 100, 100), (0, 0, 100, 100), (500, 500, 10, 10)]
+        self.assertEqual(camera.rects_visible_batch(rects),
+                         [camera.is_aabb_visible(*r) for r in rects])
+
     def test_get_visible_area(self):
         """Test getting visible area bounds."""
         camera = Camera(1280, 720)
@@ -553,6 +720,132 @@ class TestCamera(unittest.TestCase):
         self.assertEqual(right, 100 + camera.width)
         self.assertEqual(bottom, 200 + camera.height)
 
+    def test_viewport_cache_follows_camera(self):
+        """Test cached viewport rect is reused until the camera moves."""
+        camera = Camera(1280, 720)
+        rect = camera.get_viewport_rect()
+        self.assertIs(camera.get_viewport_rect(), rect)
+        camera.x = 300
+        moved = camera.get_viewport_rect()
+        self.assertIsNot(moved, rect)
+        self.assertEqual(moved.x, 300)
+        self.assertEqual(camera.get_visible_area()[0], 300)
+
+    def test_keyboard_scroll(self):
+        """Test arrow/WASD keys move the camera."""
+        pygame = sys.modules['pygame']
+        camera = Camera(1280, 720)
+        camera.x = 500
+        camera.y = 500
+        keys = defaultdict(bool, {pygame.K_d: True, pygame.K_UP: True})
+        camera.update(keys, 1 / 60)
+        self.assertEqual(camera.x, 500 + camera.speed)
+        self.assertEqual(camera.y, 500 - camera.speed)
+
+    def test_edge_scroll_clamped(self):
+        """Test edge scrolling combines with keys and clamps to the map."""
+        pygame = sys.modules['pygame']
+        camera = Camera(1280, 720)
+        camera.x = 0
+        camera.y = 500
+        keys = defaultdict(bool, {pygame.K_LEFT: True})
+        camera.update(keys, 1 / 60, (5, 360))
+        self.assertEqual(camera.x, 0)
+        camera.update(defaultdict(bool), 1 / 60, (640, 719))
+        self.assertEqual(camera.y, 500 + camera.speed)
+
+    def test_visible_chunks(self):
+        """Test chunk range covers the viewport."""
+        camera = Camera(1280, 720)
+        camera.x = 600
+        camera.y = 0
+        cx0, cy0, cx1, cy1 = camera.visible_chunks(512)
+        self.assertEqual((cx0, cy0), (1, 0))
+        self.assertGreater(cx1 * 512, camera.x + camera.width)
+        self.assertGreater(cy1 * 512, camera.y + camera.height)
+
+    def test_visible_tile_range(self):
+        """Test tile range covers the viewport and stays on the map."""
+        camera = Camera(1280, 720)
+        camera.x = 130
+        camera.y = 0
+        self.assertEqual(camera.visible_tile_range(64)[:2], (2, 0))
+        camera.x = MAP_WIDTH - camera.width
+        camera.y = MAP_HEIGHT - camera.height
+        _, _, tx1, ty1 = camera.visible_tile_range(64)
+        self.assertEqual(tx1, -(-MAP_WIDTH // 64))
+        self.assertEqual(ty1, -(-MAP_HEIGHT // 64))
+
+    def test_visible_mask(self):
+        """Test batch visibility matches per-point checks."""
+        camera = Camera(1280, 720)
+        camera.x = 100
+        camera.y = 100
+        points = [(100, 100), (60, 100), (5000, 5000), (100 + camera.width + 50, 300)]
+        self.assertEqual(camera.visible_mask(points),
+                         [camera.is_point_visible(x, y) for x, y in points])
+
+    def test_resize_updates_scale(self):
+        """Test resize changes the screen size and scale."""
+        camera = Camera(1280, 720)
+        camera.resize(2560, 1440)
+        self.assertEqual(camera.screen_width, 2560)
+        self.assertEqual(camera.scale, 2.0)
+
+    def test_cull_entities(self):
+        """Test culling returns indices of visible points."""
+        camera = Camera(1280, 720)
+        points = [(5000, 5000), (10, 10), (-100, 0), (camera.width, camera.height)]
+        self.assertEqual(camera.cull_entities(points), [1, 3])
+        self.assertEqual(camera.cull_entities([]), [])
+
+    def test_visible_ids(self):
+        """Test viewport query against a spatial grid."""
+        camera = Camera(1280, 720)
+        camera.x = 1000
+        camera.y = 1000
+        grid = SpatialGrid()
+        grid.insert('inside', 1100, 1100)
+        grid.insert('edge', 990, 1100)
+        grid.insert('far', 5000, 5000)
+        self.assertEqual(camera.visible_ids(grid), {'inside'})
+        self.assertEqual(camera.visible_ids(grid, margin=20), {'inside', 'edge'})
+
+
+class TestSpatialGrid(unittest.TestCase):
+    """Tests for the SpatialGrid class."""
+
+    def test_query_rect(self):
+        """Test rectangle query returns only contained points."""
+        grid = SpatialGrid(cell_size=100)
+        grid.insert(1, 50, 50)
+        grid.insert(2, 150, 150)
+        grid.insert(3, 450, 450)
+        grid.insert(4, -20, 10)
+        self.assertEqual(sorted(grid.query_rect(0, 0, 200, 200)), [1, 2])
+        self.assertEqual(sorted(grid.query_rect(-100, 0, 100, 100)), [1, 4])
+        self.assertEqual(grid.query_rect(600, 600, 700, 700), [])
+
+    def test_query_circle(self):
+        """Test circle query uses exact distance."""
+        grid = SpatialGrid(cell_size=100)
+        grid.insert(1, 0, 0)
+        grid.insert(2, 75, 75)
+        grid.insert(3, 100, 0)
+        self.assertEqual(sorted(grid.query_circle(0, 0, 100)), [1, 3])
+
+    def test_move_and_remove(self):
+        """Test moving entities across cells and removing them."""
+        grid = SpatialGrid(cell_size=100)
+        grid.insert('a', 10, 10)
+        grid.move('a', 310, 10)
+        self.assertEqual(grid.query_rect(0, 0, 100, 100), [])
+        self.assertEqual(grid.query_rect(300, 0, 400, 100), ['a'])
+        grid.remove('a')
+        grid.remove('missing')
+        self.assertEqual(len(grid), 0)
+        self.assertEqual(grid.query_rect(0, 0, 1000, 1000), [])
+
 
 # =============================================================================
 # NETWORK TESTS (without actual networking)
@@ -610,6 +903,50 @@ class TestNetworkMirroring(unittest.TestCase):
         self.assertEqual(my, MAP_HEIGHT)
 
 
+class TestNetworkPacking(unittest.TestCase):
+    """Tests for packed game_state snapshots."""
+
+    def test_pack_round_trip(self):
+        """Test packed units and buildings unpack to the same fields."""
+        unit = Unit(100.5, 200.25, UnitType.KNIGHT, Team.ENEMY, uid=7)
+        unit.health = -3
+        farm = Building(300, 400, BuildingType.FARM, Team.PLAYER, uid=8)
+        self.assertEqual(unpack_entities(pack_units([unit])),
+                         [(7, 100.5, 200.25, UnitType.KNIGHT, Team.ENEMY, -3, unit.max_health)])
+        self.assertEqual(unpack_entities(pack_buildings([farm])),
+                         [(8, 300.0, 400.0, BuildingType.FARM, Team.PLAYER, farm.health, farm.max_health)])
+        self.assertEqual(unpack_entities(pack_units([])), [])
+
+    def test_pack_quantizes_fields(self):
+        """Test positions round to the packed step and health clamps to int16."""
+        unit = Unit(10.3, 20.0, UnitType.PEASANT, Team.PLAYER, uid=1)
+        unit.health = 100000
+        row = unpack_entities(pack_units([unit]))[0]
+        self.assertEqual(row[1], 10.25)
+        self.assertEqual(row[5], 32767)
+
+
+class TestNetworkBatching(unittest.TestCase):
+    """Tests for per-frame action batching."""
+
+    def test_actions_sent_as_one_batch(self):
+        """Test queued actions go out in one message and unpack in order."""
+        net = NetworkManager(None)
+        net.connected = True
+        sent = []
+        net._send_message = sent.append
+        net.send_train_unit('knight')
+        net.send_assign_worker(3, 9)
+        self.assertEqual(sent, [])
+        net.flush_actions()
+        self.assertEqual(len(sent), 1)
+        self.assertEqual(net.outbox, [])
+
+        net._enqueue_received(sent[0])
+        commands = [msg['data']['command'] for msg in net.get_messages()]
+        self.assertEqual(commands, ['train', 'assign_worker'])
+
+
 # =============================================================================
 # CONSTANTS TESTS
 # =============================================================================
@@ -643,6 +980,43 @@ class TestConstants(unittest.TestCase):
             self.assertIn(building_type, BUILDING_STATS)
             self.assertIn('health', BUILDING_STATS[building_type])
 
+    def test_type_keys_match_tables(self):
+        """Test precomputed enum keys match the stat and cost table keys."""
+        for unit_type in UnitType:
+            self.assertEqual(UNIT_TYPE_KEYS[unit_type], unit_type.name.lower())
+            self.assertIn(UNIT_TYPE_KEYS[unit_type], UNIT_COSTS)
+        for building_type in BuildingType:
+            self.assertEqual(BUILDING_TYPE_KEYS[building_type], building_type.name.lower())
+            self.assertIn(BUILDING_TYPE_KEYS[building_type], BUILDING_COSTS)
+
+    def test_unit_stat_columns_match_table(self):
+        """Test per-stat columns mirror UNIT_STATS in UnitType order."""
+        for unit_type in UnitType:
+            stats = UNIT_STATS[UNIT_TYPE_KEYS[unit_type]]
+            i = unit_type.value - 1
+            self.assertEqual(UNIT_HEALTH[i], stats['health'])
+            self.assertEqual(UNIT_ATTACK[i], stats['attack'])
+            self.assertEqual(UNIT_DEFENSE[i], stats['defense'])
+            self.assertEqual(UNIT_SPEED[i], stats['speed'])
+            self.assertEqual(UNIT_RANGE[i], stats['range'])
+            self.assertEqual(UNIT_COOLDOWN[i], stats['cooldown'])
+
+    def test_stat_tables_read_only(self):
+        """Test stat/cost tables and their rows reject mutation."""
+        with self.assertRaises(TypeError):
+            UNIT_STATS['knight']['attack'] = 999
+        with self.assertRaises(TypeError):
+            BUILDING_COSTS['house'] = {}
+        for building_type in BuildingType:
+            self.assertEqual(BUILDING_HEALTH[building_type.value - 1],
+                             BUILDING_STATS[BUILDING_TYPE_KEYS[building_type]]['health'])
+
+    def test_type_enums_index_columns(self):
+        """Test type enums are ints usable directly as column indices."""
+        self.assertEqual(UNIT_ATTACK[UnitType.KNIGHT - 1], UNIT_STATS['knight']['attack'])
+        self.assertEqual(len(UNIT_HEALTH), UNIT_TYPE_COUNT)
+        self.assertEqual(len(BUILDING_HEALTH), BUILDING_TYPE_COUNT)
+
     def test_map_dimensions_positive(self):
         """Test map dimensions are positive."""
         self.assertGreater(MAP_WIDTH, 0)
@@ -669,6 +1043,18 @@ class TestConstants(unittest.TestCase):
         self.assertIsInstance(result, int)
         self.assertGreater(result, 0)
 
+    def test_set_resolution_updates_scale(self):
+        """Test set_resolution recomputes the cached scale factor."""
+        from src import constants
+        original = (constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT)
+        try:
+            constants.set_resolution(2560, 1440)
+            self.assertEqual(get_scale(), 2.0)
+            self.assertEqual(scale(100), 200)
+            self.assertEqual(constants.scale_rect(1, 2, 3, 4), (2, 4, 6, 8))
+        finally:
+            constants.set_resolution(*original)
+
 
 # =============================================================================
 # INTEGRATION TESTS
@@ -730,6 +1116,293 @@ class TestCombat(unittest.TestCase):
         self.assertIsNone(attacker.target_unit)
 
 
+# =============================================================================
+# AI TESTS
+# =============================================================================
+
+class MockGame:
+    """Minimal stand-in for Game with just what AIBot touches."""
+
+    def __init__(self):
+        self.units = []
+        self.buildings = []
+        self.enemy_resources = Resources()
+        self.enemy_healing_enabled = False
+        self._uid = 0
+
+    def next_uid(self, for_enemy: bool = False) -> int:
+        self._uid += 1
+        return self._uid
+
+
+class TestAIBot(unittest.TestCase):
+    """Tests for the AI opponent."""
+
+    def setUp(self):
+        self.game = MockGame()
+        self.ai = AIBot(self.game)
+
+    def test_rosters_partition_by_team(self):
+        """Test AI rosters split units and buildings by team."""
+        mine = Unit(0, 0, UnitType.KNIGHT, Team.ENEMY)
+        theirs = Unit(0, 0, UnitType.KNIGHT, Team.PLAYER)
+        castle = Building(0, 0, BuildingType.CASTLE, Team.PLAYER)
+        house = Building(0, 0, BuildingType.HOUSE, Team.PLAYER)
+        self.game.units.extend([mine, theirs])
+        self.game.buildings.extend([castle, house])
+        self.assertEqual(self.ai.my_units, [mine])
+        self.assertEqual(self.ai.enemy_units, [theirs])
+        self.assertEqual(self.ai._enemy_non_castle_buildings, [house])
+
+    def test_castles_cached_per_team(self):
+        """Test both castles are found during the roster pass."""
+        mine = Building(0, 0, BuildingType.CASTLE, Team.ENEMY, uid=1)
+        theirs = Building(0, 0, BuildingType.CASTLE, Team.PLAYER, uid=2)
+        self.game.buildings.extend([Building(0, 0, BuildingType.FARM, Team.ENEMY), mine, theirs])
+        self.assertIs(self.ai.my_castle, mine)
+        self.assertIs(self.ai.enemy_castle, theirs)
+
+    def test_rosters_partition_by_role(self):
+        """Test AI rosters split military units from peasants."""
+        knight = Unit(0, 0, UnitType.KNIGHT, Team.ENEMY, uid=1)
+        peasant = Unit(0, 0, UnitType.PEASANT, Team.ENEMY, uid=2)
+        enemy_peasant = Unit(0, 0, UnitType.PEASANT, Team.PLAYER, uid=3)
+        self.game.units.extend([knight, peasant, enemy_peasant])
+        self.assertEqual([u.uid for u in self.ai.military_units], [1])
+        self.assertEqual([u.uid for u in self.ai.my_peasants], [2])
+        self.assertEqual(self.ai.enemy_military_units, [])
+        self.assertEqual(self.ai.military_count, 1)
+
+    def test_buildings_by_priority_farms_first(self):
+        """Test worker priority puts farms ahead of other buildings."""
+        house = Building(0, 0, BuildingType.HOUSE, Team.ENEMY, uid=1)
+        farm = Building(0, 0, BuildingType.FARM, Team.ENEMY, uid=2)
+        self.game.buildings.extend([house, farm])
+        self.ai._ensure_rosters()
+        self.assertEqual([b.uid for b in self.ai._buildings_by_priority], [2, 1])
+
+    def test_building_counts_by_type(self):
+        """Test AI building counts are tallied per type in the roster pass."""
+        self.game.buildings.extend([
+            Building(0, 0, BuildingType.HOUSE, Team.ENEMY),
+            Building(0, 0, BuildingType.HOUSE, Team.ENEMY),
+            Building(0, 0, BuildingType.FARM, Team.ENEMY),
+            Building(0, 0, BuildingType.HOUSE, Team.PLAYER),
+        ])
+        self.ai._ensure_rosters()
+        self.assertEqual(self.ai._my_building_counts[BuildingType.HOUSE], 2)
+        self.assertEqual(self.ai._my_building_counts[BuildingType.FARM], 1)
+        self.assertEqual(self.ai._my_building_counts[BuildingType.TOWER], 0)
+
+    def test_defend_orders_target_nearest_to_castle(self):
+        """Test defenders engage the enemy closest to the castle."""
+        castle = Building(1000, 1000, BuildingType.CASTLE, Team.ENEMY)
+        defender = Unit(1000, 900, UnitType.KNIGHT, Team.ENEMY)
+        near = Unit(1100, 1000, UnitType.KNIGHT, Team.PLAYER)
+        far = Unit(1300, 1000, UnitType.KNIGHT, Team.PLAYER)
+        self.game.buildings.append(castle)
+        self.game.units.extend([defender, far, near])
+        self.ai._execute_defend_orders()
+        self.assertIs(defender.target_unit, near)
+
+    def test_defense_positions_follow_castle(self):
+        """Test defense line is recalculated when the castle changes."""
+        castle = Building(1500, 500, BuildingType.CASTLE, Team.ENEMY)
+        self.game.buildings.append(castle)
+        self.game.units.append(Unit(1500, 600, UnitType.KNIGHT, Team.ENEMY))
+        self.ai._execute_defense_line()
+        first = list(self.ai.defense_positions)
+        self.assertEqual(len(first), 8)
+
+        castle.x = 1200
+        self.ai._execute_defense_line()
+        self.assertNotEqual(self.ai.defense_positions, first)
+
+    def test_find_nearest_enemy(self):
+        """Test nearest enemy lookup picks the closest player unit."""
+        unit = Unit(0, 0, UnitType.KNIGHT, Team.ENEMY)
+        far = Unit(300, 0, UnitType.KNIGHT, Team.PLAYER)
+        near = Unit(0, 100, UnitType.KNIGHT, Team.PLAYER)
+        self.game.units.extend([unit, far, near])
+        self.assertIs(self.ai._find_nearest_enemy(unit), near)
+
+    def test_find_nearest_enemy_none(self):
+        """Test nearest enemy lookup with no player units."""
+        unit = Unit(0, 0, UnitType.KNIGHT, Team.ENEMY)
+        self.game.units.append(unit)
+        self.assertIsNone(self.ai._find_nearest_enemy(unit))
+
+    def test_nearest_enemies_batched(self):
+        """Test batched nearest enemy lookup matches each unit to its closest enemy."""
+        left = Unit(0, 0, UnitType.KNIGHT, Team.ENEMY, uid=1)
+        right = Unit(1000, 0, UnitType.KNIGHT, Team.ENEMY, uid=2)
+        enemy_left = Unit(100, 0, UnitType.KNIGHT, Team.PLAYER, uid=3)
+        enemy_right = Unit(900, 0, UnitType.KNIGHT, Team.PLAYER, uid=4)
+        self.game.units.extend([left, right, enemy_left, enemy_right])
+        nearest = self.ai._nearest_enemies([left, right])
+        self.assertEqual([u.uid for u in nearest], [3, 4])
+
+    def test_enemy_grid_range_query(self):
+        """Test the spatial hash returns nearby enemies and skips distant ones."""
+        for i in range(40):
+            self.game.units.append(Unit(i * 100, 2000, UnitType.KNIGHT, Team.PLAYER, uid=i))
+        near = Unit(500, 500, UnitType.KNIGHT, Team.PLAYER, uid=99)
+        self.game.units.append(near)
+        candidates = self.ai._enemy_indices_near(520, 500, 100)
+        self.assertIsNotNone(self.ai._enemy_grid)
+        self.assertEqual([self.ai.enemy_units[i] for i in candidates], [near])
+
+    def test_find_building_at(self):
+        """Test building lookup by target position."""
+        house = Building(1000, 1000, BuildingType.HOUSE, Team.PLAYER)
+        self.game.buildings.append(house)
+        self.assertIs(self.ai._find_building_at((1050, 1000)), house)
+        self.assertIsNone(self.ai._find_building_at((1200, 1000)))
+
+    def test_assign_workers_fills_farm_first(self):
+        """Test idle peasants fill open farm slots before other buildings."""
+        house = Building(0, 0, BuildingType.HOUSE, Team.ENEMY, uid=1)
+        farm = Building(500, 500, BuildingType.FARM, Team.ENEMY, uid=2)
+        worker = Unit(500, 500, UnitType.PEASANT, Team.ENEMY, uid=3)
+        worker.assigned_building = farm
+        worker.is_working = True
+        idle = [Unit(0, 0, UnitType.PEASANT, Team.ENEMY, uid=10 + i) for i in range(3)]
+        self.game.buildings.extend([house, farm])
+        self.game.units.extend([worker] + idle)
+        self.ai._assign_workers()
+        # Farm holds 3 and already has 1 working, so the first two go there
+        self.assertIs(idle[0].assigned_building, farm)
+        self.assertIs(idle[1].assigned_building, farm)
+        self.assertIs(idle[2].assigned_building, house)
+
+    def test_threat_wakes_ai_before_next_think(self):
+        """Test enemies reaching the castle trigger defense without waiting for a think."""
+        castle = Building(1000, 1000, BuildingType.CASTLE, Team.ENEMY)
+        self.game.buildings.append(castle)
+        self.ai.update(0.01)
+        self.assertEqual(self.ai.state, 'building')
+        self.game.units.extend([
+            Unit(1100, 1000, UnitType.KNIGHT, Team.PLAYER),
+            Unit(1000, 1100, UnitType.KNIGHT, Team.PLAYER),
+        ])
+        self.ai.update(0.01)
+        self.assertEqual(self.ai.state, 'defending')
+
+    def test_train_unit_spawns_around_castle(self):
+        """Test consecutive AI spawns use distinct points on the castle ring."""
+        castle = Building(1000, 1000, BuildingType.CASTLE, Team.ENEMY)
+        self.game.buildings.append(castle)
+        self.game.enemy_resources = Resources(gold=1000, food=1000, wood=1000)
+        self.ai._try_train_unit(UnitType.PEASANT)
+        self.ai._try_train_unit(UnitType.PEASANT)
+        first, second = self.ai.my_units
+        self.assertNotEqual((first.x, first.y), (second.x, second.y))
+        for unit in (first, second):
+            self.assertAlmostEqual(unit.distance_to(castle.x, castle.y), 80)
+
+    def test_rosters_refresh_after_update(self):
+        """Test rosters pick up entities added between frames."""
+        self.assertEqual(self.ai.my_units, [])
+        self.game.units.append(Unit(0, 0, UnitType.PEASANT, Team.ENEMY))
+        self.ai.update(0.0)
+        self.assertEqual(len(self.ai.my_units), 1)
+
+
+# =============================================================================
+# ASSET TESTS
+# =============================================================================
+
+class TestAssetCache(unittest.TestCase):
+    """Tests for the decoded asset disk cache format."""
+
+    def test_round_trip(self):
+        """Test cache entries survive packing and unpacking."""
+        entries = {
+            'unit_knight': ('images/knight.png', 1700000000.5, (2, 1), bytes(range(8))),
+            'terrain_grass': ('images/grass.png', 12.0, (1, 1), b'\x01\x02\x03\x04'),
+        }
+        self.assertEqual(_unpack_asset_cache(_pack_asset_cache(entries)), entries)
+
+    def test_rejects_invalid_data(self):
+        """Test foreign or truncated data is rejected."""
+        with self.assertRaises(ValueError):
+            _unpack_asset_cache(b'not a cache')
+        packed = _pack_asset_cache({'effect_blood': ('blood.png', 1.0, (1, 1), b'abcd')})
+        with self.assertRaises(ValueError):
+            _unpack_asset_cache(packed[:-2])
+
+
+class TestAssetManager(unittest.TestCase):
+    """Tests for prepared-sprite caching."""
+
+    def test_get_tinted_caches_prepared_sprite(self):
+        """Test tinted sprites are built once and plain ones are the scaled asset."""
+        assets = AssetManager()
+        base = MagicMock()
+        base.get_size.return_value = (40, 40)
+        assets.images['unit_knight'] = base
+        tinted = assets.get_tinted('unit_knight', (40, 40), RED_TINT)
+        self.assertIs(assets.get_tinted('unit_knight', (40, 40), RED_TINT), tinted)
+        self.assertEqual(base.copy.call_count, 1)
+        self.assertIs(assets.get_tinted('unit_knight', (40, 40)), base)
+
+
+class TestModManager(unittest.TestCase):
+    """Tests for mod override merging."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.mods = ModManager(mods_directory=self.tmpdir.name)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_defaults_without_mods(self):
+        """Test stats match the base tables when no mods are loaded."""
+        self.assertEqual(self.mods.get_unit_stats('knight'), UNIT_STATS['knight'])
+        self.assertEqual(self.mods.get_building_costs('house'), BUILDING_COSTS['house'])
+        self.assertEqual(self.mods.get_unit_costs('unknown'), {})
+
+    def test_finalize_merges_overrides(self):
+        """Test finalize applies overrides without touching the base tables."""
+        base_attack = UNIT_STATS['knight']['attack']
+        self.mods.unit_stat_overrides['knight'] = {'attack': base_attack + 99}
+        self.mods.finalize()
+        stats = self.mods.get_unit_stats('knight')
+        self.assertEqual(stats['attack'], base_attack + 99)
+        self.assertEqual(stats['health'], UNIT_STATS['knight']['health'])
+        self.assertEqual(UNIT_STATS['knight']['attack'], base_attack)
+
+    def test_modded_unit_uses_stat_tuple(self):
+        """Test units built with a mod manager pick up the cached stat tuple."""
+        self.mods.unit_stat_overrides['cavalry'] = {'speed': 9.0, 'health': 10}
+        self.mods.finalize()
+        unit = Unit(0, 0, UnitType.CAVALRY, Team.PLAYER, _mod_manager=self.mods)
+        self.assertEqual((unit.speed, unit.health, unit.max_health), (9.0, 10, 10))
+        self.assertEqual(unit.attack, UNIT_STATS['cavalry']['attack'])
+        self.assertEqual(self.mods.get_unit_stat_tuple('unknown'), (100, 10, 5, 2.0, 30, 1.0))
+
+    def test_modded_building_generation(self):
+        """Test buildings read generation overrides through the cached tuples."""
+        self.mods.building_generation_overrides['farm'] = {'food': 100, 'max_workers': 2}
+        self.mods.finalize()
+        farm = Building(0, 0, BuildingType.FARM, Team.PLAYER, _mod_manager=self.mods)
+        farm.worker_count = 1
+        self.assertEqual(farm.get_max_workers(), 2)
+        self.assertEqual(farm.get_resource_amounts(), (0, 50, 2))
+        self.assertEqual(self.mods.get_building_generation_tuple('unknown'), (0, 0, 0, 1))
+
+    def test_discover_mods(self):
+        """Test only folders containing a mod.json are discovered."""
+        os.makedirs(os.path.join(self.tmpdir.name, 'real_mod'))
+        with open(os.path.join(self.tmpdir.name, 'real_mod', 'mod.json'), 'w') as f:
+            f.write('{}')
+        os.makedirs(os.path.join(self.tmpdir.name, 'not_a_mod'))
+        with open(os.path.join(self.tmpdir.name, 'stray.json'), 'w') as f:
+            f.write('{}')
+        self.assertEqual(self.mods.discover_mods(), ['real_mod'])
+
+
 # =============================================================================
 # MAIN
 # =============================================================================